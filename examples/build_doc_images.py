@@ -28,7 +28,7 @@ def make_curve(path: Path, ease: ie.Ease) -> None:
     """Create the curve for an ease."""
     # Create the curve data.
     base = np.arange(129, dtype=float) / 128
-    eased = ease(base.copy())
+    eased = ease(base)
     
     # Plot the curve.
     plt.style.use('dark_background')
@@ -46,9 +46,8 @@ def make_example(path: Path, size: Sequence[int], ease: ie.Ease) -> None:
     X, Y, Z = 2, 1, 0
     a = np.arange(size[X], dtype=float) / 1279
     a = np.tile(a[np.newaxis, np.newaxis, ...], (1, size[Y], 1))
-    a[:, size[Y] // 2:, ...] = ease(a[:, size[Y] // 2:, ...])
-    a[a > 1.0] = 1.0
-    a[a < 0.0] = 0.0
+    half = a[:, size[Y] // 2:, ...]
+    ease(half, out=half, clip=True)
     
     height = int(size[Y] * 1.1 // 12)
     origin = (size[X] // 10, height // 20)
@@ -3,12 +3,106 @@ __init__
 ~~~~~~~~
 
 Initialization for the imgeaser module.
+
+Only the eases themselves are imported with the package. The registry
+of eases and the rest of the public API are loaded the first time
+they are used, so short-lived processes that only need an ease or two
+don't pay for the rest.
 """
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable
+
 from imgeaser import imgeaser
 from imgeaser.imgeaser import *
-from imgeaser.utility import get_prefixed_functions
+from imgeaser.parallel import get_workers, set_workers
+from imgeaser.utility import get_backend, get_prefixed_functions, set_backend
+
+
+# The lazy names are declared for type checkers, which don't see what
+# __getattr__ loads.
+if TYPE_CHECKING:
+    import numpy as np
+
+    from imgeaser import scalar
+    from imgeaser.aio import AsyncEaser, ease_async
+    from imgeaser.chain import compose
+    from imgeaser.ondisk import ease_file
+    from imgeaser.profiling import Profile, add_hook, remove_hook
+    from imgeaser.stream import ease_stream
+    from imgeaser.tween import TweenStore
+
+    eases: dict[str, Callable[..., np.ndarray]]
+
+
+# The names of the eases in `imgeaser.eases`, without the `ease_`
+# prefix, in alphabetical order. This must list every ease in
+# :mod:`imgeaser.imgeaser`.
+EASE_NAMES = (
+    'in_back',
+    'in_circ',
+    'in_cubic',
+    'in_elastic',
+    'in_out_back',
+    'in_out_circ',
+    'in_out_cos',
+    'in_out_cubic',
+    'in_out_elastic',
+    'in_out_quad',
+    'in_out_quint',
+    'in_out_sin',
+    'in_quad',
+    'in_quint',
+    'in_sin',
+    'mid_bump_linear',
+    'mid_bump_sin',
+    'out_bounce',
+    'out_circ',
+    'out_cubic',
+    'out_elastic',
+    'out_quad',
+    'out_quint',
+    'out_sin',
+)
+
+# The rest of the public API, by the module that defines it.
+_LAZY = {
+    'AsyncEaser': 'imgeaser.aio',
+    'ease_async': 'imgeaser.aio',
+    'compose': 'imgeaser.chain',
+    'ease_file': 'imgeaser.ondisk',
+    'ease_stream': 'imgeaser.stream',
+    'Profile': 'imgeaser.profiling',
+    'TweenStore': 'imgeaser.tween',
+    'add_hook': 'imgeaser.profiling',
+    'remove_hook': 'imgeaser.profiling',
+}
+
+# The submodules that are part of the public API.
+_SUBMODULES = ('scalar',)
+
+
+def __getattr__(name: str) -> Any:
+    """Load the registry of eases and the rest of the public API the
+    first time they are used.
+    """
+    value: Any
+    if name == 'eases':
+        # Create a dictionary to allow easier discovery and validation
+        # of the eases available in the module.
+        value = {
+            name: getattr(imgeaser, f'ease_{name}')
+            for name in EASE_NAMES
+        }
+    elif name in _LAZY:
+        value = getattr(import_module(_LAZY[name]), name)
+    elif name in _SUBMODULES:
+        value = import_module(f'{__name__}.{name}')
+    else:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
 
 
-# Create a dictionary to allow easier discovery and validation of
-# the eases available in the module.
-eases = get_prefixed_functions('ease_', imgeaser)
+def __dir__() -> list[str]:
+    return sorted({*globals(), 'eases', *_LAZY, *_SUBMODULES})
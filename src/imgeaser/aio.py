@@ -0,0 +1,271 @@
+"""
+aio
+~~~
+
+Easing from :mod:`asyncio` code.
+
+An ease on a large frame can take tens of milliseconds, which blocks
+the event loop for as long. :class:`AsyncEaser` runs the eases in a
+pool of threads of its own and awaits them, so the loop keeps serving
+other work. :mod:`numpy` releases the GIL while its ufuncs run, so the
+eases really do run beside the loop.
+
+Each easer limits the bytes of the data and results it has in flight.
+Calls beyond the limit wait in order until earlier calls finish, so a
+burst of requests can't queue more frames than the process can hold.
+A call that is cancelled while it waits, or before its thread starts
+it, drops its data and never allocates its result. A call cancelled
+while it's running can't be stopped, but its result is dropped when it
+finishes.
+"""
+import asyncio
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, Union, cast
+
+import numpy as np
+
+from imgeaser.utility import _out_dtype
+
+
+# The default limit on the bytes in flight in an easer.
+MAX_BYTES = 2 ** 28
+
+# The easer used by :func:`ease_async`.
+_default: Optional['AsyncEaser'] = None
+_default_lock = threading.Lock()
+
+
+# Easers.
+class AsyncEaser:
+    """Await eases run in a bounded pool of threads.
+
+    The easer can be used from any number of event loops, and it
+    should be closed when it is no longer needed, either with
+    :meth:`AsyncEaser.close` or by using it as a context manager.
+
+    :param workers: (Optional.) The number of threads. If it isn't
+        given, all of the cores of the system are used.
+    :param max_bytes: (Optional.) The most bytes of data and results
+        to have in flight. A call bigger than the limit runs alone.
+    :param executor: (Optional.) An executor to run the eases in
+        instead of the easer's own threads. It isn't shut down when the
+        easer is closed.
+    :return: None.
+    :rtype: NoneType
+    """
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_bytes: int = MAX_BYTES,
+        executor: Optional[Executor] = None
+    ) -> None:
+        if max_bytes < 1:
+            msg = 'The limit on bytes in flight must be at least one.'
+            raise ValueError(msg)
+        self.max_bytes = max_bytes
+        self.workers = workers or os.cpu_count() or 1
+        self._owned = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                self.workers,
+                thread_name_prefix='imgeaser-async'
+            )
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: deque[tuple] = deque()
+        self._eases: Optional[dict] = None
+
+    def __enter__(self) -> 'AsyncEaser':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'AsyncEaser':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    # Properties.
+    @property
+    def eases(self) -> dict:
+        """Awaitable versions of the eases in `imgeaser.eases`, by the
+        same names.
+        """
+        if self._eases is None:
+            from imgeaser import eases
+            self._eases = {
+                name: partial(self.ease, fn)
+                for name, fn in eases.items()
+            }
+        return self._eases
+
+    @property
+    def in_flight(self) -> int:
+        """The bytes of data and results in flight."""
+        return self._in_flight
+
+    # Public methods.
+    def close(self) -> None:
+        """Shut down the easer's threads, cancelling the calls that
+        haven't started.
+        """
+        if self._owned:
+            self._executor.shutdown(cancel_futures=True)
+
+    async def ease(
+        self,
+        ease: Union[Callable, str],
+        a: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        **kwargs
+    ) -> np.ndarray:
+        """Ease an array in a thread of the easer.
+
+        The result is identical to calling the ease directly.
+
+        :param ease: The ease, or its name in `imgeaser.eases`.
+        :param a: The data to ease.
+        :param out: (Optional.) The array to write the result into.
+        :param kwargs: (Optional.) Keyword arguments for the ease.
+        :return: The eased data as a :class:`numpy.ndarray`.
+        :rtype: numpy.ndarray
+        """
+        if isinstance(ease, str):
+            from imgeaser import eases
+            if ease not in eases:
+                msg = f'{ease!r} is not in imgeaser.eases.'
+                raise ValueError(msg)
+            ease = eases[ease]
+        a = np.asarray(a)
+        if out is None:
+            nbytes = a.nbytes + a.size * _out_dtype(a).itemsize
+        else:
+            nbytes = a.nbytes + out.nbytes
+
+        # Only the job holds the data, so the data can be dropped even
+        # while the traceback of a cancelled call is kept.
+        job = _Job(ease, a, out, kwargs)
+        del a, out, kwargs
+        try:
+            await self._acquire(nbytes)
+            try:
+                future = self._executor.submit(job)
+            except BaseException:
+                self._release(nbytes)
+                raise
+            future.add_done_callback(lambda _: self._release(nbytes))
+
+            # A job only returns None if it runs after its call was
+            # cancelled, when nothing is awaiting it.
+            return cast(np.ndarray, await asyncio.wrap_future(future))
+        except BaseException:
+            job.args = None
+            raise
+
+    # Private methods.
+    async def _acquire(self, nbytes: int) -> None:
+        """Wait until the bytes fit within the limit, then count them
+        as in flight.
+        """
+        with self._lock:
+            if not self._waiters and self._fits(nbytes):
+                self._in_flight += nbytes
+                return
+            loop = asyncio.get_running_loop()
+            entry = (nbytes, loop, loop.create_future())
+            self._waiters.append(entry)
+        try:
+            await entry[2]
+        except asyncio.CancelledError:
+            # If the call was let go before it was cancelled, its bytes
+            # were already counted. Otherwise, removing it may let the
+            # calls behind it go.
+            with self._lock:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    nbytes = 0
+            self._release(nbytes)
+            raise
+
+    def _fits(self, nbytes: int) -> bool:
+        """Do the bytes fit within the limit?"""
+        return (
+            self._in_flight == 0
+            or self._in_flight + nbytes <= self.max_bytes
+        )
+
+    def _release(self, nbytes: int) -> None:
+        """Stop counting bytes as in flight, and let the calls waiting
+        at the front of the line go if they fit.
+        """
+        with self._lock:
+            self._in_flight -= nbytes
+            while self._waiters and self._fits(self._waiters[0][0]):
+                waiting, loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_wake, waiter)
+                except RuntimeError:
+                    # The loop of the waiting call is closed.
+                    continue
+                self._in_flight += waiting
+
+
+class _Job:
+    """A call to an ease that drops its data if it's cancelled before
+    it runs.
+    """
+    __slots__ = ('args',)
+
+    def __init__(
+        self,
+        ease: Callable,
+        a: np.ndarray,
+        out: Optional[np.ndarray],
+        kwargs: dict
+    ) -> None:
+        self.args: Optional[tuple] = (ease, a, out, kwargs)
+
+    def __call__(self) -> Optional[np.ndarray]:
+        args, self.args = self.args, None
+        if args is None:
+            return None
+        ease, a, out, kwargs = args
+        return ease(a, out=out, **kwargs)
+
+
+# Easing functions.
+async def ease_async(
+    ease: Union[Callable, str],
+    a: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    **kwargs
+) -> np.ndarray:
+    """Ease an array in a thread of a shared :class:`AsyncEaser` with
+    the default settings.
+
+    :param ease: The ease, or its name in `imgeaser.eases`.
+    :param a: The data to ease.
+    :param out: (Optional.) The array to write the result into.
+    :param kwargs: (Optional.) Keyword arguments for the ease.
+    :return: The eased data as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = AsyncEaser()
+    return await _default.ease(ease, a, out, **kwargs)
+
+
+# Utility functions.
+def _wake(waiter: asyncio.Future) -> None:
+    """Let a waiting call go, unless it was cancelled."""
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,89 @@
+"""
+approx
+~~~~~~
+
+Approximate math for the eases that use transcendental functions.
+
+The sine, circular, and elastic eases spend most of their time in
+:func:`numpy.sin`, :func:`numpy.cos`, :func:`numpy.sqrt`, and powers of
+two. In float64 those are evaluated one value at a time, while in
+float32 :mod:`numpy` evaluates them with vectorized loops that are
+several times faster. Output with 8 or 16 bits per value doesn't need
+float64 accuracy, so when the caller accepts some error with the
+`accuracy` keyword argument, these eases scale float64 data in float64,
+then perform the math in float32 a block at a time.
+
+Polynomial approximations of the same functions were measured too,
+but each term of a polynomial is another pass over the data, so they
+were slower than the vectorized float32 loops.
+
+The largest error of each ease is given in :data:`ERRORS`. It is the
+largest difference from the float64 result over data within zero to
+one, measured densely over the whole range and near the ends of each
+piece of the ease, then rounded up. It is in the units of the scaled
+data, so for data that was scaled it is a fraction of the range of the
+data. The largest errors are where the float32 value of the data lands
+on the other side of a discontinuity or on the steep end of a circular
+curve.
+"""
+from typing import Callable, Optional
+
+import numpy as np
+
+
+# The type the approximate math is performed in.
+APPROX_DTYPE = np.dtype(np.float32)
+
+# The largest error of the approximate math of each ease, by the name
+# of the ease in `imgeaser.eases`.
+ERRORS = {
+    'in_circ': 2.5e-4,
+    'in_elastic': 2e-6,
+    'in_out_circ': 2e-4,
+    'in_out_cos': 2e-7,
+    'in_out_elastic': 1e-4,
+    'in_out_sin': 2e-7,
+    'in_sin': 2e-7,
+    'mid_bump_sin': 3e-7,
+    'out_circ': 2.5e-4,
+    'out_elastic': 5e-4,
+    'out_sin': 2e-7,
+}
+
+
+# Lookup functions.
+def get_error(fn: Callable) -> Optional[float]:
+    """Get the largest error of the approximate math of an ease.
+
+    :param fn: The ease, decorated or not.
+    :return: The error as a :class:`float` or `None` if the ease has no
+        approximate math.
+    :rtype: float
+    """
+    fn = getattr(fn, '__wrapped__', fn)
+    if getattr(fn, '__module__', None) != 'imgeaser.imgeaser':
+        return None
+    return ERRORS.get(fn.__name__.removeprefix('ease_'))
+
+
+def get_approx_dtype(
+    fn: Callable,
+    dtype: np.dtype,
+    accuracy: Optional[float]
+) -> Optional[np.dtype]:
+    """Get the type to perform an ease in to meet an accuracy.
+
+    :param fn: The ease, decorated or not.
+    :param dtype: The type of the scaled data.
+    :param accuracy: The largest error the caller accepts, or `None`
+        if the ease must be exact.
+    :return: The type as a :class:`numpy.dtype` or `None` if the ease
+        should be performed in the type of the data.
+    :rtype: numpy.dtype
+    """
+    if accuracy is None or dtype.itemsize <= APPROX_DTYPE.itemsize:
+        return None
+    error = get_error(fn)
+    if error is None or error > accuracy:
+        return None
+    return APPROX_DTYPE
@@ -0,0 +1,595 @@
+"""
+bench
+~~~~~
+
+Benchmarks for the eases.
+
+Run it with `python -m imgeaser.bench`. Every ease in `imgeaser.eases`
+is timed over a matrix of array sizes, types, already normalized or
+needing scaling, contiguous or strided views, and backends. The
+throughput of each case is reported in millions of values per second
+along with the peak memory allocated while easing. The results can be
+saved as JSON and compared against a previous run to flag regressions.
+
+With `--scalar`, the eases are instead timed on single values, and the
+time of each call is reported for the eases in :mod:`imgeaser.scalar`
+and for the array eases.
+
+With `--unique`, the eases are instead timed on data with the given
+number of distinct values, easing each value as the `numpy` backend
+and easing through the distinct values, as in :mod:`imgeaser.unique`,
+as the `unique` backend.
+"""
+import json
+import re
+import subprocess
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from itertools import product
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+
+# The sizes of the arrays eased by default. Larger sizes, up to
+# LARGEST_SIZE, can be given on the command line.
+SIZES = (10 ** 2, 10 ** 4, 10 ** 6)
+LARGEST_SIZE = 10 ** 8
+
+# The types of the arrays eased by default.
+DTYPES = ('float64', 'float32', 'uint8', 'uint16')
+
+# The fields that identify a case when comparing runs.
+KEYS = ('ease', 'size', 'dtype', 'normalized', 'strided', 'backend')
+
+# The fields that identify the data eased in a case.
+DATA_KEYS = ('size', 'dtype', 'normalized', 'strided')
+
+# The fraction of throughput a case can lose before it's a regression.
+THRESHOLD = .1
+
+# The number of single values eased in each timed run with `--scalar`.
+SCALAR_CALLS = 1000
+
+# The types of the arrays eased by default with `--unique`.
+UNIQUE_DTYPES = ('float64', 'float32')
+
+
+# Data functions.
+def make_data(
+    size: int,
+    dtype: str,
+    normalized: bool = False,
+    strided: bool = False,
+    seed: int = 0,
+    distinct: Optional[int] = None
+) -> np.ndarray:
+    """Create an array of data to ease.
+
+    :param size: The number of values in the array.
+    :param dtype: The type of the array.
+    :param normalized: (Optional.) Whether the data is within zero to
+        one. It's ignored for integer types.
+    :param strided: (Optional.) Whether the array is a view of every
+        other value of a larger array.
+    :param seed: (Optional.) The seed for the random data.
+    :param distinct: (Optional.) The number of distinct values to pick
+        the values of the array from. If it isn't given, each value is
+        random.
+    :return: The data as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    dt = np.dtype(dtype)
+    length = size * 2 if strided else size
+    rng = np.random.default_rng(seed)
+    if distinct is not None:
+        values = make_data(distinct, dtype, normalized, seed=seed)
+        a = values[rng.integers(distinct, size=length)]
+        return a[::2] if strided else a
+    if dt.kind in 'iu':
+        info = np.iinfo(dt)
+        a = rng.integers(
+            info.min,
+            info.max,
+            length,
+            dtype=dt,
+            endpoint=True
+        )
+    else:
+        a = rng.random(length, dtype=np.float64)
+        if not normalized:
+            a = a * 510 - 255
+        a = a.astype(dt)
+    return a[::2] if strided else a
+
+
+def get_cases(
+    names: Sequence[str],
+    sizes: Sequence[int] = SIZES,
+    dtypes: Sequence[str] = DTYPES,
+    backends: Sequence[str] = ('numpy',)
+) -> list[dict]:
+    """Get the cases to benchmark.
+
+    The cases are ordered so that the cases sharing the same data are
+    together. Integer data can't be normalized, so those cases are
+    skipped for integer types.
+
+    :param names: The names of the eases in `imgeaser.eases`.
+    :param sizes: (Optional.) The sizes of the arrays.
+    :param dtypes: (Optional.) The types of the arrays.
+    :param backends: (Optional.) The backends.
+    :return: The cases as a :class:`list` of :class:`dict`.
+    :rtype: list
+    """
+    cases = []
+    for size, dtype, normalized, strided, name, backend in product(
+        sizes, dtypes, (True, False), (False, True), names, backends
+    ):
+        if normalized and np.dtype(dtype).kind in 'iu':
+            continue
+        cases.append({
+            'ease': name,
+            'size': size,
+            'dtype': dtype,
+            'normalized': normalized,
+            'strided': strided,
+            'backend': backend,
+        })
+    return cases
+
+
+# Timing functions.
+def time_ease(
+    ease: Callable,
+    a: np.ndarray,
+    backend: str = 'numpy',
+    repeat: int = 3,
+    **kwargs
+) -> dict:
+    """Time an ease over an array.
+
+    The ease is run once to warm up any caches or compiled kernels,
+    then once with :mod:`tracemalloc` tracing to find the peak memory
+    it allocates beyond its output, then timed without tracing. The
+    best of the timed runs is used, since slower runs are slowed by
+    other work on the system rather than by the ease.
+
+    :param ease: The ease to time.
+    :param a: The data to ease.
+    :param backend: (Optional.) The backend to perform the ease.
+    :param repeat: (Optional.) The number of timed runs.
+    :param kwargs: (Optional.) Other keyword arguments for the ease.
+    :return: The time in seconds, the throughput in millions of values
+        per second, and the peak memory in bytes as a :class:`dict`.
+    :rtype: dict
+    """
+    out = ease(a, backend=backend, **kwargs)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        ease(a, out=out, backend=backend, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        ease(a, out=out, backend=backend, **kwargs)
+        best = min(best, perf_counter() - start)
+    return {
+        'seconds': best,
+        'mpx_s': a.size / best / 1e6 if best else float('inf'),
+        'peak_bytes': peak,
+    }
+
+
+def run(
+    names: Optional[Sequence[str]] = None,
+    sizes: Sequence[int] = SIZES,
+    dtypes: Sequence[str] = DTYPES,
+    backends: Sequence[str] = ('numpy',),
+    repeat: int = 3,
+    report: Optional[Callable] = None
+) -> list[dict]:
+    """Run the benchmarks.
+
+    :param names: (Optional.) The names of the eases in `imgeaser.eases`.
+        If it isn't given, every ease is timed.
+    :param sizes: (Optional.) The sizes of the arrays.
+    :param dtypes: (Optional.) The types of the arrays.
+    :param backends: (Optional.) The backends.
+    :param repeat: (Optional.) The number of timed runs of each case.
+    :param report: (Optional.) A function called with each result as
+        it is finished.
+    :return: The results as a :class:`list` of :class:`dict`.
+    :rtype: list
+    """
+    from imgeaser import eases
+
+    if names is None:
+        names = list(eases)
+    results = []
+    data: dict[tuple, np.ndarray] = {}
+    for case in get_cases(names, sizes, dtypes, backends):
+        # The data is reused by the following cases that share it.
+        key = tuple(case[k] for k in DATA_KEYS)
+        if key not in data:
+            data.clear()
+            data[key] = make_data(*key)
+        result = dict(case)
+        result.update(time_ease(
+            eases[case['ease']],
+            data[key],
+            case['backend'],
+            repeat
+        ))
+        results.append(result)
+        if report:
+            report(result)
+    return results
+
+
+def time_calls(
+    fn: Callable,
+    values: Sequence[float],
+    repeat: int = 3
+) -> dict:
+    """Time calling an ease on single values.
+
+    :param fn: The ease to time.
+    :param values: The values to ease, one call each.
+    :param repeat: (Optional.) The number of timed runs.
+    :return: The time of each call in seconds, the millions of calls
+        per second, and the peak memory in bytes, which isn't measured
+        and is always zero, as a :class:`dict`.
+    :rtype: dict
+    """
+    fn(values[0])
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        for t in values:
+            fn(t)
+        best = min(best, perf_counter() - start)
+    seconds = best / len(values)
+    return {
+        'seconds': seconds,
+        'mpx_s': 1 / seconds / 1e6 if seconds else float('inf'),
+        'peak_bytes': 0,
+    }
+
+
+def run_scalar(
+    names: Optional[Sequence[str]] = None,
+    calls: int = SCALAR_CALLS,
+    repeat: int = 3,
+    report: Optional[Callable] = None
+) -> list[dict]:
+    """Run the benchmarks of the eases on single values.
+
+    Each ease is timed in :mod:`imgeaser.scalar`, as the `math`
+    backend, and as the array ease called on a :class:`float`, as the
+    `numpy` backend.
+
+    :param names: (Optional.) The names of the eases in `imgeaser.eases`.
+        If it isn't given, every ease is timed.
+    :param calls: (Optional.) The number of values eased in each run.
+    :param repeat: (Optional.) The number of timed runs of each case.
+    :param report: (Optional.) A function called with each result as
+        it is finished.
+    :return: The results as a :class:`list` of :class:`dict`.
+    :rtype: list
+    """
+    from imgeaser import eases, scalar
+
+    if names is None:
+        names = list(eases)
+    values = np.random.default_rng(0).random(calls).tolist()
+    results = []
+    for name in names:
+        for backend, fn in (('math', scalar.eases), ('numpy', eases)):
+            result = {
+                'ease': name,
+                'size': 1,
+                'dtype': 'float',
+                'normalized': True,
+                'strided': False,
+                'backend': backend,
+            }
+            result.update(time_calls(fn[name], values, repeat))
+            results.append(result)
+            if report:
+                report(result)
+    return results
+
+
+def run_unique(
+    names: Optional[Sequence[str]] = None,
+    sizes: Sequence[int] = SIZES,
+    dtypes: Sequence[str] = UNIQUE_DTYPES,
+    distinct: int = 256,
+    repeat: int = 3,
+    report: Optional[Callable] = None
+) -> list[dict]:
+    """Run the benchmarks of easing data through its distinct values.
+
+    Each ease is timed on data with only the given number of distinct
+    values, easing each value, as the `numpy` backend, and easing each
+    distinct value once, as the `unique` backend. The data isn't
+    normalized and the eases run in one thread.
+
+    :param names: (Optional.) The names of the eases in `imgeaser.eases`.
+        If it isn't given, every ease is timed.
+    :param sizes: (Optional.) The sizes of the arrays.
+    :param dtypes: (Optional.) The types of the arrays.
+    :param distinct: (Optional.) The number of distinct values in the
+        data.
+    :param repeat: (Optional.) The number of timed runs of each case.
+    :param report: (Optional.) A function called with each result as
+        it is finished.
+    :return: The results as a :class:`list` of :class:`dict`.
+    :rtype: list
+    """
+    from imgeaser import eases
+
+    if names is None:
+        names = list(eases)
+    results = []
+    for size, dtype in product(sizes, dtypes):
+        a = make_data(size, dtype, distinct=distinct)
+        for name, (backend, unique) in product(
+            names, (('numpy', False), ('unique', True))
+        ):
+            result = {
+                'ease': name,
+                'size': size,
+                'dtype': dtype,
+                'normalized': False,
+                'strided': False,
+                'backend': backend,
+            }
+            result.update(time_ease(
+                eases[name],
+                a,
+                repeat=repeat,
+                workers=1,
+                unique=unique
+            ))
+            results.append(result)
+            if report:
+                report(result)
+    return results
+
+
+def time_import(repeat: int = 5) -> dict:
+    """Time importing :mod:`imgeaser` in a new interpreter.
+
+    The time is read from the `-X importtime` report of the import, so
+    it doesn't include starting the interpreter. The best of the runs
+    is used.
+
+    :param repeat: (Optional.) The number of imports to time.
+    :return: The result as a :class:`dict` with the same fields as the
+        results of the eases. The ease is `import` and the throughput
+        is the number of imports per second.
+    :rtype: dict
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import imgeaser'],
+            capture_output=True,
+            check=True,
+            text=True
+        )
+        match = re.search(r'\|\s*(\d+) \| imgeaser$', proc.stderr, re.M)
+        if match is None:
+            msg = 'The import time of imgeaser was not reported.'
+            raise RuntimeError(msg)
+        best = min(best, int(match.group(1)) / 1e6)
+    result: dict[str, object] = {key: None for key in KEYS}
+    result.update({
+        'ease': 'import',
+        'seconds': best,
+        'mpx_s': 1 / best,
+        'peak_bytes': 0,
+    })
+    return result
+
+
+# Comparison functions.
+def compare(
+    results: Sequence[dict],
+    previous: Sequence[dict],
+    threshold: float = THRESHOLD
+) -> list[dict]:
+    """Find the cases that got slower since a previous run.
+
+    :param results: The results of the current run.
+    :param previous: The results of the previous run.
+    :param threshold: (Optional.) The fraction of throughput a case can
+        lose before it's a regression.
+    :return: The regressions as a :class:`list` of :class:`dict`. Each
+        is the current result with the throughput of the previous run
+        and the fraction that was lost.
+    :rtype: list
+    """
+    before = {tuple(r[k] for k in KEYS): r for r in previous}
+    regressions = []
+    for result in results:
+        old = before.get(tuple(result[k] for k in KEYS))
+        if old is None or not old['mpx_s']:
+            continue
+        loss = 1 - result['mpx_s'] / old['mpx_s']
+        if loss > threshold:
+            regression = dict(result)
+            regression['previous_mpx_s'] = old['mpx_s']
+            regression['loss'] = loss
+            regressions.append(regression)
+    return regressions
+
+
+# Output functions.
+def format_result(result: dict) -> str:
+    """Format a result as a line of a report."""
+    if result['ease'] == 'import':
+        return f'{"import":<16} {result["seconds"] * 1e3:>10.2f} ms'
+    if result['dtype'] == 'float':
+        return (
+            f'{result["ease"]:<16} {result["backend"]:<6} '
+            f'{result["seconds"] * 1e9:>10.0f} ns/call'
+        )
+    view = 'strided' if result['strided'] else 'contiguous'
+    scale = 'normalized' if result['normalized'] else 'scaled'
+    return (
+        f'{result["ease"]:<16} {result["size"]:>11,} '
+        f'{result["dtype"]:<8} {scale:<10} {view:<10} '
+        f'{result["backend"]:<6} {result["mpx_s"]:>10.2f} Mpx/s '
+        f'{result["peak_bytes"] / 2 ** 20:>10.2f} MiB'
+    )
+
+
+# Mainline.
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks from the command line.
+
+    :param argv: (Optional.) The command line arguments.
+    :return: The exit status, which is one if there were regressions.
+    :rtype: int
+    """
+    from imgeaser.jit import available
+
+    p = ArgumentParser(
+        description='Time the eases in imgeaser.',
+        prog='python -m imgeaser.bench'
+    )
+    p.add_argument(
+        'eases',
+        help='The names of the eases to time. Defaults to all of them.',
+        nargs='*'
+    )
+    p.add_argument(
+        '--sizes', '-s',
+        default=SIZES,
+        help=f'The sizes of the arrays, up to {LARGEST_SIZE:,}.',
+        nargs='+',
+        type=int
+    )
+    p.add_argument(
+        '--dtypes', '-d',
+        default=DTYPES,
+        help='The types of the arrays.',
+        nargs='+'
+    )
+    p.add_argument(
+        '--backends', '-b',
+        default=None,
+        help='The backends. Defaults to every available backend.',
+        nargs='+'
+    )
+    p.add_argument(
+        '--repeat', '-r',
+        default=3,
+        help='The number of timed runs of each case.',
+        type=int
+    )
+    p.add_argument(
+        '--scalar',
+        action='store_true',
+        help='Time the eases on single values instead of arrays.'
+    )
+    p.add_argument(
+        '--unique', '-u',
+        help=(
+            'Time the eases on data with this many distinct values, '
+            'with and without easing through them.'
+        ),
+        metavar='DISTINCT',
+        type=int
+    )
+    p.add_argument(
+        '--import-time', '-i',
+        action='store_true',
+        help='Also time importing imgeaser.'
+    )
+    p.add_argument(
+        '--output', '-o',
+        help='The path to save the results as JSON.',
+        type=Path
+    )
+    p.add_argument(
+        '--compare', '-c',
+        help='The path to the JSON results of a previous run.',
+        type=Path
+    )
+    p.add_argument(
+        '--threshold', '-t',
+        default=THRESHOLD,
+        help='The fraction of throughput lost that is a regression.',
+        type=float
+    )
+    args = p.parse_args(argv)
+
+    if any(size > LARGEST_SIZE for size in args.sizes):
+        p.error(f'Sizes can be no larger than {LARGEST_SIZE:,}.')
+    backends = args.backends
+    if backends is None:
+        backends = ['numpy', 'numba'] if available() else ['numpy']
+
+    def report(result):
+        print(format_result(result), flush=True)
+
+    results = []
+    if args.import_time:
+        results.append(time_import())
+        report(results[-1])
+    if args.scalar:
+        results.extend(run_scalar(
+            args.eases or None,
+            repeat=args.repeat,
+            report=report
+        ))
+    elif args.unique:
+        dtypes = args.dtypes
+        if dtypes is DTYPES:
+            dtypes = UNIQUE_DTYPES
+        results.extend(run_unique(
+            args.eases or None,
+            args.sizes,
+            dtypes,
+            args.unique,
+            args.repeat,
+            report
+        ))
+    else:
+        results.extend(run(
+            args.eases or None,
+            args.sizes,
+            args.dtypes,
+            backends,
+            args.repeat,
+            report
+        ))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        previous = json.loads(args.compare.read_text())
+        regressions = compare(results, previous, args.threshold)
+        for regression in regressions:
+            print(
+                f'REGRESSION {format_result(regression)} '
+                f'({regression["loss"]:.0%} slower)'
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+chain
+~~~~~
+
+Chaining eases into a single ease.
+
+Calling one ease on the result of another scans and scales the data
+once for each ease. A chain built with :func:`compose` scales the data
+once, runs each undecorated ease in turn on the same output array, and
+unscales the result once. Integer data is eased through a single
+lookup table for the whole chain, and the compiled backend fuses the
+whole chain into one loop.
+"""
+from functools import lru_cache
+from typing import Callable, Union
+
+import numpy as np
+
+from imgeaser.utility import will_scale
+
+
+# Types.
+Ease = Union[Callable, str]
+
+
+# Chain functions.
+@lru_cache(maxsize=256)
+def compose(*eases: Ease) -> Callable:
+    """Chain eases into a single ease.
+
+    The returned ease runs each of the given eases in order on the
+    result of the one before. The data is scaled into zero to one
+    before the first ease and back into its original range after the
+    last, so each ease after the first is given the output of the one
+    before without it being scanned or scaled again. That matches
+    calling the eases in turn with `assume_normalized=True` on data
+    already within zero to one.
+
+    The returned ease accepts the same keyword arguments as any other
+    ease. Chains are cached, so composing the same eases again returns
+    the same ease and reuses its lookup tables and compiled kernels.
+
+    :param eases: The eases to chain, or their names in `imgeaser.eases`.
+    :return: The chain as an ease.
+    :rtype: Callable
+    """
+    if not eases:
+        msg = 'At least one ease must be given.'
+        raise ValueError(msg)
+    fns = tuple(_undecorated(ease) for ease in eases)
+
+    def chain(a: np.ndarray) -> np.ndarray:
+        for fn in fns:
+            a = fn(a)
+        return a
+
+    names = ', '.join(fn.__name__.removeprefix('ease_') for fn in fns)
+    chain.__name__ = f'compose({names})'
+    chain.__qualname__ = chain.__name__
+    chain.__doc__ = f'The chain of eases {names}.'
+    chain.chain = tuple(  # type: ignore[attr-defined]
+        link for fn in fns for link in getattr(fn, 'chain', (fn,))
+    )
+    return will_scale(chain)
+
+
+def _undecorated(ease: Ease) -> Callable:
+    """Get the undecorated function of an ease."""
+    if isinstance(ease, str):
+        from imgeaser import eases
+        if ease not in eases:
+            msg = f'{ease!r} is not in imgeaser.eases.'
+            raise ValueError(msg)
+        ease = eases[ease]
+    return getattr(ease, '__wrapped__', ease)
@@ -0,0 +1,29 @@
+"""
+consts
+~~~~~~
+
+The constants of the eases.
+
+The eases are written several times: for arrays in
+:mod:`imgeaser.imgeaser`, for single values in :mod:`imgeaser.scalar`,
+which are also the kernels compiled by :mod:`imgeaser.jit`, and as
+polynomials in :mod:`imgeaser.poly`. They all take their constants
+from here, so the versions can't drift apart.
+"""
+import math
+
+
+# The overshoot of the back eases, and the factor it's multiplied by
+# for each half of the back ease in and out.
+BACK = 1.70158
+BACK_IN_OUT_SCALE = 1.525
+
+# The scale of the parabolas of the bounce ease, and the divisor of the
+# points where they meet.
+BOUNCE_N = 7.5625
+BOUNCE_D = 2.75
+
+# The angular frequencies of the elastic eases, and of the elastic ease
+# in and out.
+ELASTIC_C4 = 2 * math.pi / 3
+ELASTIC_C5 = 2 * math.pi / 4.5
@@ -0,0 +1,462 @@
+"""
+families
+~~~~~~~~
+
+Eases with adjustable constants.
+
+The eases in :mod:`imgeaser.imgeaser` hard-code the constants of their
+curves, such as how far :func:`imgeaser.ease_in_back` backs up or the
+period of :func:`imgeaser.ease_in_elastic`. The factories here build
+the same kinds of eases from given constants. With the default
+constants, they return the same results as the fixed eases.
+
+Each factory caches the eases it builds by their constants, evicting
+the least recently used when the cache is full. The constants are the
+same key whether they are passed by position, by keyword, or left as
+their defaults. Since the same
+constants return the same ease, the lookup tables and compiled kernels
+built for that ease are reused too, so sweeping the constants over the
+frames of an animation doesn't rebuild them for every frame. The
+polynomial eases, including the powers that are whole numbers, are
+evaluated by :mod:`imgeaser.poly`.
+"""
+import inspect
+import math
+from functools import lru_cache, wraps
+from typing import Callable, Optional
+
+import numpy as np
+
+from imgeaser import poly
+from imgeaser.consts import BACK, BACK_IN_OUT_SCALE
+from imgeaser.meta import ODD, EaseInfo
+from imgeaser.utility import piecewise, will_scale
+
+
+# The number of eases each factory keeps in its cache.
+CACHE_SIZE = 256
+
+# The number of samples taken across zero to one, and then across each
+# neighborhood of an extreme, to find the bounds of an ease.
+BOUNDS_SAMPLES = 4097
+
+
+# Caching.
+def _cached(factory: Callable) -> Callable:
+    """Cache the eases a factory builds by their constants, binding the
+    constants to the signature of the factory first so every way of
+    passing them is the same key. The key is always a tuple, which
+    :func:`functools.lru_cache` doesn't key differently for an int and
+    an equal float.
+    """
+    @lru_cache(maxsize=CACHE_SIZE)
+    def cached(args):
+        return factory(*args)
+
+    signature = inspect.signature(factory)
+
+    @wraps(factory)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return cached(bound.args)
+
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+# Back families.
+@_cached
+def in_back(overshoot: float = BACK) -> Callable:
+    """Build an ease that backs up before easing in, like
+    :func:`imgeaser.ease_in_back`.
+
+    :param overshoot: (Optional.) How far the ease backs up. Zero
+        doesn't back up at all, making it a cubic ease.
+    :return: The ease.
+    :rtype: Callable
+    """
+    if overshoot < 0:
+        msg = f'Overshoot must not be negative, got {overshoot}.'
+        raise ValueError(msg)
+    c1 = overshoot
+    c3 = c1 + 1
+    ease = _poly_ease(poly.in_back(overshoot))
+
+    def kernel(x):
+        return c3 * x ** 3 - c1 * x ** 2
+
+    low = _back_low(c1)
+    info = EaseInfo(bounds=(low, 1.0), monotonic=not low)
+    return _build('in_back', f'overshoot={overshoot!r}', ease, kernel, info)
+
+
+@_cached
+def in_out_back(overshoot: float = BACK) -> Callable:
+    """Build an ease that backs up before easing in and overshoots
+    before easing out, like :func:`imgeaser.ease_in_out_back`.
+
+    :param overshoot: (Optional.) How far the ease backs up and
+        overshoots. As in :func:`imgeaser.ease_in_out_back`, it is
+        multiplied by 1.525 for each half of the ease.
+    :return: The ease.
+    :rtype: Callable
+    """
+    if overshoot < 0:
+        msg = f'Overshoot must not be negative, got {overshoot}.'
+        raise ValueError(msg)
+    c2 = overshoot * BACK_IN_OUT_SCALE
+    ease = _poly_ease(poly.in_out_back(overshoot))
+
+    def kernel(x):
+        if x < .5:
+            return (2 * x) ** 2 * ((c2 + 1) * 2 * x - c2) / 2
+        return ((2 * x - 2) ** 2 * ((c2 + 1) * (x * 2 - 2) + c2) + 2) / 2
+
+    low = _back_low(c2) / 2
+    info = EaseInfo(
+        bounds=(low, 1.0 - low),
+        monotonic=not low,
+        symmetry=ODD
+    )
+    return _build(
+        'in_out_back',
+        f'overshoot={overshoot!r}',
+        ease,
+        kernel,
+        info
+    )
+
+
+# Elastic families.
+@_cached
+def in_elastic(period: float = .3, amplitude: float = 1.0) -> Callable:
+    """Build an ease that bounces before easing in, like
+    :func:`imgeaser.ease_in_elastic`.
+
+    :param period: (Optional.) The length of each bounce as a fraction
+        of the range of the data.
+    :param amplitude: (Optional.) The height of the bounces. It must be
+        at least one.
+    :return: The ease.
+    :rtype: Callable
+    """
+    c, phase = _elastic(period, amplitude)
+    k = 10 * (1 + phase)
+
+    def ease_in(a):
+        t = np.multiply(a, 10, out=np.empty_like(a))
+        t -= k
+        t *= c
+        np.sin(t, out=t)
+        np.multiply(a, 10, out=a)
+        np.subtract(a, 10, out=a)
+        np.power(2, a, out=a)
+        np.multiply(a, -amplitude, out=a)
+        np.multiply(a, t, out=a)
+
+    def ease(a):
+        return piecewise(a, [
+            (lambda a: (a != 0) & (a != 1), ease_in),
+        ])
+
+    def kernel(x):
+        if x == 0 or x == 1:
+            return x
+        return -(amplitude * 2 ** (10 * x - 10)) * math.sin((x * 10 - k) * c)
+
+    info = EaseInfo(bounds=_bounds(ease), monotonic=False)
+    params = f'period={period!r}, amplitude={amplitude!r}'
+    return _build('in_elastic', params, ease, kernel, info)
+
+
+@_cached
+def out_elastic(period: float = .3, amplitude: float = 1.0) -> Callable:
+    """Build an ease that bounces after easing out, like
+    :func:`imgeaser.ease_out_elastic`.
+
+    :param period: (Optional.) The length of each bounce as a fraction
+        of the range of the data.
+    :param amplitude: (Optional.) The height of the bounces. It must be
+        at least one.
+    :return: The ease.
+    :rtype: Callable
+    """
+    c, phase = _elastic(period, amplitude)
+    k = 10 * phase
+
+    def ease_out(a):
+        t = np.multiply(a, 10, out=np.empty_like(a))
+        t -= k
+        t *= c
+        np.sin(t, out=t)
+        np.multiply(a, -10, out=a)
+        np.power(2, a, out=a)
+        np.multiply(a, amplitude, out=a)
+        np.multiply(a, t, out=a)
+        np.add(a, 1, out=a)
+
+    def ease(a):
+        return piecewise(a, [
+            (lambda a: (a != 0) & (a != 1), ease_out),
+        ])
+
+    def kernel(x):
+        if x == 0 or x == 1:
+            return x
+        return amplitude * 2 ** (-10 * x) * math.sin((x * 10 - k) * c) + 1
+
+    info = EaseInfo(bounds=_bounds(ease), monotonic=False)
+    params = f'period={period!r}, amplitude={amplitude!r}'
+    return _build('out_elastic', params, ease, kernel, info)
+
+
+@_cached
+def in_out_elastic(
+    period: float = .45,
+    amplitude: float = 1.0
+) -> Callable:
+    """Build an ease that bounces before easing in and after easing
+    out, like :func:`imgeaser.ease_in_out_elastic`.
+
+    :param period: (Optional.) The length of each bounce as a fraction
+        of half of the range of the data.
+    :param amplitude: (Optional.) The height of the bounces. It must be
+        at least one.
+    :return: The ease.
+    :rtype: Callable
+    """
+    c, phase = _elastic(period, amplitude)
+    k = 10 * (1 + phase)
+
+    def wave(a):
+        t = np.multiply(a, 20, out=np.empty_like(a))
+        t -= k
+        t *= c
+        return np.sin(t, out=t)
+
+    def ease_in(a):
+        t = wave(a)
+        np.multiply(a, 20, out=a)
+        np.subtract(a, 10, out=a)
+        np.power(2, a, out=a)
+        np.multiply(a, t, out=a)
+        np.multiply(a, -amplitude, out=a)
+        np.divide(a, 2, out=a)
+
+    def ease_out(a):
+        t = wave(a)
+        np.multiply(a, -20, out=a)
+        np.add(a, 10, out=a)
+        np.power(2, a, out=a)
+        np.multiply(a, t, out=a)
+        np.multiply(a, amplitude, out=a)
+        np.divide(a, 2, out=a)
+        np.add(a, 1, out=a)
+
+    def ease(a):
+        return piecewise(a, [
+            (lambda a: (a > 0) & (a < .5), ease_in),
+            (lambda a: (a >= .5) & (a < 1), ease_out),
+        ])
+
+    def kernel(x):
+        if x <= 0 or x >= 1:
+            return x
+        wave = math.sin((20 * x - k) * c)
+        if x < .5:
+            return -(amplitude * 2 ** (20 * x - 10) * wave) / 2
+        return (amplitude * 2 ** (-20 * x + 10) * wave) / 2 + 1
+
+    # The halves only mirror each other when the bounds start at the
+    # top of a wave, which they do when the amplitude is one.
+    info = EaseInfo(
+        bounds=_bounds(ease),
+        monotonic=False,
+        symmetry=ODD if amplitude == 1 else None
+    )
+    params = f'period={period!r}, amplitude={amplitude!r}'
+    return _build('in_out_elastic', params, ease, kernel, info)
+
+
+# Power families.
+@_cached
+def in_pow(n: float) -> Callable:
+    """Build an ease that raises the data to a power, like
+    :func:`imgeaser.ease_in_quad` for two or
+    :func:`imgeaser.ease_in_quint` for five.
+
+    :param n: The power. It must be greater than zero.
+    :return: The ease.
+    :rtype: Callable
+    """
+    _check_power(n)
+
+    def ease(a):
+        return np.power(a, n, out=a)
+
+    def kernel(x):
+        return x ** n
+
+    if float(n).is_integer():
+        ease = _poly_ease(poly.in_pow(int(n)))
+    return _build('in_pow', f'n={n!r}', ease, kernel, EaseInfo())
+
+
+@_cached
+def out_pow(n: float) -> Callable:
+    """Build an ease that raises the distance from one to a power, like
+    :func:`imgeaser.ease_out_quad` for two or
+    :func:`imgeaser.ease_out_quint` for five.
+
+    :param n: The power. It must be greater than zero.
+    :return: The ease.
+    :rtype: Callable
+    """
+    _check_power(n)
+
+    def ease(a):
+        np.subtract(1, a, out=a)
+        np.power(a, n, out=a)
+        return np.subtract(1, a, out=a)
+
+    def kernel(x):
+        return 1 - (1 - x) ** n
+
+    if float(n).is_integer():
+        ease = _poly_ease(poly.out_pow(int(n)))
+    return _build('out_pow', f'n={n!r}', ease, kernel, EaseInfo())
+
+
+@_cached
+def in_out_pow(n: float) -> Callable:
+    """Build an ease that eases in then out with a power, like
+    :func:`imgeaser.ease_in_out_quad` for two or
+    :func:`imgeaser.ease_in_out_quint` for five.
+
+    :param n: The power. It must be greater than zero.
+    :return: The ease.
+    :rtype: Callable
+    """
+    _check_power(n)
+    c = 2 ** (n - 1)
+
+    def ease_in(a):
+        np.power(a, n, out=a)
+        np.multiply(a, c, out=a)
+
+    def ease_out(a):
+        np.multiply(a, -2, out=a)
+        np.add(a, 2, out=a)
+        np.power(a, n, out=a)
+        np.divide(a, 2, out=a)
+        np.subtract(1, a, out=a)
+
+    def ease(a):
+        return piecewise(a, [
+            (lambda a: a < .5, ease_in),
+            (lambda a: a >= .5, ease_out),
+        ])
+
+    def kernel(x):
+        if x < .5:
+            return c * x ** n
+        return 1 - (-2 * x + 2) ** n / 2
+
+    if float(n).is_integer():
+        ease = _poly_ease(poly.in_out_pow(int(n)))
+    info = EaseInfo(symmetry=ODD)
+    return _build('in_out_pow', f'n={n!r}', ease, kernel, info)
+
+
+# Utility functions.
+def _back_low(c: float) -> float:
+    """Find the lowest value of the back curve with the given constant
+    within zero to one, rounded down.
+    """
+    x = 2 * c / (3 * (c + 1))
+    low = (c + 1) * x ** 3 - c * x ** 2
+    return math.floor(low * 1e6) / 1e6
+
+
+def _bounds(ease: Callable) -> tuple[float, float]:
+    """Find the lowest and highest values an undecorated ease returns
+    within zero to one, rounded outward. The ease is sampled, then
+    sampled more finely around each extreme it finds.
+    """
+    x = np.linspace(0.0, 1.0, BOUNDS_SAMPLES)
+    y = ease(x.copy())
+    ends = []
+    for sign in (1, -1):
+        near_x, near_y = x, y
+        for _ in range(2):
+            i = int(np.argmin(sign * near_y))
+            left = near_x[max(i - 1, 0)]
+            right = near_x[min(i + 1, near_x.size - 1)]
+            near_x = np.linspace(left, right, BOUNDS_SAMPLES)
+            near_y = ease(near_x.copy())
+        ends.append(float(np.min(sign * near_y)) * sign)
+    low = min(ends[0], float(y.min()))
+    high = max(ends[1], float(y.max()))
+    return math.floor(low * 1e6) / 1e6, math.ceil(high * 1e6) / 1e6
+
+
+def _build(
+    name: str,
+    params: str,
+    ease: Callable,
+    kernel: Callable,
+    info: Optional[EaseInfo] = None
+) -> Callable:
+    """Name a built ease, attach its compiled kernel and description,
+    and decorate it.
+    """
+    ease.__name__ = f'ease_{name}({params})'
+    ease.__qualname__ = ease.__name__
+    ease.__doc__ = f'The ease {name} with {params}.'
+    ease.kernel = kernel  # type: ignore[attr-defined]
+    ease.info = info  # type: ignore[attr-defined]
+    return will_scale(ease)
+
+
+def _check_power(n: float) -> None:
+    """Raise a :class:`ValueError` if the power isn't greater than
+    zero.
+    """
+    if not n > 0:
+        msg = f'The power must be greater than zero, got {n}.'
+        raise ValueError(msg)
+
+
+def _poly_ease(pieces: tuple[poly.Piece, ...]) -> Callable:
+    """Get an undecorated ease that evaluates polynomial pieces with
+    :mod:`imgeaser.poly`.
+    """
+    def ease(a):
+        return poly.ease_poly(a, pieces)
+
+    return ease
+
+
+def _elastic(period: float, amplitude: float) -> tuple[float, float]:
+    """Get the frequency and phase of the bounces of an elastic ease.
+
+    :param period: The length of each bounce.
+    :param amplitude: The height of the bounces.
+    :return: The frequency in radians for each tenth of the data and
+        the phase as a fraction of the data as a :class:`tuple`.
+    :rtype: tuple
+    """
+    if not period > 0:
+        msg = f'The period must be greater than zero, got {period}.'
+        raise ValueError(msg)
+    if not amplitude >= 1:
+        msg = f'The amplitude must be at least one, got {amplitude}.'
+        raise ValueError(msg)
+    c = 2 * math.pi / (10 * period)
+    if amplitude == 1:
+        phase = period / 4
+    else:
+        phase = period / (2 * math.pi) * math.asin(1 / amplitude)
+    return c, phase
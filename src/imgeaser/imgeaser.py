@@ -10,11 +10,13 @@ from typing import Callable
 import numpy as np
 from numpy.typing import NDArray
 
-from imgeaser.utility import will_scale
+from imgeaser import poly
+from imgeaser.consts import BOUNCE_D, BOUNCE_N, ELASTIC_C4, ELASTIC_C5
+from imgeaser.utility import piecewise, will_scale
 
 
 # Types.
-ImgAry = NDArray[np.float_]
+ImgAry = NDArray[np.floating]
 Ease = Callable[[ImgAry], ImgAry]
 
 
@@ -33,6 +35,7 @@ def ease_in_back(a: ImgAry) -> ImgAry:
     awkward. It's left to the calling application to decide how to
     handle it. In the following example, values are just truncated at
     zero.
+    Passing `clip=True` truncates them while easing.
     
     .. figure:: images/ex_ease_in_back.png
        :alt: An example of the easing function affecting a gradient.
@@ -43,9 +46,7 @@ def ease_in_back(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    c1 = 1.70158
-    c3 = c1 + 1
-    return c3 * a ** 3 - c1 * a ** 2
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_back'])
 
 
 @will_scale
@@ -70,7 +71,11 @@ def ease_in_circ(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return 1 - np.sqrt(1 - a ** 2)
+    a **= 2
+    np.subtract(1, a, out=a)
+    np.sqrt(a, out=a)
+    np.subtract(1, a, out=a)
+    return a
 
 
 @will_scale
@@ -95,7 +100,7 @@ def ease_in_cubic(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return a ** 3
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_cubic'])
 
 
 @will_scale
@@ -112,6 +117,7 @@ def ease_in_elastic(a: ImgAry) -> ImgAry:
     awkward. It's left to the calling application to decide how to
     handle it. In the following example, values are just truncated at
     zero.
+    Passing `clip=True` truncates them while easing.
     
     .. figure:: images/ex_ease_in_elastic.png
        :alt: An example of the easing function affecting a gradient.
@@ -122,12 +128,20 @@ def ease_in_elastic(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    c4 = (2 * np.pi) / 3
-    m = np.zeros(a.shape, bool)
-    m[a == 0] = True
-    m[a == 1] = True
-    a[~m] = -(2 ** (10 * a[~m] - 10)) * np.sin((a[~m] * 10 - 10.75) * c4)
-    return a
+    def ease(a):
+        t = np.multiply(a, 10, out=np.empty_like(a))
+        t -= 10.75
+        t *= ELASTIC_C4
+        np.sin(t, out=t)
+        np.multiply(a, 10, out=a)
+        np.subtract(a, 10, out=a)
+        np.power(2, a, out=a)
+        np.negative(a, out=a)
+        np.multiply(a, t, out=a)
+
+    return piecewise(a, [
+        (lambda a: (a != 0) & (a != 1), ease),
+    ])
 
 
 @will_scale
@@ -152,7 +166,7 @@ def ease_in_quad(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return a ** 2
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_quad'])
 
 
 @will_scale
@@ -177,7 +191,7 @@ def ease_in_quint(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return a ** 5
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_quint'])
 
 
 @will_scale
@@ -202,7 +216,11 @@ def ease_in_sin(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return 1 - np.cos(a * np.pi / 2)
+    a *= np.pi
+    a /= 2
+    np.cos(a, out=a)
+    np.subtract(1, a, out=a)
+    return a
 
 
 # Ease out functions.
@@ -227,17 +245,26 @@ def ease_out_bounce(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    n1 = 7.5625
-    d1 = 2.75
-    
-    b = np.zeros(a.shape, dtype=a.dtype)
-
-    b[a >= 2.5 / d1] = n1 * (a[a >= 2.5 / d1] - 2.625 / d1) ** 2 + .984375
-    b[a < 2.5 / d1] = n1 * (a[a < 2.5 / d1] - 2.25 / d1) ** 2 + .9375
-    b[a < 2 / d1] = n1 * (a[a < 2 / d1] - 1.5 / d1) ** 2 + .75
-    b[a < 1 / d1] = n1 * a[a < 1 / d1] ** 2
-
-    return b
+    def bounce(offset, height):
+        def ease(a):
+            np.subtract(a, offset, out=a)
+            np.square(a, out=a)
+            np.multiply(a, BOUNCE_N, out=a)
+            np.add(a, height, out=a)
+        return ease
+
+    return piecewise(a, [
+        (lambda a: a < 1 / BOUNCE_D, bounce(0, 0)),
+        (
+            lambda a: (a >= 1 / BOUNCE_D) & (a < 2 / BOUNCE_D),
+            bounce(1.5 / BOUNCE_D, .75)
+        ),
+        (
+            lambda a: (a >= 2 / BOUNCE_D) & (a < 2.5 / BOUNCE_D),
+            bounce(2.25 / BOUNCE_D, .9375)
+        ),
+        (lambda a: a >= 2.5 / BOUNCE_D, bounce(2.625 / BOUNCE_D, .984375)),
+    ])
 
 
 @will_scale
@@ -261,7 +288,11 @@ def ease_out_circ(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return np.sqrt(1 - (a - 1) ** 2)
+    a -= 1
+    a **= 2
+    np.subtract(1, a, out=a)
+    np.sqrt(a, out=a)
+    return a
 
 
 @will_scale
@@ -285,7 +316,7 @@ def ease_out_cubic(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return 1 - (1 - a) ** 3
+    return poly.ease_poly(a, poly.POLYNOMIALS['out_cubic'])
 
 
 @will_scale
@@ -302,6 +333,7 @@ def ease_out_elastic(a: ImgAry) -> ImgAry:
     awkward. It's left to the calling application to decide how to
     handle it. In the following example, values are just truncated at
     one.
+    Passing `clip=True` truncates them while easing.
     
     .. figure:: images/ex_ease_out_elastic.png
        :alt: An example of the easing function affecting a gradient.
@@ -312,12 +344,19 @@ def ease_out_elastic(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    c4 = (2 * np.pi) / 3
-    m = np.zeros(a.shape, bool)
-    m[a == 0] = True
-    m[a == 1] = True
-    a[~m] = 2 ** (-10 * a[~m]) * np.sin((a[~m] * 10 - .75) * c4) + 1
-    return a
+    def ease(a):
+        t = np.multiply(a, 10, out=np.empty_like(a))
+        t -= .75
+        t *= ELASTIC_C4
+        np.sin(t, out=t)
+        np.multiply(a, -10, out=a)
+        np.power(2, a, out=a)
+        np.multiply(a, t, out=a)
+        np.add(a, 1, out=a)
+
+    return piecewise(a, [
+        (lambda a: (a != 0) & (a != 1), ease),
+    ])
 
 
 @will_scale
@@ -341,7 +380,7 @@ def ease_out_quad(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return 1 - (1 - a) ** 2
+    return poly.ease_poly(a, poly.POLYNOMIALS['out_quad'])
 
 
 @will_scale
@@ -365,7 +404,7 @@ def ease_out_quint(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return 1 - (1 - a) ** 5
+    return poly.ease_poly(a, poly.POLYNOMIALS['out_quint'])
 
 
 @will_scale
@@ -389,7 +428,10 @@ def ease_out_sin(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return np.sin(a * np.pi / 2)
+    a *= np.pi
+    a /= 2
+    np.sin(a, out=a)
+    return a
 
 
 # Ease in and out functions.
@@ -406,6 +448,7 @@ def ease_in_out_back(a: ImgAry) -> ImgAry:
     into negative values and bounce over one can be a little awkward.
     It's left to the calling application to decide how to handle it. In
     the following example, values are just truncated at zero and one.
+    Passing `clip=True` truncates them while easing.
     
     .. figure:: images/ex_ease_in_out_back.png
        :alt: An example of the easing function affecting a gradient.
@@ -416,13 +459,7 @@ def ease_in_out_back(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    c1 = 1.70158
-    c2 = c1 * 1.525
-    m = np.zeros(a.shape, bool)
-    m[a < .5] = True
-    a[m] = (2 * a[m]) ** 2 * ((c2 + 1) * 2 * a[m] - c2) / 2
-    a[~m] = ((2 * a[~m] - 2) ** 2 * ((c2 + 1) * (a[~m] * 2 - 2) + c2) + 2) / 2
-    return a
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_out_back'])
 
 
 @will_scale
@@ -447,11 +484,27 @@ def ease_in_out_circ(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    m = np.zeros(a.shape, bool)
-    m[a < .5] = True
-    a[m] = (1 - np.sqrt(1 - (2 * a[m]) ** 2)) / 2
-    a[~m] = (np.sqrt(1 - (-2 * a[~m] + 2) ** 2) + 1) / 2
-    return a
+    def ease_in(a):
+        np.multiply(a, 2, out=a)
+        np.square(a, out=a)
+        np.subtract(1, a, out=a)
+        np.sqrt(a, out=a)
+        np.subtract(1, a, out=a)
+        np.divide(a, 2, out=a)
+
+    def ease_out(a):
+        np.multiply(a, -2, out=a)
+        np.add(a, 2, out=a)
+        np.square(a, out=a)
+        np.subtract(1, a, out=a)
+        np.sqrt(a, out=a)
+        np.add(a, 1, out=a)
+        np.divide(a, 2, out=a)
+
+    return piecewise(a, [
+        (lambda a: a < .5, ease_in),
+        (lambda a: a >= .5, ease_out),
+    ])
 
 
 @will_scale
@@ -477,7 +530,12 @@ def ease_in_out_cos(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return -1 * (np.sin(np.pi * a) - 1) / 2
+    a *= np.pi
+    np.sin(a, out=a)
+    a -= 1
+    a *= -1
+    a /= 2
+    return a
 
 
 @will_scale
@@ -502,9 +560,7 @@ def ease_in_out_cubic(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    a[a < .5] = 4 * a[a < .5] ** 3
-    a[a >= .5] = 1 - (-2 * a[a >= .5] + 2) ** 3 / 2
-    return a
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_out_cubic'])
 
 
 @will_scale
@@ -522,6 +578,7 @@ def ease_in_out_elastic(a: ImgAry) -> ImgAry:
     be a little awkward. It's left to the calling application to
     decide how to handle it. In the following example, values are
     just truncated at one.
+    Passing `clip=True` truncates them while easing.
     
     .. figure:: images/ex_ease_in_out_elastic.png
        :alt: An example of the easing function affecting a gradient.
@@ -533,22 +590,34 @@ def ease_in_out_elastic(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    c5 = (2 * np.pi) / 4.5
-
-    # Create masks for the array.
-    m1 = np.zeros(a.shape, bool)
-    m1[a < .5] = True
-    m1[a <= 0] = False
-    m2 = np.zeros(a.shape, bool)
-    m2[a >= .5] = True
-    m2[a >= 1] = False
-
-    # Run the easing function based on the masks.
-    a[m1] = -(2 ** (20 * a[m1] - 10) * np.sin((20 * a[m1] - 11.125) * c5))
-    a[m1] = a[m1] / 2
-    a[m2] = (2 ** (-20 * a[m2] + 10) * np.sin((20 * a[m2] - 11.125) * c5))
-    a[m2] = a[m2] / 2 + 1
-    return a
+    def wave(a):
+        t = np.multiply(a, 20, out=np.empty_like(a))
+        t -= 11.125
+        t *= ELASTIC_C5
+        return np.sin(t, out=t)
+
+    def ease_in(a):
+        t = wave(a)
+        np.multiply(a, 20, out=a)
+        np.subtract(a, 10, out=a)
+        np.power(2, a, out=a)
+        np.multiply(a, t, out=a)
+        np.negative(a, out=a)
+        np.divide(a, 2, out=a)
+
+    def ease_out(a):
+        t = wave(a)
+        np.multiply(a, -20, out=a)
+        np.add(a, 10, out=a)
+        np.power(2, a, out=a)
+        np.multiply(a, t, out=a)
+        np.divide(a, 2, out=a)
+        np.add(a, 1, out=a)
+
+    return piecewise(a, [
+        (lambda a: (a > 0) & (a < .5), ease_in),
+        (lambda a: (a >= .5) & (a < 1), ease_out),
+    ])
 
 
 @will_scale
@@ -574,11 +643,7 @@ def ease_in_out_quad(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    m = np.zeros(a.shape, bool)
-    m[a < .5] = True
-    a[m] = 2 * a[m] ** 2
-    a[~m] = 1 - (-2 * a[~m] + 2) ** 2 / 2
-    return a
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_out_quad'])
 
 
 @will_scale
@@ -604,9 +669,7 @@ def ease_in_out_quint(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    a[a < .5] = 16 * a[a < .5] ** 5
-    a[a >= .5] = 1 - (-2 * a[a >= .5] + 2) ** 5 / 2
-    return a
+    return poly.ease_poly(a, poly.POLYNOMIALS['in_out_quint'])
 
 
 @will_scale
@@ -631,10 +694,30 @@ def ease_in_out_sin(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    return -1 * (np.cos(np.pi * a) - 1) / 2
+    a *= np.pi
+    np.cos(a, out=a)
+    a -= 1
+    a *= -1
+    a /= 2
+    return a
 
 
 # Ease mid functions.
+def _mid_bump(a):
+    np.subtract(.25, a, out=a)
+    np.multiply(a, 4, out=a)
+
+
+def _mid_bump_edges(a):
+    np.copyto(a, 0)
+
+
+_mid_bump_pieces = [
+    (lambda a: a < .25, _mid_bump),
+    (lambda a: a >= .25, _mid_bump_edges),
+]
+
+
 @will_scale
 def ease_mid_bump_linear(a: ImgAry) -> ImgAry:
     """An easing function that makes the middle of the range the peak
@@ -657,12 +740,9 @@ def ease_mid_bump_linear(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    a = np.abs(a - .5)
-    m = np.zeros(a.shape, bool)
-    m[a < .25] = True
-    a[m] = (.25 - a[m]) * 4
-    a[~m] = 0
-    return a
+    a -= .5
+    np.abs(a, out=a)
+    return piecewise(a, _mid_bump_pieces)
 
 
 @will_scale
@@ -687,9 +767,9 @@ def ease_mid_bump_sin(a: ImgAry) -> ImgAry:
     :return: The eased data as a :class:`numpy.ndarray`.
     :rtype: numpy.ndarray
     """
-    a = np.abs(a - .5)
-    m = np.zeros(a.shape, bool)
-    m[a < .25] = True
-    a[m] = (.25 - a[m]) * 4
-    a[~m] = 0
-    return ease_in_out_sin(a)
+    a -= .5
+    np.abs(a, out=a)
+    piecewise(a, _mid_bump_pieces)
+    # The data is already within 0 and 1, so the undecorated ease is
+    # called to skip scanning and scaling it again.
+    return ease_in_out_sin.__wrapped__(a)  # type: ignore[attr-defined]
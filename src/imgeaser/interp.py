@@ -0,0 +1,189 @@
+"""
+interp
+~~~~~~
+
+Interpolated lookup tables for easing float data.
+
+Float data can hold too many values for a table with an entry for
+each, like the tables for integer data in :mod:`imgeaser.lut`. Instead,
+the ease is sampled at evenly spaced points from zero to one, and each
+value is eased by interpolating linearly between the two samples on
+either side of it. That costs the same for every ease, so it is much
+faster than the math of the piecewise and elastic eases, but slower
+than the math of the simple eases in float32, which :mod:`numpy`
+vectorizes.
+
+The largest error of each ease is given in :data:`ERRORS` for tables
+of 4,096 and 16,384 steps, and can be measured for other sizes with
+:func:`measure_error`. Smooth eases have errors that shrink with the
+square of the size of the table. The rest don't:
+
+*   The elastic eases return exactly zero and one at the ends, but the
+    limits of their waves are not quite zero or one, so their errors
+    are the size of those jumps however large the table is.
+*   The circular eases are vertical at one end, so their errors only
+    shrink with the square root of the size of the table.
+*   The pieces of `out_bounce` meet at corners that aren't on samples,
+    so its errors shrink more slowly than those of smooth eases.
+*   `mid_bump_linear` is straight between corners at multiples of a
+    quarter, which are on the samples of tables with a size that's a
+    multiple of four, so it is exact through those tables.
+"""
+from functools import lru_cache
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+# The number of tables kept in the cache.
+CACHE_SIZE = 64
+
+# The sizes of the tables measured in ERRORS.
+SIZES = (4096, 16384)
+
+# The number of points each step of a table is measured at.
+SAMPLES_PER_STEP = 64
+
+# The largest error of each ease over data within zero to one, for
+# tables of each size in SIZES, by the name of the ease in
+# `imgeaser.eases`. The errors are measured with the table and data
+# in float64, then rounded up. Easing in float32 adds the rounding
+# error of float32, up to about 1e-7.
+ERRORS = {
+    'in_back': (9.6e-8, 6e-9),
+    'in_circ': (5.6e-3, 2.8e-3),
+    'in_cubic': (4.5e-8, 2.8e-9),
+    'in_elastic': (4.9e-4, 4.9e-4),
+    'in_out_back': (2.5e-7, 1.6e-8),
+    'in_out_circ': (4e-3, 2e-3),
+    'in_out_cos': (3.7e-8, 2.3e-9),
+    'in_out_cubic': (9e-8, 5.6e-9),
+    'in_out_elastic': (8.5e-5, 8.5e-5),
+    'in_out_quad': (3e-8, 1.9e-9),
+    'in_out_quint': (3e-7, 1.9e-8),
+    'in_out_sin': (3.7e-8, 2.3e-9),
+    'in_quad': (1.5e-8, 9.4e-10),
+    'in_quint': (1.5e-7, 9.4e-9),
+    'in_sin': (1.9e-8, 1.2e-9),
+    'mid_bump_linear': (0.0, 0.0),
+    'mid_bump_sin': (5.9e-7, 3.7e-8),
+    'out_bounce': (5e-4, 7.5e-5),
+    'out_circ': (5.6e-3, 2.8e-3),
+    'out_cubic': (4.5e-8, 2.8e-9),
+    'out_elastic': (4.9e-4, 4.9e-4),
+    'out_quad': (1.5e-8, 9.4e-10),
+    'out_quint': (1.5e-7, 9.4e-9),
+    'out_sin': (1.9e-8, 1.2e-9),
+}
+
+
+# Table functions.
+@lru_cache(maxsize=CACHE_SIZE)
+def build_table(fn: Callable, size: int, dtype: np.dtype) -> NDArray:
+    """Build the interpolated lookup table for an ease.
+
+    The ease is sampled in float64 at `size + 1` evenly spaced points
+    from zero to one. The first row of the table is the samples, and
+    the second is the difference between each sample and the next,
+    which is zero for the last sample.
+
+    :param fn: The undecorated easing function.
+    :param size: The number of steps in the table.
+    :param dtype: The float type of the table.
+    :return: The table as a read-only :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    samples = fn(np.arange(size + 1) / size)
+    table = np.zeros((2, size + 1), dtype=dtype)
+    table[0] = samples
+    table[1, :-1] = np.diff(samples)
+    table.flags.writeable = False
+    return table
+
+
+def get_table_dtype(dtype: np.dtype) -> np.dtype:
+    """Get the type to interpolate data of a float type in."""
+    if dtype == np.float64:
+        return np.dtype(np.float64)
+    return np.dtype(np.float32)
+
+
+def interpolate(
+    table: np.ndarray,
+    a: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Ease data within zero to one by interpolating in a table.
+
+    Values outside of zero to one are clamped to the ends of the table.
+
+    :param table: The table from :func:`build_table`.
+    :param a: The data to ease.
+    :param out: (Optional.) The array to write the result into. It can
+        be the data.
+    :return: The eased data as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if out is None:
+        out = np.empty(a.shape, dtype=table.dtype)
+    size = table.shape[1] - 1
+    x = np.multiply(a, size, dtype=table.dtype)
+    np.maximum(x, 0, out=x)
+    np.minimum(x, size, out=x)
+    step = np.floor(x)
+    x -= step
+
+    # NaNs have no step. Their index is clipped into the table, and
+    # they stay NaN through their fraction.
+    with np.errstate(invalid='ignore'):
+        index = step.astype(np.intp)
+
+    # The fraction of each value's step is scaled by the difference
+    # of that step, then added to the sample at its start.
+    np.take(table[1], index, out=step, mode='clip')
+    x *= step
+    np.take(table[0], index, out=step, mode='clip')
+    np.add(step, x, out=out)
+    return out
+
+
+# Error functions.
+def measure_error(fn: Callable, size: int) -> float:
+    """Measure the largest error of easing through a table of a size.
+
+    The error is the largest difference from the ease over data within
+    zero to one, with the table and data in float64. It's measured at
+    :data:`SAMPLES_PER_STEP` evenly spaced points in each step of the
+    table, and at the values next to zero and one.
+
+    :param fn: The ease, decorated or not.
+    :param size: The number of steps in the table.
+    :return: The error as a :class:`float`.
+    :rtype: float
+    """
+    fn = getattr(fn, '__wrapped__', fn)
+    count = size * SAMPLES_PER_STEP
+    a = np.append(np.arange(count + 1) / count, [5e-324, 1 - 2 ** -53])
+    table = build_table(fn, size, np.dtype(np.float64))
+    return float(np.abs(interpolate(table, a) - fn(a.copy())).max())
+
+
+def get_error(fn: Callable, size: int) -> float:
+    """Get the largest error of easing through a table of a size.
+
+    :param fn: The ease, decorated or not.
+    :param size: The number of steps in the table.
+    :return: The error as a :class:`float`. It's from :data:`ERRORS` if
+        it's there, or measured with :func:`measure_error` otherwise.
+    :rtype: float
+    """
+    wrapped = getattr(fn, '__wrapped__', fn)
+    if (
+        size in SIZES
+        and getattr(wrapped, '__module__', None) == 'imgeaser.imgeaser'
+    ):
+        errors = ERRORS.get(wrapped.__name__.removeprefix('ease_'))
+        if errors is not None:
+            return errors[SIZES.index(size)]
+    return measure_error(fn, size)
@@ -0,0 +1,150 @@
+"""
+jit
+~~~
+
+An optional compiled backend for the eases.
+
+If :mod:`numba` is installed, each ease can be compiled into a single
+parallel loop over the data that scales, eases, and unscales each
+value in one step, without the temporary arrays the :mod:`numpy`
+implementation needs. The kernels are the eases for single values in
+:mod:`imgeaser.scalar`. If :mod:`numba` isn't installed, the eases fall
+back to the :mod:`numpy` implementation.
+"""
+from functools import lru_cache
+from typing import Callable, Optional
+
+import numpy as np
+
+from imgeaser import scalar
+
+
+try:
+    import numba  # type: ignore[import-untyped]
+except ImportError:
+    numba = None
+
+
+# The types the compiled kernels accept.
+JIT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# The kernels for each ease, by the name of the ease. They are the
+# eases for single values, which only use math and float arithmetic.
+KERNELS = {f'ease_{name}': fn for name, fn in scalar.eases.items()}
+
+# The number of compiled kernels kept in the cache.
+CACHE_SIZE = 256
+
+
+# Backend functions.
+def available() -> bool:
+    """Is the compiled backend available?"""
+    return numba is not None
+
+
+def get_kernel(fn: Callable) -> Optional[Callable]:
+    """Get the compiled kernel for an ease.
+
+    The kernel is compiled the first time it is requested. It takes
+    the data, an output array, the minimum of the range, the size of
+    the range, whether the data should be scaled, and whether the
+    eased values should be clamped to zero and one. A chain of eases
+    made by :func:`imgeaser.compose` is compiled into a single kernel
+    if there is a kernel for every ease in it. Eases built outside of
+    :mod:`imgeaser.imgeaser` can provide their kernel as their `kernel`
+    attribute.
+
+    :param fn: The undecorated easing function.
+    :return: The compiled kernel as a :class:`Callable` or `None` if
+        :mod:`numba` isn't installed or there is no kernel for the ease.
+    :rtype: Callable
+    """
+    if numba is None:
+        return None
+    links = getattr(fn, 'chain', (fn,))
+    kernels = tuple(_get_scalar(link) for link in links)
+    if None in kernels:
+        return None
+    return _compile(*kernels)
+
+
+def ease_jit(
+    fn: Callable,
+    a: np.ndarray,
+    out: np.ndarray,
+    lo: float,
+    scale: float,
+    scaled: bool,
+    clip: bool = False
+) -> Optional[np.ndarray]:
+    """Ease data with the compiled kernel for an ease.
+
+    :param fn: The undecorated easing function.
+    :param a: The data to ease.
+    :param out: The array to write the result into.
+    :param lo: The minimum of the range of the data.
+    :param scale: The size of the range of the data.
+    :param scaled: Whether the data should be scaled.
+    :param clip: (Optional.) Whether to clamp the eased values to zero
+        and one before they are unscaled.
+    :return: The eased data as a :class:`numpy.ndarray` or `None` if
+        there is no compiled kernel for the ease or the data isn't a
+        type the kernel accepts.
+    :rtype: numpy.ndarray
+    """
+    if a.dtype not in JIT_DTYPES or out.dtype not in JIT_DTYPES:
+        return None
+    kernel = get_kernel(fn)
+    if kernel is None:
+        return None
+
+    if out.flags.c_contiguous:
+        kernel(np.ravel(a), out.reshape(-1), lo, scale, scaled, clip)
+    else:
+        b = np.empty(a.shape, dtype=out.dtype)
+        kernel(np.ravel(a), b.reshape(-1), lo, scale, scaled, clip)
+        np.copyto(out, b)
+    return out
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile(*fns: Callable) -> Callable:
+    """Compile ease kernels into a fused, parallel loop that performs
+    each of them in turn. The loops are cached by their kernels.
+    """
+    ease = numba.njit(fns[0])
+    for fn in fns[1:]:
+        ease = _link(ease, numba.njit(fn))
+
+    @numba.njit(parallel=True)
+    def kernel(a, out, lo, scale, scaled, clip):
+        for i in numba.prange(a.size):
+            x = a[i]
+            if scaled:
+                x = (x - lo) / scale
+            x = ease(x)
+            if clip:
+                x = min(max(x, 0.0), 1.0)
+            if scaled:
+                x = x * scale + lo
+            out[i] = x
+
+    return kernel
+
+
+def _get_scalar(fn: Callable) -> Optional[Callable]:
+    """Get the kernel that performs an undecorated ease on a single
+    value, or `None` if it doesn't have one.
+    """
+    if fn.__module__ == 'imgeaser.imgeaser':
+        return KERNELS.get(fn.__name__)
+    return getattr(fn, 'kernel', None)
+
+
+def _link(first: Callable, second: Callable) -> Callable:
+    """Compile two kernels into one that performs them in turn."""
+    @numba.njit
+    def link(x):
+        return second(first(x))
+
+    return link
@@ -0,0 +1,186 @@
+"""
+lut
+~~~
+
+Lookup tables for easing integer image data.
+
+An 8-bit or 16-bit image can only hold 256 or 65,536 distinct values,
+so rather than running the math of an ease on every pixel, the ease
+is run once on every possible value and the result is gathered from
+the table.
+
+When the range of the data is known to cover all of it, only the
+values within the range are eased. They are eased from a table of the
+offsets within a range of that size, which is cached by the size, so
+data that only shifts its range doesn't run the math of the ease again.
+"""
+from functools import lru_cache
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+# Integer types small enough to be eased through a lookup table.
+LUT_DTYPES = (
+    np.dtype(np.int8),
+    np.dtype(np.int16),
+    np.dtype(np.uint8),
+    np.dtype(np.uint16),
+)
+
+# The number of tables kept in the cache.
+CACHE_SIZE = 256
+
+# The number of eased offsets kept in the cache, by the size of the
+# range. Each holds a float for every value in a range.
+SPAN_CACHE_SIZE = 16
+
+
+# Table functions.
+def can_lut(a: np.ndarray) -> bool:
+    """Can the given array be eased through a lookup table?"""
+    return a.dtype in LUT_DTYPES
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def build_lut(
+    fn: Callable,
+    dtype: np.dtype,
+    lo: int,
+    hi: int,
+    clip: bool = False,
+    covered: bool = False
+) -> NDArray:
+    """Build the lookup table for an ease.
+
+    The table has an entry for every value the given integer type can
+    hold. It is ordered by the unsigned view of those values, so it
+    can be indexed by an array of the type viewed as unsigned.
+
+    :param fn: The undecorated easing function.
+    :param dtype: The integer type of the data being eased.
+    :param lo: The lowest value in the data being eased.
+    :param hi: The highest value in the data being eased.
+    :param clip: (Optional.) Whether to clamp the eased values to the
+        range of the data.
+    :param covered: (Optional.) Whether every value of the data is
+        within the range. If it is, only the entries within the range
+        are eased, and the rest are zero.
+    :return: The table as a read-only :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    dtype = np.dtype(dtype)
+    udtype = np.dtype(f'u{dtype.itemsize}')
+    scale = (hi - lo) or 1
+    scaled = lo < 0 or hi > 1
+    if covered and scaled:
+        table = np.zeros(2 ** (8 * dtype.itemsize), dtype=dtype)
+        values = np.arange(lo, hi + 1).astype(dtype).view(udtype)
+        table[values] = _round(ease_span(fn, hi - lo, clip) + lo, dtype)
+        table.flags.writeable = False
+        return table
+
+    values = np.arange(2 ** (8 * dtype.itemsize), dtype=udtype)
+    a = values.view(dtype).astype(float)
+
+    # Scale the same way will_scale would scale the data. Data with
+    # only one value can't be scaled, so it is just offset.
+    if scaled:
+        a -= lo
+        a /= scale
+
+    # Values outside of the range of the data are in the table too,
+    # and some eases aren't defined for them. They can't be in the
+    # data, so they are set to zero rather than warning.
+    with np.errstate(all='ignore'):
+        a = fn(a)
+        if clip:
+            np.clip(a, 0.0, 1.0, out=a)
+
+        if scaled:
+            a *= scale
+            a += lo
+    table = _round(a, dtype)
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=SPAN_CACHE_SIZE)
+def ease_span(fn: Callable, span: int, clip: bool = False) -> NDArray:
+    """Ease every offset within a range of a size.
+
+    The offsets are scaled and unscaled the same way will_scale would
+    scale data with a range of that size, but aren't offset by the
+    bottom of the range, so the result can be shared by every range of
+    the size.
+
+    :param fn: The undecorated easing function.
+    :param span: The difference between the ends of the range.
+    :param clip: (Optional.) Whether to clamp the eased values to the
+        range.
+    :return: The eased offsets as a read-only :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    scale = span or 1
+    a = np.arange(span + 1, dtype=float)
+    a /= scale
+    with np.errstate(all='ignore'):
+        a = fn(a)
+        if clip:
+            np.clip(a, 0.0, 1.0, out=a)
+        a *= scale
+    a.flags.writeable = False
+    return a
+
+
+def _round(a: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Round eased values into an integer type in place. Values that
+    aren't finite become zero, and values that overshoot the range of
+    the type are truncated.
+    """
+    a[~np.isfinite(a)] = 0
+    info = np.iinfo(dtype)
+    np.rint(a, out=a)
+    np.clip(a, info.min, info.max, out=a)
+    return a.astype(dtype)
+
+
+def ease_lut(
+    fn: Callable,
+    a: np.ndarray,
+    value_range: Optional[tuple[float, float]] = None,
+    out: Optional[np.ndarray] = None,
+    clip: bool = False,
+    covered: bool = False
+) -> np.ndarray:
+    """Ease integer data through a cached lookup table.
+
+    :param fn: The undecorated easing function.
+    :param a: An array of integer image data.
+    :param value_range: (Optional.) The minimum and maximum values of
+        the data. They must be integers. If it isn't given, the data is
+        scanned to find them.
+    :param out: (Optional.) The array to write the result into. It
+        must have the same shape as the data. If it isn't given, a
+        new array is allocated in the type of the data.
+    :param clip: (Optional.) Whether to clamp the eased values to the
+        range of the data.
+    :param covered: (Optional.) Whether every value of the data is
+        within `value_range`. It's true if the data is scanned.
+    :return: The eased data.
+    :rtype: numpy.ndarray
+    """
+    if value_range is None:
+        value_range = (np.min(a), np.max(a))
+        covered = True
+    lo, hi = (float(x) for x in value_range)
+    if not (lo.is_integer() and hi.is_integer()):
+        msg = f'The range of integer data must be integers, not {lo}, {hi}.'
+        raise ValueError(msg)
+    table = build_lut(fn, a.dtype, int(lo), int(hi), clip, covered)
+    udtype = np.dtype(f'u{a.dtype.itemsize}')
+    if out is None or out.dtype == table.dtype:
+        return np.take(table, a.view(udtype), out=out)
+    np.copyto(out, np.take(table, a.view(udtype)), casting='unsafe')
+    return out
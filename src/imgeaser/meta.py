@@ -0,0 +1,107 @@
+"""
+meta
+~~~~
+
+Machine-readable descriptions of the eases.
+
+Each ease in `imgeaser.eases` has an :class:`EaseInfo` describing how
+it behaves over data within zero to one. The eases use it to skip work
+that can't change the result, and it is available to callers as the
+`info` attribute of each ease.
+"""
+from typing import Callable, NamedTuple, Optional
+
+
+# Types of symmetry.
+ODD = 'odd'
+EVEN = 'even'
+
+
+class EaseInfo(NamedTuple):
+    """A description of how an ease behaves over data within zero to
+    one.
+
+    :param bounds: The lowest and highest values the ease returns. The
+        bounds of eases that overshoot are rounded outward.
+    :param monotonic: Whether the ease never decreases.
+    :param fixed: The values the ease returns for zero and one.
+    :param symmetry: Either `odd` if `f(1 - x) == 1 - f(x)`, `even` if
+        `f(1 - x) == f(x)`, or `None`.
+    """
+    bounds: tuple[float, float] = (0.0, 1.0)
+    monotonic: bool = True
+    fixed: tuple[float, float] = (0.0, 1.0)
+    symmetry: Optional[str] = None
+
+    @property
+    def range_preserving(self) -> bool:
+        """Whether the ease never returns values outside zero to one."""
+        return self.bounds[0] >= 0.0 and self.bounds[1] <= 1.0
+
+
+# The descriptions of the eases, by their names in `imgeaser.eases`.
+INFO = {
+    'in_back': EaseInfo(bounds=(-0.100005, 1.0), monotonic=False),
+    'in_circ': EaseInfo(),
+    'in_cubic': EaseInfo(),
+    'in_elastic': EaseInfo(bounds=(-0.373099, 1.0), monotonic=False),
+    'in_out_back': EaseInfo(
+        bounds=(-0.100152, 1.100152),
+        monotonic=False,
+        symmetry=ODD
+    ),
+    'in_out_circ': EaseInfo(symmetry=ODD),
+    'in_out_cos': EaseInfo(
+        bounds=(0.0, 0.5),
+        monotonic=False,
+        fixed=(0.5, 0.5),
+        symmetry=EVEN
+    ),
+    'in_out_cubic': EaseInfo(symmetry=ODD),
+    'in_out_elastic': EaseInfo(
+        bounds=(-0.118349, 1.118349),
+        monotonic=False,
+        symmetry=ODD
+    ),
+    'in_out_quad': EaseInfo(symmetry=ODD),
+    'in_out_quint': EaseInfo(symmetry=ODD),
+    'in_out_sin': EaseInfo(symmetry=ODD),
+    'in_quad': EaseInfo(),
+    'in_quint': EaseInfo(),
+    'in_sin': EaseInfo(),
+    'mid_bump_linear': EaseInfo(
+        monotonic=False,
+        fixed=(0.0, 0.0),
+        symmetry=EVEN
+    ),
+    'mid_bump_sin': EaseInfo(
+        monotonic=False,
+        fixed=(0.0, 0.0),
+        symmetry=EVEN
+    ),
+    'out_bounce': EaseInfo(monotonic=False),
+    'out_circ': EaseInfo(),
+    'out_cubic': EaseInfo(),
+    'out_elastic': EaseInfo(bounds=(0.0, 1.373099), monotonic=False),
+    'out_quad': EaseInfo(),
+    'out_quint': EaseInfo(),
+    'out_sin': EaseInfo(),
+}
+
+
+# Lookup functions.
+def get_info(fn: Callable) -> Optional[EaseInfo]:
+    """Get the description of an ease.
+
+    :param fn: The ease, decorated or not.
+    :return: The description as a :class:`EaseInfo` or `None` if the
+        function isn't one of the eases in :mod:`imgeaser.imgeaser`
+        and doesn't describe itself with an `info` attribute.
+    :rtype: imgeaser.meta.EaseInfo
+    """
+    fn = getattr(fn, '__wrapped__', fn)
+    if hasattr(fn, 'info'):
+        return fn.info
+    if getattr(fn, '__module__', None) != 'imgeaser.imgeaser':
+        return None
+    return INFO.get(fn.__name__.removeprefix('ease_'))
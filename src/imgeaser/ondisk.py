@@ -0,0 +1,214 @@
+"""
+ondisk
+~~~~~~
+
+Easing data that is too large to fit in memory.
+
+The data is read from a memory-mapped file and eased in chunks small
+enough to fit in memory, with each chunk written straight to the
+output file. The range of the data is found in a separate pass over
+the file before any easing starts, so every chunk is scaled the same
+way the whole array would be scaled if it were eased in memory.
+"""
+from pathlib import Path
+from typing import Callable, Iterator, Literal, Optional, Sequence, Union
+
+import numpy as np
+
+from imgeaser.utility import minmax
+
+
+# Types.
+Ease = Union[Callable, str]
+Source = Union[str, Path, np.ndarray]
+Mode = Literal['r', 'r+', 'c']
+
+# The default size of a chunk in bytes.
+CHUNK_BYTES = 2 ** 26
+
+
+# Chunk functions.
+def iter_chunks(
+    a: np.ndarray,
+    chunk_bytes: int = CHUNK_BYTES
+) -> Iterator[slice]:
+    """Split an array into slabs along its first axis that are no
+    larger than the given size.
+
+    :param a: The array to split.
+    :param chunk_bytes: (Optional.) The largest size of a slab in
+        bytes. A slab is never less than one index deep, so it can be
+        larger than this if one index is larger.
+    :return: The slabs as an :class:`Iterator` of :class:`slice`.
+    :rtype: Iterator
+    """
+    length = len(a)
+    depth = a.itemsize * a.size // max(length, 1)
+    step = max(chunk_bytes // max(depth, 1), 1)
+    for start in range(0, length, step):
+        yield slice(start, min(start + step, length))
+
+
+def _flat(a: np.ndarray) -> np.ndarray:
+    """Get a flat view of a contiguous array, so it can be split into
+    chunks of any size.
+    """
+    return a.reshape(-1) if a.flags.c_contiguous else a
+
+
+def scan_range(a: np.ndarray, chunk_bytes: int = CHUNK_BYTES) -> tuple:
+    """Find the minimum and maximum values of an array in chunks.
+
+    :param a: The array to scan.
+    :param chunk_bytes: (Optional.) The largest size of a chunk in bytes.
+    :return: The minimum and maximum values as a :class:`tuple`.
+    :rtype: tuple
+    """
+    flat = _flat(a)
+    los = []
+    his = []
+    for index in iter_chunks(flat, chunk_bytes):
+        lo, hi = minmax(flat[index])
+        los.append(lo)
+        his.append(hi)
+    return np.min(los), np.max(his)
+
+
+# File functions.
+def open_source(
+    src: Source,
+    dtype: Optional[np.dtype] = None,
+    shape: Optional[Sequence[int]] = None,
+    offset: int = 0,
+    mode: Mode = 'r'
+) -> np.ndarray:
+    """Open data to be eased as a memory map.
+
+    :param src: The path to a `.npy` or raw file, or an array.
+    :param dtype: (Optional.) The type of the data in a raw file.
+    :param shape: (Optional.) The shape of the data in a raw file. If
+        it isn't given, the data is read as a flat array.
+    :param offset: (Optional.) The offset of the data in a raw file.
+    :param mode: (Optional.) The mode used to open the file. It
+        defaults to read-only.
+    :return: The data as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if isinstance(src, np.ndarray):
+        return src
+
+    path = Path(src)
+    if path.suffix == '.npy':
+        return np.load(path, mmap_mode=mode)
+    if dtype is None:
+        msg = 'The dtype must be given for a raw file.'
+        raise ValueError(msg)
+    if shape is not None:
+        shape = tuple(shape)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape, offset=offset)
+
+
+def open_dest(
+    dst: Source,
+    dtype: np.dtype,
+    shape: Sequence[int]
+) -> np.ndarray:
+    """Create the output of an ease as a writable memory map.
+
+    :param dst: The path to a `.npy` or raw file, or an array.
+    :param dtype: The type of the output.
+    :param shape: The shape of the output.
+    :return: The output as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if isinstance(dst, np.ndarray):
+        if dst.shape != tuple(shape):
+            msg = f'Output shape {dst.shape} does not match {tuple(shape)}.'
+            raise ValueError(msg)
+        return dst
+
+    path = Path(dst)
+    if path.suffix == '.npy':
+        return np.lib.format.open_memmap(
+            path,
+            mode='w+',
+            dtype=dtype,
+            shape=tuple(shape)
+        )
+    return np.memmap(path, dtype=dtype, mode='w+', shape=tuple(shape))
+
+
+def is_same_file(src: Source, dst: Source) -> bool:
+    """Do the source and destination name the same file?"""
+    if isinstance(src, np.ndarray) or isinstance(dst, np.ndarray):
+        return False
+    src, dst = Path(src), Path(dst)
+    if not dst.exists():
+        return False
+    return src.resolve() == dst.resolve() or src.samefile(dst)
+
+
+def ease_file(
+    src: Source,
+    dst: Source,
+    ease: Ease,
+    dtype: Optional[np.dtype] = None,
+    shape: Optional[Sequence[int]] = None,
+    offset: int = 0,
+    value_range: Optional[tuple[float, float]] = None,
+    chunk_bytes: int = CHUNK_BYTES
+) -> np.ndarray:
+    """Ease data that may not fit in memory.
+
+    :param src: The data to ease. This can be the path to a `.npy` or
+        raw file, a :class:`numpy.memmap`, or any other array.
+    :param dst: Where to write the eased data. This can be the path to
+        a `.npy` or raw file, a :class:`numpy.memmap`, or any other
+        array. If it is the same file as `src`, the file is eased in
+        place.
+    :param ease: The ease to perform, or its name in `imgeaser.eases`.
+    :param dtype: (Optional.) The type of the data in a raw file.
+    :param shape: (Optional.) The shape of the data in a raw file.
+    :param offset: (Optional.) The offset of the data in a raw file.
+    :param value_range: (Optional.) The minimum and maximum values of
+        the data. If it isn't given, the data is scanned to find them.
+    :param chunk_bytes: (Optional.) The largest size of a chunk in
+        bytes.
+    :return: The eased data as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if isinstance(ease, str):
+        from imgeaser import eases
+        ease = eases[ease]
+
+    # Opening the destination for writing would truncate the file, so
+    # a file eased into itself is opened once and eased in place.
+    if is_same_file(src, dst):
+        a = open_source(src, dtype, shape, offset, mode='r+')
+        if a.dtype.kind not in 'iuf':
+            msg = f'Data of type {a.dtype} cannot be eased in place.'
+            raise ValueError(msg)
+        out = a
+    else:
+        a = open_source(src, dtype, shape, offset)
+        out_dtype = a.dtype
+        if out_dtype.kind not in 'iuf':
+            out_dtype = np.dtype(float)
+        out = open_dest(dst, out_dtype, a.shape)
+
+    # The range is found before easing, so every chunk is scaled the
+    # same way.
+    if value_range is None:
+        value_range = scan_range(a, chunk_bytes)
+
+    # Contiguous data is split into flat chunks. Anything else is split
+    # into slabs along the first axis.
+    src_view, dst_view = a, out
+    if a.flags.c_contiguous and out.flags.c_contiguous:
+        src_view, dst_view = _flat(a), _flat(out)
+    for index in iter_chunks(src_view, chunk_bytes):
+        ease(src_view[index], out=dst_view[index], value_range=value_range)
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
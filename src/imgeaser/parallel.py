@@ -0,0 +1,423 @@
+"""
+parallel
+~~~~~~~~
+
+Running eases across several cores.
+
+:mod:`numpy` releases the GIL while its ufuncs run, so an ease can be
+spread across cores by splitting the data into slabs and easing each
+slab in its own thread. The range of the data is found once before
+the data is split, so every slab is scaled the same way and the result
+is identical to easing the data in one piece.
+
+For work that doesn't release the GIL, :class:`ProcessEaser` spreads
+eases across a pool of processes that share the data through shared
+memory.
+"""
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+
+# Starting processes needs most of multiprocessing, which is slow to
+# import, so it is only imported when a process pool is created. The
+# thread pool is imported when it is first needed.
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from multiprocessing.context import BaseContext
+    from multiprocessing.shared_memory import SharedMemory
+
+
+# Arrays with fewer elements than this aren't worth splitting.
+MIN_SPLIT = 2 ** 16
+
+# The default number of threads used by the eases.
+_workers = 1
+
+# The thread pool shared by the eases.
+_executor: Optional['ThreadPoolExecutor'] = None
+_executor_size = 0
+_executor_lock = threading.Lock()
+
+# Marks the threads of the pool while they are running a slab.
+_local = threading.local()
+
+
+# Worker settings.
+def get_workers() -> int:
+    """Get the default number of threads used by the eases."""
+    return _workers
+
+
+def set_workers(n: Optional[int]) -> None:
+    """Set the default number of threads used by the eases.
+
+    :param n: The number of threads. If it's `None`, all of the cores
+        of the system are used.
+    :return: None.
+    :rtype: NoneType
+    """
+    global _workers
+    if n is None:
+        n = os.cpu_count() or 1
+    if n < 1:
+        msg = 'The number of workers must be at least one.'
+        raise ValueError(msg)
+    _workers = n
+
+
+def get_executor(workers: int) -> 'ThreadPoolExecutor':
+    """Get the thread pool shared by the eases.
+
+    The pool lives as long as the process, so threads aren't started
+    on every call. It is replaced if more workers are needed than it
+    has. A replaced pool isn't shut down, since other threads may still
+    be submitting to it. Its threads exit once it is garbage collected.
+
+    :param workers: The number of threads needed.
+    :return: The pool as a :class:`concurrent.futures.ThreadPoolExecutor`.
+    :rtype: concurrent.futures.ThreadPoolExecutor
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    global _executor, _executor_size
+    with _executor_lock:
+        if _executor is None or _executor_size < workers:
+            _executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix='imgeaser'
+            )
+            _executor_size = workers
+        return _executor
+
+
+# Splitting functions.
+def split(length: int, parts: int) -> list[slice]:
+    """Split a length into nearly equal slices.
+
+    :param length: The length to split.
+    :param parts: The number of slices.
+    :return: The slices as a :class:`list`.
+    :rtype: list
+    """
+    parts = max(min(parts, length), 1)
+    edges = np.linspace(0, length, parts + 1).astype(int)
+    return [slice(start, stop) for start, stop in zip(edges, edges[1:])]
+
+
+def map_slabs(
+    fn: Callable,
+    a: np.ndarray,
+    out: np.ndarray,
+    workers: int
+) -> np.ndarray:
+    """Run a function over slabs of an array in the shared thread pool.
+
+    If the input and output are both contiguous, they are split into
+    runs of their flattened values, so the work is balanced however
+    the array is shaped. Otherwise, they are split along their first
+    axis. When called from a thread of the pool, the function is run
+    on the whole array in that thread, since waiting on the pool from
+    inside it can deadlock.
+
+    :param fn: The function to run. It is given a slab of the input
+        and the matching slab of the output.
+    :param a: The input array.
+    :param out: The output array.
+    :param workers: The number of threads to use.
+    :return: The output as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    src, dst = a, out
+    if a.flags.c_contiguous and out.flags.c_contiguous:
+        src, dst = a.reshape(-1), out.reshape(-1)
+
+    if getattr(_local, 'in_pool', False):
+        fn(src, dst)
+        return out
+
+    slabs = split(len(src), workers)
+    executor = get_executor(workers)
+    futures = [
+        executor.submit(_run_slab, fn, src[slab], dst[slab])
+        for slab in slabs
+    ]
+    for future in futures:
+        future.result()
+    return out
+
+
+def should_split(a: np.ndarray, workers: int) -> bool:
+    """Is the array worth splitting across the given number of threads?"""
+    return workers > 1 and a.ndim > 0 and a.size >= MIN_SPLIT
+
+
+def _run_slab(fn: Callable, src: np.ndarray, dst: np.ndarray) -> None:
+    """Run a function over a slab in a thread of the pool."""
+    _local.in_pool = True
+    try:
+        fn(src, dst)
+    finally:
+        _local.in_pool = False
+
+
+# Process pools.
+class ProcessEaser:
+    """A long-lived pool of processes for easing data.
+
+    Arrays are passed to the worker processes through blocks of shared
+    memory, so only the names of the blocks and the slices to ease are
+    pickled. Each worker looks up the ease by its name in
+    `imgeaser.eases`. Arrays created with :meth:`ProcessEaser.empty`
+    are already in shared memory, so they are eased without being
+    copied.
+
+    The pool should be closed when it is no longer needed, either with
+    :meth:`ProcessEaser.close` or by using it as a context manager.
+
+    :param workers: (Optional.) The number of processes. If it isn't
+        given, all of the cores of the system are used.
+    :param mp_context: (Optional.) The :mod:`multiprocessing` context
+        used to start the processes. It defaults to `spawn`, because
+        forking a process after :mod:`numba` or another library has
+        started its own threads can deadlock the child.
+    :return: None.
+    :rtype: NoneType
+    """
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        mp_context: Optional['BaseContext'] = None
+    ) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+
+        self.workers = workers or os.cpu_count() or 1
+        if mp_context is None:
+            mp_context = get_context('spawn')
+        self._pool = ProcessPoolExecutor(self.workers, mp_context=mp_context)
+        self._blocks: dict[int, 'SharedMemory'] = {}
+
+    def __enter__(self) -> 'ProcessEaser':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # Public methods.
+    def close(self) -> None:
+        """Shut down the processes and release the shared memory
+        created by :meth:`ProcessEaser.empty`.
+
+        Arrays created by :meth:`ProcessEaser.empty` can still be used
+        after the pool is closed. Their memory is freed once they are
+        garbage collected.
+        """
+        self._pool.shutdown()
+        for shm in self._blocks.values():
+            _unlink(shm)
+        self._blocks.clear()
+
+    def empty(
+        self,
+        shape: Sequence[int],
+        dtype: np.dtype = np.dtype(float)
+    ) -> np.ndarray:
+        """Create an array in shared memory.
+
+        Arrays created by this method can be passed to the pool without
+        being copied. The memory is freed when the array is garbage
+        collected.
+
+        :param shape: The shape of the array.
+        :param dtype: (Optional.) The type of the array.
+        :return: The array as a :class:`numpy.ndarray`.
+        :rtype: numpy.ndarray
+        """
+        from multiprocessing.shared_memory import SharedMemory
+
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = SharedMemory(create=True, size=size)
+        a: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        key = a.ctypes.data
+        self._blocks[key] = shm
+        weakref.finalize(a, _free, self._blocks, key, shm)
+        return a
+
+    def ease(
+        self,
+        ease: Union[Callable, str],
+        a: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        value_range: Optional[tuple[float, float]] = None
+    ) -> np.ndarray:
+        """Ease an array, splitting it across the processes.
+
+        The range of the data is found before it is split, so the
+        result is identical to easing the data in one piece.
+
+        :param ease: The ease, or its name in `imgeaser.eases`.
+        :param a: The data to ease.
+        :param out: (Optional.) The array to write the result into.
+        :param value_range: (Optional.) The minimum and maximum values
+            of the data. If it isn't given, the data is scanned to find
+            them.
+        :return: The eased data as a :class:`numpy.ndarray`.
+        :rtype: numpy.ndarray
+        """
+        from imgeaser.utility import _out_dtype, minmax
+
+        name = _ease_name(ease)
+        a = np.asarray(a)
+        if value_range is None:
+            value_range = minmax(a)
+        if out is None:
+            out = np.empty(a.shape, dtype=_out_dtype(a))
+
+        with self._shared(a) as src, self._shared(out, copy=False) as dst:
+            slabs = split(a.size, self.workers)
+            futures = [
+                self._pool.submit(
+                    _ease_block, name, src, dst, (slab,), value_range
+                )
+                for slab in slabs
+            ]
+            for future in futures:
+                future.result()
+        return out
+
+    def map(
+        self,
+        ease: Union[Callable, str],
+        frames: Sequence[np.ndarray],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Ease each frame in a batch of frames separately.
+
+        Each frame is scaled by its own range, the same as calling the
+        ease on each frame in turn.
+
+        :param ease: The ease, or its name in `imgeaser.eases`.
+        :param frames: The frames to ease. This can be a sequence of
+            arrays with the same shape and type, or an array with the
+            frames along its first axis.
+        :param out: (Optional.) The array to write the result into. It
+            has the frames along its first axis.
+        :return: The eased frames as a :class:`numpy.ndarray`.
+        :rtype: numpy.ndarray
+        """
+        from imgeaser.utility import _out_dtype
+
+        name = _ease_name(ease)
+        if isinstance(frames, np.ndarray):
+            batch = frames
+        else:
+            batch = np.stack(frames)
+        if out is None:
+            out = np.empty(batch.shape, dtype=_out_dtype(batch))
+
+        with self._shared(batch) as src, self._shared(out, False) as dst:
+            futures = [
+                self._pool.submit(_ease_block, name, src, dst, (i,), None)
+                for i in range(len(batch))
+            ]
+            for future in futures:
+                future.result()
+        return out
+
+    # Private methods.
+    @contextmanager
+    def _shared(self, a: np.ndarray, copy: bool = True) -> Iterator[tuple]:
+        """Get a block of shared memory holding an array.
+
+        Arrays already in a block owned by the pool are used as they
+        are. Anything else is put in a temporary block, which is copied
+        back into the original array if `copy` is false, because that
+        means the block holds the output.
+        """
+        from multiprocessing.shared_memory import SharedMemory
+
+        key = a.ctypes.data
+        if key in self._blocks and a.flags.c_contiguous:
+            yield (self._blocks[key].name, a.shape, a.dtype.str)
+            return
+
+        shm = SharedMemory(create=True, size=max(a.nbytes, 1))
+        try:
+            b: np.ndarray = np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)
+            if copy:
+                np.copyto(b, a)
+            yield (shm.name, a.shape, a.dtype.str)
+            if not copy:
+                np.copyto(a, b)
+            del b
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def _free(blocks: dict, key: int, shm: 'SharedMemory') -> None:
+    """Free a block of shared memory once its array is gone."""
+    blocks.pop(key, None)
+    shm.close()
+    _unlink(shm)
+
+
+def _unlink(shm: 'SharedMemory') -> None:
+    """Remove a block of shared memory, if it hasn't been already."""
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _ease_name(ease: Union[Callable, str]) -> str:
+    """Get the name of an ease in `imgeaser.eases`."""
+    from imgeaser import eases
+
+    if isinstance(ease, str):
+        name = ease
+    else:
+        name = getattr(ease, '__name__', '').removeprefix('ease_')
+        if eases.get(name) is not ease:
+            name = ''
+    if name not in eases:
+        msg = f'{ease!r} is not in imgeaser.eases.'
+        raise ValueError(msg)
+    return name
+
+
+def _ease_block(
+    name: str,
+    src: tuple,
+    dst: tuple,
+    index: tuple,
+    value_range: Optional[tuple[float, float]]
+) -> None:
+    """Ease part of an array in shared memory in a worker process."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    from imgeaser import eases
+
+    src_shm = SharedMemory(name=src[0])
+    dst_shm = SharedMemory(name=dst[0])
+    try:
+        a: np.ndarray = np.ndarray(src[1], dtype=src[2], buffer=src_shm.buf)
+        out: np.ndarray = np.ndarray(dst[1], dtype=dst[2], buffer=dst_shm.buf)
+        if len(index) == 1 and isinstance(index[0], slice):
+            a, out = a.reshape(-1), out.reshape(-1)
+        eases[name](
+            a[index],
+            out=out[index],
+            value_range=value_range,
+            workers=1
+        )
+        del a, out
+    finally:
+        src_shm.close()
+        dst_shm.close()
@@ -0,0 +1,233 @@
+"""
+poly
+~~~~
+
+An engine for the polynomial eases.
+
+Raising an array to a power with `**` goes through the generic `pow`
+of the C library for each value, and each term of a polynomial written
+with `**` allocates its own temporary array. Here each polynomial ease
+is stored as the coefficients of its pieces. They are evaluated in
+place with Horner's rule, or by repeated squaring for a single power,
+so only multiplications and additions are needed. The data is worked
+through in blocks small enough to stay in cache, with one scratch
+buffer the size of a block.
+"""
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from imgeaser.consts import BACK, BACK_IN_OUT_SCALE
+from imgeaser.utility import piecewise
+
+
+# The number of values evaluated at a time.
+BLOCK = 2 ** 14
+
+
+# Types.
+class Polynomial(NamedTuple):
+    """A polynomial of a linear function of the data, `p(u)` where
+    `u = scale * x + offset`.
+
+    :param coeffs: The coefficients of `p`, from the highest power to
+        the constant.
+    :param scale: (Optional.) The scale of `u`.
+    :param offset: (Optional.) The offset of `u`.
+    """
+    coeffs: tuple[float, ...]
+    scale: float = 1.0
+    offset: float = 0.0
+
+
+# Each piece of a polynomial ease is the upper bound of the data it
+# applies to and its polynomial. The bound of the last piece is `None`.
+Piece = tuple[Optional[float], Polynomial]
+
+
+# Piece builders.
+def in_back(overshoot: float) -> tuple[Piece, ...]:
+    """Get the pieces of a back ease in."""
+    coeffs = (overshoot + 1, -overshoot, 0.0, 0.0)
+    return ((None, Polynomial(coeffs)),)
+
+
+def in_out_back(overshoot: float) -> tuple[Piece, ...]:
+    """Get the pieces of a back ease in and out."""
+    c = overshoot * BACK_IN_OUT_SCALE
+    return (
+        (.5, Polynomial(((c + 1) / 2, -c / 2, 0.0, 0.0), 2.0)),
+        (None, Polynomial(((c + 1) / 2, c / 2, 0.0, 1.0), 2.0, -2.0)),
+    )
+
+
+def in_pow(n: int) -> tuple[Piece, ...]:
+    """Get the pieces of a power ease in."""
+    return ((None, Polynomial((1.0, *[0.0] * n))),)
+
+
+def out_pow(n: int) -> tuple[Piece, ...]:
+    """Get the pieces of a power ease out."""
+    coeffs = (-1.0, *[0.0] * (n - 1), 1.0)
+    return ((None, Polynomial(coeffs, -1.0, 1.0)),)
+
+
+def in_out_pow(n: int) -> tuple[Piece, ...]:
+    """Get the pieces of a power ease in and out."""
+    return (
+        (.5, Polynomial((2.0 ** (n - 1), *[0.0] * n))),
+        (None, Polynomial((-.5, *[0.0] * (n - 1), 1.0), -2.0, 2.0)),
+    )
+
+
+# The pieces of the polynomial eases in :mod:`imgeaser.imgeaser`.
+POLYNOMIALS = {
+    'in_back': in_back(BACK),
+    'in_cubic': in_pow(3),
+    'in_quad': in_pow(2),
+    'in_quint': in_pow(5),
+    'in_out_back': in_out_back(BACK),
+    'in_out_cubic': in_out_pow(3),
+    'in_out_quad': in_out_pow(2),
+    'in_out_quint': in_out_pow(5),
+    'out_cubic': out_pow(3),
+    'out_quad': out_pow(2),
+    'out_quint': out_pow(5),
+}
+
+
+# Evaluation.
+def ease_poly(a: np.ndarray, pieces: Sequence[Piece]) -> np.ndarray:
+    """Perform a polynomial ease in place.
+
+    :param a: The data to ease. It is changed in place.
+    :param pieces: The pieces of the ease.
+    :return: The eased data as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if len(pieces) == 1:
+        return evaluate(a, pieces[0][1])
+
+    branches = []
+    lo = None
+    for hi, poly in pieces:
+        branches.append((_in_piece(lo, hi), _branch(poly)))
+        lo = hi
+    return piecewise(a, branches)
+
+
+def evaluate(a: np.ndarray, poly: Polynomial) -> np.ndarray:
+    """Evaluate a polynomial in place.
+
+    :param a: The values to evaluate it for. They are replaced by the
+        result.
+    :param poly: The polynomial.
+    :return: The result as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if len(poly.coeffs) == 1:
+        a.fill(poly.coeffs[0])
+        return a
+
+    # Squares and lower powers don't need a scratch buffer, so they
+    # don't need to be split into blocks.
+    lead, *middle, const = poly.coeffs
+    if len(poly.coeffs) <= 3 and not any(middle):
+        _evaluate(a, poly, None)
+        return a
+    if not a.flags.c_contiguous:
+        _evaluate(a, poly, np.empty_like(a))
+        return a
+
+    flat = a.reshape(-1)
+    scratch = np.empty(min(BLOCK, flat.size), dtype=a.dtype)
+    for start in range(0, flat.size, BLOCK):
+        block = flat[start:start + BLOCK]
+        _evaluate(block, poly, scratch[:block.size])
+    return a
+
+
+def _evaluate(
+    u: np.ndarray,
+    poly: Polynomial,
+    acc: Optional[np.ndarray]
+) -> None:
+    """Evaluate a polynomial in place, using a scratch array the same
+    size as the values.
+    """
+    coeffs, scale, offset = poly
+    if scale == -1:
+        np.subtract(offset, u, out=u)
+    else:
+        if scale != 1:
+            u *= scale
+        if offset:
+            u += offset
+
+    # A single power plus a constant is found by repeated squaring.
+    lead, *middle, const = coeffs
+    if not any(middle):
+        _power(u, len(coeffs) - 1, acc)
+        if lead == -1:
+            np.subtract(const, u, out=u)
+            return
+        if lead != 1:
+            u *= lead
+        if const:
+            u += const
+        return
+
+    # Anything else is found with Horner's rule. The last step writes
+    # into the values, so no copy of the result is needed.
+    if acc is None:
+        acc = np.empty_like(u)
+    np.multiply(u, lead, out=acc)
+    for c in middle[:-1]:
+        if c:
+            acc += c
+        acc *= u
+    if middle[-1]:
+        acc += middle[-1]
+    np.multiply(acc, u, out=u)
+    if const:
+        u += const
+
+
+def _power(u: np.ndarray, n: int, acc: Optional[np.ndarray]) -> None:
+    """Raise values to a positive integer power in place by repeated
+    squaring, using a scratch array the same size as the values.
+    """
+    if n == 1:
+        return
+    if n == 2:
+        np.multiply(u, u, out=u)
+        return
+
+    if acc is None:
+        acc = np.empty_like(u)
+    np.copyto(acc, u)
+    for bit in bin(n)[3:]:
+        np.multiply(u, u, out=u)
+        if bit == '1':
+            np.multiply(u, acc, out=u)
+
+
+def _branch(poly: Polynomial):
+    """Get the branch of :func:`imgeaser.utility.piecewise` that
+    evaluates a polynomial.
+    """
+    def branch(a):
+        evaluate(a, poly)
+
+    return branch
+
+
+def _in_piece(lo: Optional[float], hi: Optional[float]):
+    """Get the condition of :func:`imgeaser.utility.piecewise` for the
+    data between two bounds.
+    """
+    if lo is None:
+        return lambda a: a < hi
+    if hi is None:
+        return lambda a: a >= lo
+    return lambda a: (a >= lo) & (a < hi)
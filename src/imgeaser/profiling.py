@@ -0,0 +1,228 @@
+"""
+profiling
+~~~~~~~~~
+
+Optional instrumentation for the eases.
+
+When a hook is registered with :func:`add_hook`, every call to an ease
+is timed in stages, such as scanning the data for its range, scaling
+it, building the masks of a piecewise ease, performing the math, and
+unscaling it. When the call finishes, each hook is given a
+:class:`CallRecord` describing it. :class:`Profile` is a context
+manager that registers a hook and gathers the records into aggregate
+statistics for each ease.
+
+When no hooks are registered, the eases only check whether the list
+of hooks is empty, so the instrumentation costs nothing.
+"""
+import threading
+from collections import defaultdict
+from time import perf_counter
+from typing import Callable, Optional
+
+
+# The registered hooks. The eases check this list is empty before
+# doing any profiling work.
+hooks: list[Callable] = []
+
+# The call being profiled in each thread.
+_local = threading.local()
+
+# Marks threads whose calls shouldn't be recorded, because they are
+# part of a call that is already being recorded.
+_MUTED = object()
+
+
+# Records.
+class CallRecord:
+    """A record of a call to an ease.
+
+    :param ease: The name of the ease.
+    :param shape: The shape of the data.
+    :param dtype: The type of the data.
+    :param nbytes: The number of bytes of data read and written.
+    :return: None.
+    :rtype: NoneType
+    """
+    def __init__(
+        self,
+        ease: str,
+        shape: tuple,
+        dtype: str,
+        nbytes: int
+    ) -> None:
+        self.ease = ease
+        self.shape = shape
+        self.dtype = dtype
+        self.nbytes = nbytes
+        self.scaled = False
+        self.stages: dict[str, float] = {}
+        self._last = perf_counter()
+
+    def __repr__(self) -> str:
+        name = self.__class__.__name__
+        return (
+            f'{name}(ease={self.ease!r}, shape={self.shape!r}, '
+            f'dtype={self.dtype!r}, nbytes={self.nbytes!r}, '
+            f'scaled={self.scaled!r}, stages={self.stages!r})'
+        )
+
+    @property
+    def seconds(self) -> float:
+        """The total time of the call in seconds."""
+        return sum(self.stages.values())
+
+    def mark(self, stage: str) -> None:
+        """Add the time since the last mark to a stage.
+
+        :param stage: The name of the stage that just finished.
+        :return: None.
+        :rtype: NoneType
+        """
+        now = perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self._last
+        self._last = now
+
+
+# Hook registry.
+def add_hook(hook: Callable) -> None:
+    """Register a function to be called with the :class:`CallRecord`
+    of every call to an ease.
+
+    Hooks can be called from any thread that eases data.
+
+    :param hook: The function to register.
+    :return: None.
+    :rtype: NoneType
+    """
+    hooks.append(hook)
+
+
+def remove_hook(hook: Callable) -> None:
+    """Stop calling a registered function.
+
+    :param hook: The function to remove.
+    :return: None.
+    :rtype: NoneType
+    """
+    hooks.remove(hook)
+
+
+# Functions used by the eases.
+def begin(
+    ease: str,
+    shape: tuple,
+    dtype: str,
+    nbytes: int
+) -> Optional[CallRecord]:
+    """Start recording a call to an ease.
+
+    Calls made while another call is being recorded in the same thread
+    are part of that call, so they aren't recorded separately.
+
+    :param ease: The name of the ease.
+    :param shape: The shape of the data.
+    :param dtype: The type of the data.
+    :param nbytes: The number of bytes of data read and written.
+    :return: The record as a :class:`CallRecord` or `None` if the call
+        shouldn't be recorded.
+    :rtype: imgeaser.profiling.CallRecord
+    """
+    if getattr(_local, 'call', None) is not None:
+        return None
+    call = CallRecord(ease, shape, dtype, nbytes)
+    _local.call = call
+    return call
+
+
+def end(call: CallRecord) -> None:
+    """Finish recording a call to an ease and pass it to the hooks.
+
+    :param call: The record of the call.
+    :return: None.
+    :rtype: NoneType
+    """
+    _local.call = None
+    for hook in list(hooks):
+        hook(call)
+
+
+def current() -> Optional[CallRecord]:
+    """Get the record of the call being recorded in this thread."""
+    call = getattr(_local, 'call', None)
+    return None if call is _MUTED else call
+
+
+def muted(fn: Callable) -> Callable:
+    """Wrap a function so calls to eases it makes in another thread
+    aren't recorded.
+    """
+    def wrapper(*args, **kwargs):
+        last = getattr(_local, 'call', None)
+        _local.call = _MUTED
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.call = last
+    return wrapper
+
+
+# Aggregation.
+class Profile:
+    """Gather statistics for the calls to the eases made while the
+    context is open.
+
+    The records of the calls are kept in :attr:`Profile.records`, and
+    :attr:`Profile.stats` sums them up for each ease.
+
+    :return: None.
+    :rtype: NoneType
+    """
+    def __init__(self) -> None:
+        self.records: list[CallRecord] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'Profile':
+        add_hook(self.record)
+        return self
+
+    def __exit__(self, *args) -> None:
+        remove_hook(self.record)
+
+    @property
+    def stats(self) -> dict[str, dict]:
+        """The statistics for each ease, by the name of the ease. Each
+        has the number of calls, the total seconds, the total seconds
+        of each stage, the total bytes touched, and the number of calls
+        that scaled the data.
+        """
+        stats: dict[str, dict] = {}
+        with self._lock:
+            records = list(self.records)
+        for record in records:
+            stat = stats.setdefault(record.ease, {
+                'calls': 0,
+                'seconds': 0.0,
+                'stages': defaultdict(float),
+                'nbytes': 0,
+                'scaled': 0,
+            })
+            stat['calls'] += 1
+            stat['seconds'] += record.seconds
+            stat['nbytes'] += record.nbytes
+            stat['scaled'] += record.scaled
+            for stage, seconds in record.stages.items():
+                stat['stages'][stage] += seconds
+        for stat in stats.values():
+            stat['stages'] = dict(stat['stages'])
+        return stats
+
+    def record(self, call: CallRecord) -> None:
+        """Keep the record of a call.
+
+        :param call: The record of the call.
+        :return: None.
+        :rtype: NoneType
+        """
+        with self._lock:
+            self.records.append(call)
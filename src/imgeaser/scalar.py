@@ -0,0 +1,237 @@
+"""
+scalar
+~~~~~~
+
+The eases for single values, such as the time of an animation.
+
+Calling an array ease on one value still converts it to an array,
+finds its range, and goes through :mod:`numpy` for each step, which
+costs microseconds for a single multiplication. The eases here take a
+:class:`float` from zero to one and use only :mod:`math` and the
+arithmetic of :class:`float`, so they cost a fraction of that.
+
+Each ease performs the same operations in the same order as the array
+version, so for values from zero to one the result is identical to
+the array version with `assume_normalized=True`. The exceptions are
+the eases in :data:`POWER_OF_TWO`. On processors where :mod:`numpy`
+raises to a power with its own vectorized code, their results can
+differ from the array version in the last bit. Values outside of zero
+to one are eased by the same math, but where :mod:`numpy` returns
+`nan` or `inf` the functions of :mod:`math` raise an error.
+
+The eases here are also the kernels that :mod:`imgeaser.jit` compiles,
+and their constants are in :mod:`imgeaser.consts`, shared with the
+array versions.
+"""
+import math
+
+from imgeaser.consts import (
+    BACK,
+    BACK_IN_OUT_SCALE,
+    BOUNCE_D,
+    BOUNCE_N,
+    ELASTIC_C4,
+    ELASTIC_C5
+)
+
+
+# Constants.
+BACK_IN = BACK + 1
+BACK_IN_OUT = BACK * BACK_IN_OUT_SCALE
+BACK_IN_OUT_LEAD = (BACK_IN_OUT + 1) / 2
+BACK_IN_OUT_MID = BACK_IN_OUT / 2
+PI = math.pi
+
+# The eases that raise two to a power.
+POWER_OF_TWO = ('in_elastic', 'in_out_elastic', 'out_elastic')
+
+
+# Ease in functions.
+def ease_in_back(t: float) -> float:
+    """Back up a little before starting."""
+    return (t * BACK_IN - BACK) * t * t
+
+
+def ease_in_circ(t: float) -> float:
+    """Ease in along a circular curve."""
+    return 1 - math.sqrt(1 - t * t)
+
+
+def ease_in_cubic(t: float) -> float:
+    """Ease in with a cubic curve."""
+    return t * t * t
+
+
+def ease_in_elastic(t: float) -> float:
+    """Bounce before starting."""
+    if t == 0 or t == 1:
+        return t
+    wave = math.sin((t * 10 - 10.75) * ELASTIC_C4)
+    return -(2 ** (t * 10 - 10)) * wave
+
+
+def ease_in_quad(t: float) -> float:
+    """Ease in with a quadratic curve."""
+    return t * t
+
+
+def ease_in_quint(t: float) -> float:
+    """Ease in with a quintic curve."""
+    u = t * t
+    u = u * u
+    return u * t
+
+
+def ease_in_sin(t: float) -> float:
+    """Ease in with a sine curve."""
+    return 1 - math.cos(t * PI / 2)
+
+
+# Ease out functions.
+def ease_out_bounce(t: float) -> float:
+    """Bounce before stopping."""
+    if t < 1 / BOUNCE_D:
+        return t * t * BOUNCE_N
+    if t < 2 / BOUNCE_D:
+        u = t - 1.5 / BOUNCE_D
+        return u * u * BOUNCE_N + .75
+    if t < 2.5 / BOUNCE_D:
+        u = t - 2.25 / BOUNCE_D
+        return u * u * BOUNCE_N + .9375
+    u = t - 2.625 / BOUNCE_D
+    return u * u * BOUNCE_N + .984375
+
+
+def ease_out_circ(t: float) -> float:
+    """Ease out along a circular curve."""
+    u = t - 1
+    return math.sqrt(1 - u * u)
+
+
+def ease_out_cubic(t: float) -> float:
+    """Ease out with a cubic curve."""
+    u = 1 - t
+    return 1 - u * u * u
+
+
+def ease_out_elastic(t: float) -> float:
+    """Bounce after stopping."""
+    if t == 0 or t == 1:
+        return t
+    wave = math.sin((t * 10 - .75) * ELASTIC_C4)
+    return 2 ** (t * -10) * wave + 1
+
+
+def ease_out_quad(t: float) -> float:
+    """Ease out with a quadratic curve."""
+    u = 1 - t
+    return 1 - u * u
+
+
+def ease_out_quint(t: float) -> float:
+    """Ease out with a quintic curve."""
+    u = 1 - t
+    v = u * u
+    v = v * v
+    return 1 - v * u
+
+
+def ease_out_sin(t: float) -> float:
+    """Ease out with a sine curve."""
+    return math.sin(t * PI / 2)
+
+
+# Ease in and out functions.
+def ease_in_out_back(t: float) -> float:
+    """Back up a little before starting and overshoot before
+    stopping.
+    """
+    u = t * 2
+    if t < .5:
+        return (u * BACK_IN_OUT_LEAD - BACK_IN_OUT_MID) * u * u
+    u = u - 2
+    return (u * BACK_IN_OUT_LEAD + BACK_IN_OUT_MID) * u * u + 1
+
+
+def ease_in_out_circ(t: float) -> float:
+    """Ease in and out along circular curves."""
+    if t < .5:
+        u = t * 2
+        return (1 - math.sqrt(1 - u * u)) / 2
+    u = t * -2 + 2
+    return (math.sqrt(1 - u * u) + 1) / 2
+
+
+def ease_in_out_cos(t: float) -> float:
+    """Ease in and out with a cosine curve."""
+    return (math.sin(t * PI) - 1) * -1 / 2
+
+
+def ease_in_out_cubic(t: float) -> float:
+    """Ease in and out with cubic curves."""
+    if t < .5:
+        return t * t * t * 4.0
+    u = t * -2.0 + 2.0
+    return u * u * u * -.5 + 1.0
+
+
+def ease_in_out_elastic(t: float) -> float:
+    """Bounce before starting and after stopping."""
+    if 0 < t < .5:
+        wave = math.sin((t * 20 - 11.125) * ELASTIC_C5)
+        return -(2 ** (t * 20 - 10) * wave) / 2
+    if .5 <= t < 1:
+        wave = math.sin((t * 20 - 11.125) * ELASTIC_C5)
+        return 2 ** (t * -20 + 10) * wave / 2 + 1
+    return t
+
+
+def ease_in_out_quad(t: float) -> float:
+    """Ease in and out with quadratic curves."""
+    if t < .5:
+        return t * t * 2.0
+    u = t * -2.0 + 2.0
+    return u * u * -.5 + 1.0
+
+
+def ease_in_out_quint(t: float) -> float:
+    """Ease in and out with quintic curves."""
+    if t < .5:
+        u = t * t
+        u = u * u
+        return u * t * 16.0
+    u = t * -2.0 + 2.0
+    v = u * u
+    v = v * v
+    return v * u * -.5 + 1.0
+
+
+def ease_in_out_sin(t: float) -> float:
+    """Ease in and out with a sine curve."""
+    return (math.cos(t * PI) - 1) * -1 / 2
+
+
+# Ease mid functions.
+def ease_mid_bump_linear(t: float) -> float:
+    """Rise linearly to a peak in the middle and fall back."""
+    u = abs(t - .5)
+    return (.25 - u) * 4 if u < .25 else 0.0
+
+
+def ease_mid_bump_sin(t: float) -> float:
+    """Rise along a sine curve to a peak in the middle and fall
+    back.
+    """
+    # The other eases are inlined, since the compiled kernels can't
+    # call functions that aren't compiled.
+    u = abs(t - .5)
+    u = (.25 - u) * 4 if u < .25 else 0.0
+    return (math.cos(u * PI) - 1) * -1 / 2
+
+
+# The eases by their names in `imgeaser.eases`.
+eases = {
+    name.removeprefix('ease_'): fn
+    for name, fn in sorted(globals().items())
+    if name.startswith('ease_')
+}
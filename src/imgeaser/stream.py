@@ -0,0 +1,132 @@
+"""
+stream
+~~~~~~
+
+Easing a stream of frames, such as the frames of a video.
+
+Calling an ease on each frame allocates a new array for every frame
+and scans every frame for its range. :func:`ease_stream` eases the
+frames into a small ring of arrays that are reused, carries one range
+across all of the frames, and can ease the next frame in another
+thread while the current one is being used.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from imgeaser.utility import minmax
+
+
+# Stream functions.
+def ease_stream(
+    frames: Iterable[np.ndarray],
+    ease: Union[Callable, str],
+    buffers: int = 2,
+    prefetch: bool = False,
+    value_range: Optional[tuple[float, float]] = None,
+    rescan: bool = False,
+    **kwargs
+) -> Iterator[np.ndarray]:
+    """Ease each frame of a stream.
+
+    The eased frames are written into a ring of `buffers` arrays that
+    are reused, so a frame that is yielded is overwritten when the
+    frame `buffers` frames later is eased. With `prefetch`, the next
+    frame is eased while the current one is in use, so a frame is
+    overwritten one frame sooner. Copy frames that need to be kept
+    longer. If the shape or type of the frames changes, a new ring is
+    allocated.
+
+    Every frame is scaled from the same range. It is `value_range` if
+    it's given, or the range of the first frame. This also lets integer
+    frames share one lookup table.
+
+    :param frames: The frames to ease. Any iterable of arrays works,
+        and it is only read as the eased frames are needed.
+    :param ease: The ease, or its name in `imgeaser.eases`.
+    :param buffers: (Optional.) The number of arrays in the ring.
+    :param prefetch: (Optional.) Whether to ease the next frame in
+        another thread while the current one is being used.
+    :param value_range: (Optional.) The range to scale every frame
+        from.
+    :param rescan: (Optional.) Whether to scale each frame from its own
+        range instead.
+    :param kwargs: (Optional.) Keyword arguments for the ease.
+    :return: The eased frames as an iterator.
+    :rtype: Iterator
+    """
+    if isinstance(ease, str):
+        from imgeaser import eases
+        if ease not in eases:
+            msg = f'{ease!r} is not in imgeaser.eases.'
+            raise ValueError(msg)
+        ease = eases[ease]
+    if buffers < 1 + prefetch:
+        need = 'two buffers with prefetch' if prefetch else 'one buffer'
+        msg = f'The stream needs at least {need}.'
+        raise ValueError(msg)
+    return _stream(
+        iter(frames),
+        ease,
+        buffers,
+        prefetch,
+        value_range,
+        rescan,
+        kwargs
+    )
+
+
+def _stream(
+    frames: Iterator[np.ndarray],
+    ease: Callable,
+    buffers: int,
+    prefetch: bool,
+    value_range: Optional[tuple[float, float]],
+    rescan: bool,
+    kwargs: dict
+) -> Iterator[np.ndarray]:
+    """Ease each frame of a stream. See :func:`ease_stream`."""
+    ring: list[np.ndarray] = []
+    key = None
+    count = 0
+
+    def ease_next() -> Optional[np.ndarray]:
+        """Ease the next frame into the next array of the ring."""
+        nonlocal value_range, key, count
+        frame = next(frames, None)
+        if frame is None:
+            return None
+        frame = np.asarray(frame)
+
+        if rescan:
+            span = None
+        else:
+            if value_range is None and not kwargs.get('assume_normalized'):
+                value_range = minmax(frame)
+            span = value_range
+
+        if key != (frame.shape, frame.dtype):
+            key = (frame.shape, frame.dtype)
+            ring.clear()
+            count = 0
+        i = count % buffers
+        count += 1
+        out = ring[i] if i < len(ring) else None
+        result = ease(frame, out=out, value_range=span, **kwargs)
+        if out is None:
+            ring.append(result)
+        return result
+
+    if not prefetch:
+        while (result := ease_next()) is not None:
+            yield result
+        return
+
+    # The thread is the stream's own, so the ease can still split its
+    # work across the shared pool.
+    with ThreadPoolExecutor(1, thread_name_prefix='imgeaser-stream') as pool:
+        future = pool.submit(ease_next)
+        while (result := future.result()) is not None:
+            future = pool.submit(ease_next)
+            yield result
@@ -0,0 +1,265 @@
+"""
+tween
+~~~~~
+
+Animating many values at once.
+
+A tween moves a value from a start to an end over a duration, eased
+by one of the eases. Animating thousands of values by easing each one
+separately spends nearly all of its time calling the eases.
+:class:`TweenStore` keeps each field of its tweens in its own array,
+groups the tweens by their ease, and eases each group with one call
+on every tick, writing the current values into one contiguous array.
+
+Tweens that have finished are removed on the next tick by moving the
+tweens that remain to the front of the arrays, so the arrays are only
+reallocated when the store grows past its capacity.
+"""
+from typing import Callable, Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+# The default number of tweens a store has room for.
+CAPACITY = 1024
+
+# The rows of the fields of the tweens in the store.
+BEGIN, DURATION, START, CHANGE = range(4)
+
+
+# Stores.
+class TweenStore:
+    """A store of tweens that are all advanced with one call.
+
+    The current values are returned by :meth:`TweenStore.tick` in the
+    order of :attr:`TweenStore.ids`. Since finished tweens are removed,
+    a tween doesn't keep its position, so look tweens up by their IDs.
+    The arrays returned by the store are views of its memory, so they
+    are only valid until the next call to one of its methods.
+
+    :param capacity: (Optional.) The number of tweens to allocate room
+        for. The store grows if more are added.
+    :return: None.
+    :rtype: NoneType
+    """
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        capacity = max(capacity, 1)
+        self._size = 0
+        self._next_id = 0
+        self._fields = np.empty((4, capacity))
+        self._codes = np.empty(capacity, dtype=np.intp)
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._t = np.empty(capacity)
+        self._values = np.zeros(capacity)
+        self._done = np.zeros(capacity, dtype=bool)
+        self._scratch = np.empty(capacity)
+        self._eases: list[Callable] = []
+        self._ease_codes: dict[Callable, int] = {}
+        self._groups: Optional[list[tuple]] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    # Properties.
+    @property
+    def capacity(self) -> int:
+        """The number of tweens the store has room for."""
+        return len(self._ids)
+
+    @property
+    def done(self) -> np.ndarray:
+        """Which tweens reached their end on the last tick. They are
+        removed on the next tick.
+        """
+        return self._done[:self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        """The IDs of the tweens in the order of their values."""
+        return self._ids[:self._size]
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values of the tweens from the last tick."""
+        return self._values[:self._size]
+
+    # Public methods.
+    def add(
+        self,
+        start: float,
+        end: float,
+        begin: float,
+        duration: float,
+        ease: Union[Callable, str]
+    ) -> int:
+        """Add a tween.
+
+        :param start: The value at the beginning of the tween.
+        :param end: The value at the end of the tween.
+        :param begin: The time the tween begins.
+        :param duration: How long the tween lasts. It must be greater
+            than zero.
+        :param ease: The ease, or its name in `imgeaser.eases`.
+        :return: The ID of the tween as an :class:`int`.
+        :rtype: int
+        """
+        return int(self.add_many(start, end, begin, duration, ease)[0])
+
+    def add_many(
+        self,
+        start: ArrayLike,
+        end: ArrayLike,
+        begin: ArrayLike,
+        duration: ArrayLike,
+        ease: Union[Callable, str]
+    ) -> np.ndarray:
+        """Add tweens that share an ease.
+
+        The fields are broadcast against each other, so tweens that
+        share a field can be given it once.
+
+        :param start: The values at the beginning of the tweens.
+        :param end: The values at the end of the tweens.
+        :param begin: The times the tweens begin.
+        :param duration: How long the tweens last. They must be greater
+            than zero.
+        :param ease: The ease, or its name in `imgeaser.eases`.
+        :return: The IDs of the tweens as a :class:`numpy.ndarray`.
+        :rtype: numpy.ndarray
+        """
+        code = self._get_code(ease)
+        start, end, begin, duration = np.broadcast_arrays(
+            *(np.ravel(x).astype(float) for x in (start, end, begin, duration))
+        )
+        if not (duration > 0).all():
+            msg = 'The durations of tweens must be greater than zero.'
+            raise ValueError(msg)
+
+        count = len(start)
+        i, j = self._size, self._size + count
+        if j > self.capacity:
+            self._grow(j)
+        fields = self._fields
+        fields[BEGIN, i:j] = begin
+        fields[DURATION, i:j] = duration
+        fields[START, i:j] = start
+        np.subtract(end, start, out=fields[CHANGE, i:j])
+        self._codes[i:j] = code
+        self._ids[i:j] = np.arange(self._next_id, self._next_id + count)
+        self._values[i:j] = start
+        self._done[i:j] = False
+        self._size = j
+        self._next_id += count
+        self._groups = None
+        return self._ids[i:j].copy()
+
+    def cancel(self, ids: Union[int, np.ndarray]) -> None:
+        """Stop tweens before they reach their end. They are removed on
+        the next tick.
+
+        :param ids: The IDs of the tweens.
+        :return: None.
+        :rtype: NoneType
+        """
+        n = self._size
+        self._done[:n] |= np.isin(self._ids[:n], ids)
+
+    def tick(self, now: float) -> np.ndarray:
+        """Advance the tweens to a time.
+
+        Tweens that haven't begun are held at their start, and tweens
+        that have ended are held at their end and marked as done.
+
+        :param now: The time.
+        :return: The values of the tweens as a :class:`numpy.ndarray`.
+        :rtype: numpy.ndarray
+        """
+        self._compact()
+        n = self._size
+        t = self._t[:n]
+        values = self._values[:n]
+        begin, duration, start, change = self._fields[:, :n]
+
+        np.subtract(now, begin, out=t)
+        np.divide(t, duration, out=t)
+        np.clip(t, 0.0, 1.0, out=t)
+        np.greater_equal(t, 1.0, out=self._done[:n])
+
+        for ease, index in self._get_groups():
+            if index is None:
+                ease(t, out=t, assume_normalized=True)
+                continue
+            group = self._scratch[:len(index)]
+            np.take(t, index, out=group)
+            ease(group, out=group, assume_normalized=True)
+            t[index] = group
+
+        np.multiply(t, change, out=values)
+        values += start
+        return values
+
+    # Private methods.
+    def _compact(self) -> None:
+        """Move the tweens that aren't done to the front of the store."""
+        n = self._size
+        done = self._done[:n]
+        if not done.any():
+            return
+        keep = ~done
+        m = n - int(done.sum())
+        self._fields[:, :m] = self._fields[:, :n][:, keep]
+        self._codes[:m] = self._codes[:n][keep]
+        self._ids[:m] = self._ids[:n][keep]
+        self._values[:m] = self._values[:n][keep]
+        self._done[:m] = False
+        self._size = m
+        self._groups = None
+
+    def _get_code(self, ease: Union[Callable, str]) -> int:
+        """Get the code of an ease in the store, adding it if needed."""
+        if isinstance(ease, str):
+            from imgeaser import eases
+            if ease not in eases:
+                msg = f'{ease!r} is not in imgeaser.eases.'
+                raise ValueError(msg)
+            ease = eases[ease]
+        if ease not in self._ease_codes:
+            self._ease_codes[ease] = len(self._eases)
+            self._eases.append(ease)
+        return self._ease_codes[ease]
+
+    def _get_groups(self) -> list[tuple]:
+        """Get each ease in use and the indices of its tweens, or `None`
+        for the indices if every tween uses that ease. The groups are
+        kept until tweens are added or removed.
+        """
+        if self._groups is not None:
+            return self._groups
+
+        codes = self._codes[:self._size]
+        order = np.argsort(codes, kind='stable')
+        used, starts = np.unique(codes[order], return_index=True)
+        if len(used) == 1:
+            self._groups = [(self._eases[used[0]], None)]
+        else:
+            bounds = [*starts, len(order)]
+            self._groups = [
+                (self._eases[code], order[lo:hi])
+                for code, lo, hi in zip(used, bounds, bounds[1:])
+            ]
+        return self._groups
+
+    def _grow(self, size: int) -> None:
+        """Reallocate the store with room for at least the given number
+        of tweens.
+        """
+        n = self._size
+        capacity = max(size, 2 * self.capacity)
+        for name in ('_fields', '_codes', '_ids', '_values', '_done'):
+            old = getattr(self, name)
+            new = np.zeros((*old.shape[:-1], capacity), dtype=old.dtype)
+            new[..., :n] = old[..., :n]
+            setattr(self, name, new)
+        self._t = np.empty(capacity)
+        self._scratch = np.empty(capacity)
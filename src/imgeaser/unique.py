@@ -0,0 +1,345 @@
+"""
+unique
+~~~~~~
+
+Easing data with few distinct values.
+
+Masks, posterized renders, and label images can have only a few
+hundred distinct values spread over millions of pixels. Easing each
+distinct value once and gathering the results for every pixel makes
+the math of the ease scale with the number of distinct values rather
+than the number of pixels.
+
+:func:`numpy.unique` finds the distinct values and the index of each
+pixel's value by sorting all of the data, which takes longer than most
+of the eases. Instead, the distinct values are found in a sample of
+the data, and the index of each pixel's value is looked up in a
+perfect hash of the bits of those values, built by hashing and
+displacing. The lookup is a few ufuncs and gathers over each block of
+the data, and each pixel's value is checked against the value found
+for it. Pixels with values that weren't in the sample are eased
+directly. The eases work on each value by itself, so the result is
+identical to easing every pixel.
+
+The lookup costs about as much as the cheaper eases, so it is only
+used automatically for the eases in :data:`COSTS` that cost more, and
+only on data large enough and with few enough distinct values that
+finding them and building the hash doesn't outweigh the savings. The
+costs and thresholds were found with `python -m imgeaser.bench
+--unique`.
+"""
+from typing import Callable, NamedTuple, Optional
+
+import numpy as np
+
+from imgeaser.parallel import map_slabs, should_split
+
+
+# The smallest array eased through its distinct values automatically.
+# Below it, finding the distinct values costs about as much as it
+# saves.
+MIN_SIZE = 2 ** 19
+
+# The number of values sampled to find the distinct values.
+SAMPLE_SIZE = 2 ** 16
+
+# The most distinct values in the sample for the data to be eased
+# through its distinct values automatically. Data with more usually
+# has many more than the sample finds.
+MAX_KEYS = 2 ** 12
+
+# The number of values looked up at a time.
+BLOCK = 2 ** 14
+
+# The time of the lookup of each value, in nanoseconds.
+LOOKUP_COST = 15.0
+
+# The time it takes to add each distinct value to the hash, in
+# nanoseconds.
+BUILD_COST = 2000.0
+
+# The time of each ease for each value, in nanoseconds, for float64 and
+# float32 data. Integer data that is too wide for a lookup table is
+# eased in float64, then rounded.
+COSTS = {
+    'in_back': (5, 3),
+    'in_circ': (5, 3),
+    'in_cubic': (5, 2),
+    'in_elastic': (42, 13),
+    'in_out_back': (28, 28),
+    'in_out_circ': (36, 28),
+    'in_out_cos': (20, 3),
+    'in_out_cubic': (30, 23),
+    'in_out_elastic': (104, 33),
+    'in_out_quad': (39, 23),
+    'in_out_quint': (29, 23),
+    'in_out_sin': (22, 3),
+    'in_quad': (3, 1),
+    'in_quint': (5, 2),
+    'in_sin': (17, 3),
+    'mid_bump_linear': (31, 22),
+    'mid_bump_sin': (48, 27),
+    'out_bounce': (53, 33),
+    'out_circ': (6, 2),
+    'out_cubic': (8, 2),
+    'out_elastic': (52, 11),
+    'out_quad': (5, 2),
+    'out_quint': (8, 3),
+    'out_sin': (23, 3),
+}
+
+# The number of sets of multipliers tried when building a hash.
+TRIES = 8
+
+# The first multipliers of the two hashes, and the step between the
+# multipliers of each try.
+_MULTIPLIERS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F)
+_STEP = 0x165667B19E3779F9
+
+
+# Types.
+class Hash(NamedTuple):
+    """A perfect hash of the bits of the distinct values of some data.
+
+    The slot of a value is the second hash of its bits, XORed with the
+    displacement of the bucket picked by the first hash.
+
+    :param keys: The bits of the distinct values, sorted.
+    :param mult: The multipliers of the first and second hash.
+    :param shift: The shifts of the first and second hash.
+    :param disp: The displacement of each bucket.
+    :param table: The index in `keys` of the value in each slot.
+    """
+    keys: np.ndarray
+    mult: tuple
+    shift: tuple
+    disp: np.ndarray
+    table: np.ndarray
+
+
+# Heuristics.
+def get_cost(fn: Callable, dtype: np.dtype) -> Optional[float]:
+    """Get the time an ease takes for each value of a type.
+
+    :param fn: The ease, decorated or not.
+    :param dtype: The type of the data.
+    :return: The time in nanoseconds as a :class:`float` or `None` if
+        it isn't known.
+    :rtype: float
+    """
+    fn = getattr(fn, '__wrapped__', fn)
+    if getattr(fn, '__module__', None) != 'imgeaser.imgeaser':
+        return None
+    costs = COSTS.get(fn.__name__.removeprefix('ease_'))
+    if costs is None:
+        return None
+    return costs[1] if dtype == np.float32 else costs[0]
+
+
+def can_unique(a: np.ndarray, out: Optional[np.ndarray]) -> bool:
+    """Can the given array be eased through its distinct values? Narrow
+    integer types are eased through a lookup table instead.
+    """
+    kind, itemsize = a.dtype.kind, a.dtype.itemsize
+    return (
+        (kind == 'f' and itemsize in (2, 4, 8)
+         or kind in 'iu' and itemsize in (4, 8))
+        and a.flags.c_contiguous
+        and (out is None or (out.dtype == a.dtype and out.flags.c_contiguous))
+    )
+
+
+def get_key_limit(fn: Callable, a: np.ndarray) -> int:
+    """Get the most distinct values an array can have for easing it
+    through them to be faster than easing each value.
+
+    :param fn: The ease, decorated or not.
+    :param a: The data.
+    :return: The number of values as an :class:`int`. It's zero if
+        easing through the distinct values isn't likely to be faster
+        however few there are.
+    :rtype: int
+    """
+    cost = get_cost(fn, a.dtype)
+    if cost is None or a.size < MIN_SIZE or cost <= LOOKUP_COST:
+        return 0
+    saved = a.size * (cost - LOOKUP_COST)
+    return int(min(MAX_KEYS, saved // BUILD_COST))
+
+
+# Hash functions.
+def find_keys(a: np.ndarray, limit: int = MAX_KEYS) -> Optional[np.ndarray]:
+    """Find the bits of the distinct values in a sample of an array.
+
+    :param a: The data.
+    :param limit: (Optional.) The most distinct values to find.
+    :return: The bits of the distinct values, sorted, as a
+        :class:`numpy.ndarray`, or `None` if the sample had more than
+        the limit.
+    :rtype: numpy.ndarray
+    """
+    bits = _bits(a.reshape(-1))
+    step = max(bits.size // SAMPLE_SIZE, 1)
+    keys = np.unique(bits[::step])
+    if len(keys) > limit:
+        return None
+    return keys
+
+
+def build_hash(keys: np.ndarray) -> Optional[Hash]:
+    """Build a perfect hash of the bits of distinct values.
+
+    Each key is put in a bucket by the first hash. The buckets are
+    placed from the largest, each with the first displacement that
+    moves all of its keys from their second hash to empty slots. If
+    two keys in a bucket share their second hash, no displacement can
+    separate them, so the hash is tried again with other multipliers.
+
+    :param keys: The bits of the distinct values, sorted.
+    :return: The hash as a :class:`Hash` or `None` if one couldn't be
+        built.
+    :rtype: imgeaser.unique.Hash
+    """
+    udtype = keys.dtype
+    width = udtype.itemsize * 8
+    size = max(len(keys), 2).bit_length() + 1
+    if size > width:
+        return None
+    shift = (udtype.type(width - size + 1), udtype.type(width - size))
+    for attempt in range(TRIES):
+        mult = tuple(
+            udtype.type((m + attempt * _STEP | 1) % 2 ** width)
+            for m in _MULTIPLIERS
+        )
+        placed = _place(keys, mult, shift, size)
+        if placed is not None:
+            return Hash(keys, mult, shift, *placed)
+    return None
+
+
+def _place(
+    keys: np.ndarray,
+    mult: tuple,
+    shift: tuple,
+    size: int
+) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """Find the displacements and table of a hash, or `None` if the
+    keys can't all be placed.
+    """
+    first = (keys * mult[0] >> shift[0]).tolist()
+    second = (keys * mult[1] >> shift[1]).tolist()
+    buckets: dict[int, list[int]] = {}
+    for i, bucket in enumerate(first):
+        buckets.setdefault(bucket, []).append(i)
+
+    slots = 2 ** size
+    used = bytearray(slots)
+    disp = np.zeros(2 ** (size - 1), dtype=keys.dtype)
+    table = np.zeros(slots, dtype=np.intp)
+    for bucket in sorted(buckets, key=lambda b: -len(buckets[b])):
+        members = buckets[bucket]
+        for d in range(slots):
+            placed = {second[i] ^ d for i in members}
+            if len(placed) == len(members):
+                if not any(used[slot] for slot in placed):
+                    break
+        else:
+            return None
+        disp[bucket] = d
+        for i in members:
+            used[second[i] ^ d] = 1
+            table[second[i] ^ d] = i
+    return disp, table
+
+
+# Easing functions.
+def ease_unique(
+    ease: Callable,
+    a: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    keys: Optional[np.ndarray] = None,
+    workers: int = 1
+) -> Optional[np.ndarray]:
+    """Ease data by easing each of its distinct values once.
+
+    :param ease: A function that eases an array of values the same way
+        as the data, with the same range.
+    :param a: The data to ease. It must be contiguous.
+    :param out: (Optional.) The array to write the result into. It
+        must be contiguous and the same type as the data.
+    :param keys: (Optional.) The bits of the distinct values, from
+        :func:`find_keys`. If they aren't given, they are found with
+        no limit on their number.
+    :param workers: (Optional.) The number of threads to use.
+    :return: The eased data as a :class:`numpy.ndarray` or `None` if
+        no hash of the distinct values could be built.
+    :rtype: numpy.ndarray
+    """
+    if keys is None:
+        keys = find_keys(a, limit=a.size)
+    if keys is None:
+        return None
+    h = build_hash(keys)
+    if h is None:
+        return None
+    eased = ease(keys.view(a.dtype))
+    if out is None:
+        out = np.empty(a.shape, dtype=eased.dtype)
+    src, dst = a.reshape(-1), out.reshape(-1)
+
+    def lookup(src, dst):
+        _lookup(h, eased, src, dst, ease)
+
+    if should_split(src, workers):
+        map_slabs(lookup, src, dst, workers)
+    else:
+        lookup(src, dst)
+    return out
+
+
+def _lookup(
+    h: Hash,
+    eased: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    ease: Callable
+) -> None:
+    """Look up the eased values of some data by their bits, a block at
+    a time, and ease the values that aren't in the hash directly.
+    """
+    values, src = src, _bits(src)
+    n = min(BLOCK, src.size)
+    hashed = np.empty(n, dtype=src.dtype)
+    slots = np.empty(n, dtype=src.dtype)
+    index = np.empty(n, dtype=np.intp)
+    found = np.empty(n, dtype=src.dtype)
+    hits = np.empty(n, dtype=bool)
+    signed = f'i{src.dtype.itemsize}'
+    misses = []
+    for start in range(0, src.size, BLOCK):
+        block = src[start:start + BLOCK]
+        size = block.size
+        x, s, i = hashed[:size], slots[:size], index[:size]
+
+        np.multiply(block, h.mult[0], out=x)
+        x >>= h.shift[0]
+        np.take(h.disp, x.view(signed), out=s, mode='clip')
+        np.multiply(block, h.mult[1], out=x)
+        x >>= h.shift[1]
+        s ^= x
+        np.take(h.table, s.view(signed), out=i, mode='clip')
+        np.take(h.keys, i, out=found[:size], mode='clip')
+        np.take(eased, i, out=dst[start:start + size], mode='clip')
+
+        hit = np.equal(found[:size], block, out=hits[:size])
+        if not hit.all():
+            misses.append(np.flatnonzero(~hit) + start)
+
+    if misses:
+        where = np.concatenate(misses)
+        dst[where] = ease(values[where])
+
+
+def _bits(a: np.ndarray) -> np.ndarray:
+    """View data as the unsigned integers holding its bits."""
+    return a.view(f'u{a.dtype.itemsize}')
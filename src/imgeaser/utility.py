@@ -6,37 +6,695 @@ Utility functions for the imgeaser module.
 """
 from functools import wraps
 from inspect import getmembers, isfunction
-from typing import Callable
+from typing import Any, Callable, Optional, Sequence
 
 import numpy as np
 
+from imgeaser import profiling
+from imgeaser.meta import get_info
+from imgeaser.parallel import get_workers, map_slabs, should_split
+
+
+# The number of elements in each block of a range scan. It's small
+# enough that a block is still in cache when its maximum is found
+# after its minimum.
+SCAN_BLOCK = 2 ** 16
+
+# The number of elements in each block of data eased in a different
+# type than it is stored in.
+COMPUTE_BLOCK = 2 ** 16
+
+# The number of elements in each block of data evaluated by a
+# piecewise function. It's small enough that the copies of a block
+# that the branches run on stay in cache.
+PIECE_BLOCK = 2 ** 14
+
+# Arrays with fewer elements than this aren't checked for few distinct
+# values unless the caller asks, so small arrays don't pay for the
+# import of imgeaser.unique. It's a floor under unique.MIN_SIZE.
+UNIQUE_FLOOR = 2 ** 16
+
+# The backends that can perform the eases.
+BACKENDS = ('numpy', 'numba')
+_backend = 'numpy'
+
 
 # Decorators.
 def will_scale(fn: Callable) -> Callable:
+    """Scale the data passed to the decorated ease into the range of
+    zero to one inclusive, then return it to its original range after
+    the ease.
+
+    The decorated ease never changes the array passed to it. Like a
+    :class:`numpy.ufunc`, it writes the result into the array given
+    by the `out` keyword argument, or allocates a single new array
+    for the result if `out` isn't given. The undecorated function is
+    given that output array already holding the scaled data, and it
+    is free to change it in place.
+
+    Finding the range of the data takes a pass over the whole array.
+    If the caller already knows the range, it can be given with the
+    `value_range` keyword argument as a (minimum, maximum) pair. If
+    the caller knows the data is already within zero to one, it can
+    pass `assume_normalized=True` to skip scaling altogether.
+
+    The `backend` keyword argument chooses the backend that performs
+    the ease for the call. If it isn't given, the backend set with
+    :func:`set_backend` is used. If the compiled backend isn't
+    available, the ease falls back to :mod:`numpy`.
+
+    The `workers` keyword argument sets the number of threads the ease
+    is split across. If it isn't given, the number set with
+    :func:`imgeaser.set_workers` is used. The range is found before
+    the data is split, so the result is identical to easing the data
+    in one thread.
+
+    Float data is eased and returned in its own type, so float32 and
+    float16 data is never promoted to float64. The `compute_dtype`
+    keyword argument sets a float type to perform the ease in instead,
+    such as easing float16 data in float32 for accuracy. The data is
+    converted in small blocks, so no full-size copy is made in the
+    compute type, and the result is returned in the original type.
+
+    Eases that overshoot can return values outside of the range of
+    the data. Passing `clip=True` clamps the eased values to zero and
+    one before they are unscaled, so the result stays within the range
+    of the data without another pass over it. Eases that never leave
+    that range skip the clamp.
+
+    The `accuracy` keyword argument is the largest error the caller
+    accepts, as a fraction of the range of the data. If it's given,
+    eases with approximate math in :mod:`imgeaser.approx` that is at
+    least that accurate use it for float64 data. Otherwise, and for
+    other eases, it is ignored.
+
+    The `lut_size` keyword argument eases float data by interpolating
+    in a cached table of the ease sampled at `lut_size` steps from zero
+    to one, which costs the same for every ease. The table is float64
+    for float64 data and float32 for other data. The largest error of
+    each ease is in :mod:`imgeaser.interp`. The data is clamped to the
+    ends of the table, so values outside of the range of the data, such
+    as from a `value_range` that doesn't cover it, are eased as zero or
+    one. It is ignored for integer data.
+
+    Integer data keeps its type. Data in 8-bit and 16-bit integer types
+    is eased through a cached lookup table. Wider integer types are
+    eased as floats, in `compute_dtype` if it's given, then rounded
+    back into the original type.
+
+    Data with few distinct values can be eased by easing each distinct
+    value once and looking up the result for each value, which gives
+    the same result. If the `unique` keyword argument isn't given, this
+    is done for large float and wide integer arrays that seem to have
+    few distinct values, when the ease costs more than the lookup.
+    Passing `unique=True` does it whenever the data can be looked up,
+    and `unique=False` never does it. See :mod:`imgeaser.unique`.
+
+    Part of the data can be eased by itself. The `roi` keyword argument
+    selects a region of the data with an index, such as a tuple of
+    slices. If the `axis` keyword argument is also given, `roi` is
+    instead the index or indices along that axis, so `roi=0, axis=-1`
+    selects the first channel of an image. The `where` keyword argument
+    is a boolean mask of the values to ease, within the region if one
+    is selected. Only the selected values are eased and written. The
+    rest of `out` is left as it was, or is a copy of the data if `out`
+    isn't given. The selected values are scaled from the range of the
+    whole array, unless `value_range` is given.
+
+    The description of the ease from :mod:`imgeaser.meta`, if it has
+    one, is available as the `info` attribute of the decorated ease.
+    """
+    info = get_info(fn)
+
     @wraps(fn)
-    def wrapper(a: np.ndarray, *args, **kwargs) -> np.ndarray:
-        # Only scale data that isn't within zero to one.
-        scale = None
-        scale_offset = None
-        if np.min(a) < 0.0 or np.max(a) > 1.0:
-            scale_offset = np.min(a)
-            a -= scale_offset
-            scale = np.max(a)
-            a /= scale
-
-        # Perform the ease.
-        a = fn(a)
-
-        # If the data was scaled, undo the scaling.
-        if scale or scale_offset:
-            a *= scale
-            a += scale_offset
+    def wrapper(
+        a: np.ndarray,
+        *args,
+        out: Optional[np.ndarray] = None,
+        value_range: Optional[tuple[float, float]] = None,
+        assume_normalized: bool = False,
+        backend: Optional[str] = None,
+        workers: Optional[int] = None,
+        compute_dtype: Optional[np.dtype] = None,
+        clip: bool = False,
+        accuracy: Optional[float] = None,
+        roi: Any = None,
+        axis: Optional[int] = None,
+        where: Optional[np.ndarray] = None,
+        unique: Optional[bool] = None,
+        lut_size: Optional[int] = None,
+        **kwargs
+    ) -> np.ndarray:
+        a = np.asarray(a)
+        if backend is None:
+            backend = _backend
+        if workers is None:
+            workers = get_workers()
+        if compute_dtype is not None:
+            compute_dtype = np.dtype(compute_dtype)
+            if compute_dtype.kind != 'f':
+                msg = f'Cannot compute in {compute_dtype}, it is not a float.'
+                raise ValueError(msg)
+        if lut_size is not None and lut_size < 1:
+            msg = f'A lookup table needs at least one step, not {lut_size}.'
+            raise ValueError(msg)
+        if info and info.range_preserving:
+            clip = False
 
-        return a
+        # Selected data is eased by itself, scaled from the range of
+        # the whole array.
+        if roi is not None or where is not None or axis is not None:
+            if value_range is None and not assume_normalized:
+                value_range = minmax(a)
+
+            def ease_selected(src, dst=None):
+                return wrapper(
+                    src,
+                    *args,
+                    out=dst,
+                    value_range=value_range,
+                    assume_normalized=assume_normalized,
+                    backend=backend,
+                    workers=workers,
+                    compute_dtype=compute_dtype,
+                    clip=clip,
+                    accuracy=accuracy,
+                    unique=unique,
+                    lut_size=lut_size,
+                    **kwargs
+                )
+
+            return select(ease_selected, a, out, roi, axis, where)
+
+        # Profiling only costs a check of the hooks if it's off.
+        call = None
+        if profiling.hooks:
+            nbytes = a.nbytes + a.size * _out_dtype(a).itemsize
+            call = profiling.begin(fn.__name__, a.shape, a.dtype.str, nbytes)
+        try:
+            # Find the range of the data, unless the caller knows it.
+            lo: float
+            hi: float
+            if assume_normalized:
+                lo, hi = 0, 1
+            elif value_range is not None:
+                lo, hi = value_range
+            else:
+                lo, hi = minmax(a)
+            scanned = value_range is None and not assume_normalized
+
+            # The range of integer data is found in its own type, where
+            # the difference of its ends can overflow.
+            if a.dtype.kind in 'iu':
+                lo, hi = float(lo), float(hi)
+
+            # Only scale data that isn't within zero to one. Data with
+            # only one value can't be scaled, so it is just offset.
+            scaled = lo < 0.0 or hi > 1.0
+            scale = (hi - lo) or 1 if scaled else 1
+            if call:
+                call.mark('scan')
+                call.scaled = bool(scaled)
+
+            # Data with few distinct values is eased through them. The
+            # strategies used by few calls are imported when needed.
+            keys = None
+            if unique or unique is None and a.size >= UNIQUE_FLOOR:
+                from imgeaser.unique import (
+                    can_unique,
+                    find_keys,
+                    get_key_limit
+                )
+
+                if can_unique(a, out):
+                    limit = a.size if unique else get_key_limit(fn, a)
+                    if limit:
+                        keys = find_keys(a, limit)
+            if keys is not None:
+                from imgeaser.unique import ease_unique
+
+                def ease_values(values):
+                    return wrapper(
+                        values,
+                        *args,
+                        value_range=(lo, hi),
+                        backend=backend,
+                        workers=1,
+                        compute_dtype=compute_dtype,
+                        clip=clip,
+                        accuracy=accuracy,
+                        unique=False,
+                        lut_size=lut_size,
+                        **kwargs
+                    )
+
+                if call:
+                    ease_values = profiling.muted(ease_values)
+                result = ease_unique(ease_values, a, out, keys, workers)
+                if result is not None:
+                    if call:
+                        call.mark('unique')
+                    return result
+
+            # Large arrays are split across threads. The compiled backend
+            # already runs in parallel, so it isn't split.
+            if backend != 'numba' and should_split(a, workers):
+                if out is None:
+                    out = np.empty(a.shape, dtype=_out_dtype(a))
+
+                def ease_slab(src, dst):
+                    wrapper(
+                        src,
+                        *args,
+                        out=dst,
+                        value_range=(lo, hi),
+                        backend=backend,
+                        workers=1,
+                        compute_dtype=compute_dtype,
+                        clip=clip,
+                        accuracy=accuracy,
+                        unique=False,
+                        lut_size=lut_size,
+                        **kwargs
+                    )
+
+                if call:
+                    ease_slab = profiling.muted(ease_slab)
+                map_slabs(ease_slab, a, out, workers)
+                if call:
+                    call.mark('split')
+                return out
+
+            # Integer data is eased as integers. Lookup tables are only
+            # built for whole ranges, so data with a fractional range
+            # is eased the same way as wider integers.
+            if np.issubdtype(a.dtype, np.integer):
+                from imgeaser.lut import can_lut, ease_lut
+
+                whole = float(lo).is_integer() and float(hi).is_integer()
+                if can_lut(a) and whole:
+                    out = ease_lut(
+                        fn,
+                        a,
+                        value_range=(lo, hi),
+                        out=out,
+                        clip=clip,
+                        covered=scanned
+                    )
+                    if call:
+                        call.mark('lut')
+                    return out
+                limits = np.iinfo(a.dtype)
+                b = wrapper(
+                    a.astype(compute_dtype or float),
+                    *args,
+                    value_range=(lo, hi),
+                    backend=backend,
+                    clip=clip,
+                    accuracy=accuracy,
+                    unique=False,
+                    **kwargs
+                )
+                if call:
+                    call.mark('ease')
+                np.rint(b, out=b)
+                preserved = info and info.range_preserving and scanned
+                if not preserved:
+                    np.clip(b, limits.min, limits.max, out=b)
+                if out is None:
+                    out = b.astype(a.dtype)
+                else:
+                    np.copyto(out, b, casting='unsafe')
+                if call:
+                    call.mark('convert')
+                return out
+
+            # Allocate the output, unless the caller supplied it.
+            if out is None:
+                out = np.empty(a.shape, dtype=_out_dtype(a))
+
+            # Data eased in a different type is converted a block at a time.
+            if compute_dtype is not None and a.dtype != compute_dtype:
+                def ease_block(src, dst):
+                    b = src.astype(compute_dtype)
+                    wrapper(
+                        b,
+                        *args,
+                        out=b,
+                        value_range=(lo, hi),
+                        backend=backend,
+                        workers=1,
+                        clip=clip,
+                        accuracy=accuracy,
+                        unique=False,
+                        lut_size=lut_size,
+                        **kwargs
+                    )
+                    np.copyto(dst, b, casting='unsafe')
+
+                map_blocks(ease_block, a, out)
+                if call:
+                    call.mark('ease')
+                return out
+
+            # Data with only one value is all zero once it's scaled, so
+            # the result is the value of the ease at zero. Unscaled data
+            # that is all zero or all one is the value of the ease there.
+            # A range given by the caller may not be the range of the
+            # data, so only a scanned range is trusted.
+            fill = None
+            if (
+                lo == hi
+                and scanned
+                and info
+                and not args
+                and not kwargs
+            ):
+                if scaled:
+                    fill = lo + info.fixed[0]
+                elif lo == 0.0 or lo == 1.0:
+                    fill = info.fixed[int(lo)]
+            if fill is not None:
+                np.copyto(out, fill, casting='unsafe')
+                if call:
+                    call.mark('ease')
+                return out
+
+            # The compiled backend scales, eases, and unscales in one pass.
+            if (
+                backend == 'numba'
+                and lut_size is None
+                and not args
+                and not kwargs
+            ):
+                from imgeaser.jit import ease_jit
+                result = ease_jit(fn, a, out, lo, scale, scaled, clip)
+                if result is not None:
+                    if call:
+                        call.mark('kernel')
+                    return out
+
+            # Perform the scaling.
+            if scaled:
+                np.subtract(a, lo, out=out)
+                out /= scale
+            elif out is not a:
+                np.copyto(out, a)
+            if call:
+                call.mark('scale')
+
+            # Perform the ease. Interpolation and approximate math are
+            # performed in their own types a block at a time, after the
+            # data is scaled.
+            table = None
+            approx_dtype = None
+            if not args and not kwargs:
+                if lut_size is not None:
+                    from imgeaser.interp import build_table, get_table_dtype
+
+                    dtype = get_table_dtype(out.dtype)
+                    table = build_table(fn, lut_size, dtype)
+                elif accuracy is not None:
+                    from imgeaser.approx import get_approx_dtype
+
+                    approx_dtype = get_approx_dtype(fn, out.dtype, accuracy)
+            if table is not None:
+                from imgeaser.interp import interpolate
+
+                def ease_block(src, dst):
+                    interpolate(table, src, dst)
+
+                map_blocks(ease_block, out, out)
+            elif approx_dtype is not None:
+                def ease_block(src, dst):
+                    np.copyto(dst, fn(src.astype(approx_dtype)))
+
+                map_blocks(ease_block, out, out)
+            else:
+                result = fn(out, *args, **kwargs)
+                if result is not out:
+                    np.copyto(out, result)
+            if call:
+                call.mark('ease')
+
+            # Clamp overshoot before the scaling is undone.
+            if clip:
+                np.clip(out, 0.0, 1.0, out=out)
+                if call:
+                    call.mark('clip')
+
+            # If the data was scaled, undo the scaling.
+            if scaled:
+                out *= scale
+                out += lo
+                if call:
+                    call.mark('unscale')
+
+            return out
+        finally:
+            if call:
+                profiling.end(call)
+
+    wrapper.info = info  # type: ignore[attr-defined]
     return wrapper
 
 
+def select(
+    fn: Callable,
+    a: np.ndarray,
+    out: Optional[np.ndarray],
+    roi: Any = None,
+    axis: Optional[int] = None,
+    where: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Run a function over the selected values of an array.
+
+    A region selected with basic indexing is a view, so the function
+    writes straight into the region of the output. Values selected by
+    a mask or by a list of indices are gathered into a new array, and
+    the results are scattered back into the output.
+
+    :param fn: The function to run. It is given the selected values
+        and, if it can write the result straight into the output, the
+        matching values of the output. It returns the result.
+    :param a: The input array.
+    :param out: The output array. If it's `None`, a copy of the input
+        is used.
+    :param roi: (Optional.) An index selecting a region of the array,
+        or the index or indices along `axis` if it is given.
+    :param axis: (Optional.) The axis `roi` indexes.
+    :param where: (Optional.) A boolean mask of the values to select,
+        within the region if one is selected.
+    :return: The output as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if axis is not None:
+        if roi is None:
+            msg = 'An axis can only be given with a roi.'
+            raise ValueError(msg)
+        if not -a.ndim <= axis < a.ndim:
+            msg = f'Axis {axis} is out of bounds for {a.ndim} dimensions.'
+            raise ValueError(msg)
+        roi = (slice(None),) * (axis % a.ndim) + (roi,)
+    if roi is None:
+        roi = ...
+    if out is None:
+        out = a.astype(_out_dtype(a))
+
+    src = a[roi]
+    dst = out[roi]
+    view = np.may_share_memory(dst, out)
+    if where is not None:
+        where = np.broadcast_to(where, src.shape)
+        dst[where] = fn(src[where])
+        if not view:
+            out[roi] = dst
+    elif view:
+        fn(src, dst)
+    else:
+        out[roi] = fn(src)
+    return out
+
+
+def map_blocks(fn: Callable, a: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Run a function over small blocks of an array in turn.
+
+    If the input and output are both contiguous, they are split into
+    runs of :data:`COMPUTE_BLOCK` of their flattened values. Otherwise,
+    the function is run over the whole array.
+
+    :param fn: The function to run. It is given a block of the input
+        and the matching block of the output.
+    :param a: The input array.
+    :param out: The output array.
+    :return: The output as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    if not (a.flags.c_contiguous and out.flags.c_contiguous):
+        fn(a, out)
+        return out
+
+    src, dst = a.reshape(-1), out.reshape(-1)
+    for start in range(0, src.size, COMPUTE_BLOCK):
+        block = slice(start, start + COMPUTE_BLOCK)
+        fn(src[block], dst[block])
+    return out
+
+
+def _out_dtype(a: np.ndarray) -> np.dtype:
+    """Get the type of the result of easing an array."""
+    if a.dtype.kind in 'iuf':
+        return a.dtype
+    return np.dtype(float)
+
+
+# Backend selection.
+def get_backend() -> str:
+    """Get the name of the default backend for the eases."""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """Set the default backend for the eases.
+
+    :param name: The name of the backend, either `numpy` or `numba`.
+    :return: None.
+    :rtype: NoneType
+    """
+    global _backend
+    if name not in BACKENDS:
+        msg = f'Backend must be one of {", ".join(BACKENDS)}.'
+        raise ValueError(msg)
+    _backend = name
+
+
+# Piecewise evaluation.
+def piecewise(a: np.ndarray, pieces: Sequence[tuple]) -> np.ndarray:
+    """Evaluate a piecewise function over an array in place.
+
+    Each piece is a pair of a condition and a branch. The condition
+    is called with the data and returns the mask of the values the
+    branch applies to. The branch is called with a copy of the data,
+    which it changes in place. The values of that copy that fall
+    within the mask are then selected into the result.
+
+    Running every branch over all of the data does more math than
+    running it over just its piece, but each operation is a plain pass
+    through contiguous memory. In testing, that was faster than both
+    gathering and scattering the values of each piece and running the
+    branches as ufuncs masked with the `where` argument. Contiguous
+    data is evaluated in blocks of :data:`PIECE_BLOCK` values, so the
+    copies are small, reused for every block, and still in cache when
+    they are selected into the result. Other data is evaluated in one
+    piece, with full copies.
+
+    Branches whose pieces hold no values in a block aren't run on it.
+    If one piece holds every value of a block, its branch runs on the
+    block directly, without a copy.
+
+    All of the masks of a block are built before any branch runs on
+    it, so a branch can't change which piece a later value falls in.
+    Values that aren't covered by a piece are left unchanged.
+
+    :param a: The data to evaluate.
+    :param pieces: The conditions and branches of the function.
+    :return: The data as a :class:`numpy.ndarray`.
+    :rtype: numpy.ndarray
+    """
+    call = profiling.current() if profiling.hooks else None
+    if call:
+        call.mark('ease')
+
+    if not a.flags.c_contiguous:
+        _piecewise(a, pieces, [], call)
+        return a
+
+    flat = a.reshape(-1)
+    buffers: list[np.ndarray] = []
+    for start in range(0, flat.size, PIECE_BLOCK):
+        _piecewise(flat[start:start + PIECE_BLOCK], pieces, buffers, call)
+    return a
+
+
+def _piecewise(
+    a: np.ndarray,
+    pieces: Sequence[tuple],
+    buffers: list[np.ndarray],
+    call: Optional[profiling.CallRecord]
+) -> None:
+    """Evaluate a piecewise function over a block in place, copying it
+    into the buffers, which are created the first time they are needed
+    and reused by the following blocks.
+    """
+    masks = [cond(a) for cond, _ in pieces]
+    used = [
+        (m, branch) for m, (_, branch) in zip(masks, pieces)
+        if m.any()
+    ]
+    if call:
+        call.mark('masks')
+
+    if not used:
+        return
+    if len(used) == 1 and used[0][0].all():
+        with np.errstate(all='ignore'):
+            used[0][1](a)
+        if call:
+            call.mark('branches')
+        return
+
+    while len(buffers) < min(len(used), 2):
+        buffers.append(np.empty(a.size, dtype=a.dtype))
+    x = buffers[0][:a.size].reshape(a.shape)
+    np.copyto(x, a)
+    scratch = buffers[1][:a.size].reshape(a.shape) if len(used) > 1 else x
+
+    # Branches run over values outside of their pieces, where their
+    # math may not be valid. Those results are thrown away, so any
+    # warnings they raise aren't useful.
+    with np.errstate(all='ignore'):
+        for i, (m, branch) in enumerate(used):
+            # The last branch can run on the copy of the data, since
+            # no later branch needs it.
+            b = x
+            if i < len(used) - 1:
+                np.copyto(scratch, x)
+                b = scratch
+            branch(b)
+            np.copyto(a, b, where=m)
+    if call:
+        call.mark('branches')
+
+
 # Convenience utilities.
+def minmax(a: np.ndarray) -> tuple:
+    """Find the minimum and maximum values of an array in one pass.
+
+    Calling :func:`numpy.min` then :func:`numpy.max` reads the whole
+    array from memory twice. This walks the array in blocks small
+    enough to stay in cache, so each value is only read from memory
+    once.
+
+    :param a: The array to scan.
+    :return: The minimum and maximum values as a :class:`tuple`.
+    :rtype: tuple
+    """
+    if a.size <= SCAN_BLOCK:
+        return np.min(a), np.max(a)
+
+    los = []
+    his = []
+    blocks = np.nditer(
+        a,
+        flags=['external_loop', 'buffered', 'zerosize_ok'],
+        buffersize=SCAN_BLOCK
+    )
+    for block in blocks:
+        los.append(np.min(block))
+        his.append(np.max(block))
+    return np.min(los), np.max(his)
+
+
 def get_prefixed_functions(prefix: str, obj: object) -> dict:
     """Return the functions within the given object that start with
     the prefix.
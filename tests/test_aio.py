@@ -0,0 +1,243 @@
+"""
+test_aio
+~~~~~~~~
+
+Unit tests for the imgeaser.aio module.
+"""
+import asyncio
+import gc
+import threading
+import weakref
+
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+from imgeaser.aio import AsyncEaser, ease_async
+from imgeaser.utility import will_scale
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` that needs scaling."""
+    rng = np.random.default_rng(11)
+    yield rng.random((20, 30)) * 6 - 2
+
+
+@pt.fixture
+def gate():
+    """An event that blocks :func:`ease_gated` until it's set, and a
+    list of the sizes of the data it has been called with.
+    """
+    event = threading.Event()
+    calls = []
+
+    @will_scale
+    def ease_gated(a):
+        calls.append(a.size)
+        event.wait(5)
+        return a
+
+    yield event, calls, ease_gated
+    event.set()
+
+
+@pt.fixture
+def easer():
+    """An easer with a limit that fits two of the sample arrays."""
+    with AsyncEaser(workers=2, max_bytes=2 * 600 * 16) as easer:
+        yield easer
+
+
+# Utility functions.
+async def settle():
+    """Let the running tasks go until they are waiting on something."""
+    for _ in range(20):
+        await asyncio.sleep(.01)
+
+
+# Tests for AsyncEaser.
+@pt.mark.parametrize('name', ie.eases)
+def test_ease(name, a):
+    """Given an ease and data, :meth:`AsyncEaser.ease` should return
+    the same result as the ease.
+    """
+    async def main():
+        with AsyncEaser(workers=2) as easer:
+            return await easer.ease(ie.eases[name], a)
+
+    expected = ie.eases[name](a)
+    assert (asyncio.run(main()) == expected).all()
+
+
+def test_ease_by_name(a):
+    """Given the name of an ease and keyword arguments for it,
+    :meth:`AsyncEaser.ease` should return the same result as the ease.
+    """
+    b = (a * 40).astype(np.uint8)
+
+    async def main():
+        with AsyncEaser(workers=1) as easer:
+            return await easer.ease('out_bounce', b, value_range=(0, 255))
+
+    expected = ie.ease_out_bounce(b, value_range=(0, 255))
+    result = asyncio.run(main())
+    assert result.dtype == np.uint8
+    assert (result == expected).all()
+
+
+def test_ease_out(a):
+    """Given an array for the result, :meth:`AsyncEaser.ease` should
+    write the result into it.
+    """
+    out = np.empty_like(a)
+
+    async def main():
+        with AsyncEaser(workers=1) as easer:
+            return await easer.ease(ie.ease_in_sin, a, out=out)
+
+    assert asyncio.run(main()) is out
+    assert (out == ie.ease_in_sin(a)).all()
+
+
+def test_ease_invalid_name(a):
+    """Given a name that isn't in `imgeaser.eases`,
+    :meth:`AsyncEaser.ease` should raise a :class:`ValueError`.
+    """
+    async def main():
+        with AsyncEaser(workers=1) as easer:
+            await easer.ease('spam', a)
+
+    with pt.raises(ValueError):
+        asyncio.run(main())
+
+
+def test_eases(a):
+    """:attr:`AsyncEaser.eases` should have an awaitable version of
+    each ease in `imgeaser.eases`.
+    """
+    async def main():
+        async with AsyncEaser(workers=1) as easer:
+            assert list(easer.eases) == list(ie.eases)
+            return await easer.eases['out_bounce'](a)
+
+    assert (asyncio.run(main()) == ie.ease_out_bounce(a)).all()
+
+
+def test_invalid_max_bytes():
+    """Given a limit less than one byte, :class:`AsyncEaser` should
+    raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        AsyncEaser(max_bytes=0)
+
+
+# Tests for backpressure.
+def test_backpressure(a, easer, gate):
+    """Given more calls than fit in the limit on bytes in flight, the
+    calls beyond the limit should wait until earlier calls finish.
+    """
+    event, calls, ease = gate
+
+    async def main():
+        tasks = [asyncio.create_task(easer.ease(ease, a)) for _ in range(3)]
+        await settle()
+        assert calls == [a.size, a.size]
+        assert easer.in_flight == 2 * a.nbytes * 2
+        event.set()
+        await asyncio.gather(*tasks)
+        assert len(calls) == 3
+        assert easer.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_backpressure_oversized(a, easer, gate):
+    """Given a call bigger than the limit, the call should run alone."""
+    event, calls, ease = gate
+    big = np.tile(a, (3, 1))
+
+    async def main():
+        first = asyncio.create_task(easer.ease(ease, a))
+        await settle()
+        second = asyncio.create_task(easer.ease(ease, big))
+        await settle()
+        assert calls == [a.size]
+        event.set()
+        await asyncio.gather(first, second)
+        assert calls == [a.size, big.size]
+
+    asyncio.run(main())
+
+
+# Tests for cancellation.
+def test_cancel_waiting(a, easer, gate):
+    """Given a call that is waiting on the limit, cancelling it should
+    drop its data and let the calls behind it go.
+    """
+    event, calls, ease = gate
+    big = np.tile(a, (3, 1))
+    ref = weakref.ref(big)
+
+    async def main():
+        nonlocal big
+        first = asyncio.create_task(easer.ease(ease, a))
+        await settle()
+        waiting = asyncio.create_task(easer.ease(ease, big))
+        behind = asyncio.create_task(easer.ease(ease, a))
+        del big
+        await settle()
+        assert calls == [a.size]
+        waiting.cancel()
+        await settle()
+        gc.collect()
+        assert ref() is None
+        assert calls == [a.size, a.size]
+        event.set()
+        await asyncio.gather(first, behind)
+        with pt.raises(asyncio.CancelledError):
+            await waiting
+        assert easer.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_cancel_pending(a, gate):
+    """Given a call that is waiting for a thread, cancelling it should
+    drop its data without easing it, and stop counting its bytes.
+    """
+    event, calls, ease = gate
+    pending = a.copy()
+    ref = weakref.ref(pending)
+
+    async def main():
+        nonlocal pending
+        with AsyncEaser(workers=1) as easer:
+            first = asyncio.create_task(easer.ease(ease, a))
+            second = asyncio.create_task(easer.ease(ease, pending))
+            del pending
+            await settle()
+            assert easer.in_flight == 2 * a.nbytes * 2
+            second.cancel()
+            await settle()
+            gc.collect()
+            assert ref() is None
+            assert easer.in_flight == a.nbytes * 2
+            event.set()
+            await first
+            assert calls == [a.size]
+            assert easer.in_flight == 0
+
+    asyncio.run(main())
+
+
+# Tests for ease_async.
+def test_ease_async(a):
+    """Given an ease and data, :func:`ease_async` should return the
+    same result as the ease, from any event loop.
+    """
+    expected = ie.ease_in_out_elastic(a)
+    for _ in range(2):
+        result = asyncio.run(ease_async('in_out_elastic', a))
+        assert (result == expected).all()
@@ -0,0 +1,92 @@
+"""
+test_approx
+~~~~~~~~~~~
+
+Unit tests for the imgeaser.approx module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.approx as approx
+
+
+# Fixtures.
+@pt.fixture(scope='module')
+def x():
+    """Dense samples of the range zero to one, with samples packed
+    toward the ends of the pieces of the eases.
+    """
+    d = np.geomspace(1e-18, 1e-2, 20_001)
+    edges = [e + s * d for e in (0, .25, .5, .75, 1) for s in (-1, 1)]
+    x = np.concatenate([
+        np.linspace(0, 1, 2 ** 20 + 1),
+        np.random.default_rng(3).random(2 ** 20),
+        *edges,
+    ])
+    yield x[(x >= 0) & (x <= 1)]
+
+
+# Tests for ERRORS.
+@pt.mark.parametrize('name', approx.ERRORS)
+def test_error(name, x):
+    """Over the whole range of zero to one, the approximate math of each
+    ease should be within its documented error of the exact ease.
+    """
+    ease = ie.eases[name]
+    expected = ease(x, assume_normalized=True)
+    result = ease(x, assume_normalized=True, accuracy=1)
+    assert not (result == expected).all()
+    assert np.abs(result - expected).max() <= approx.ERRORS[name]
+
+
+def test_errors_cover_eases():
+    """Every ease with approximate math should be in `imgeaser.eases`."""
+    assert set(approx.ERRORS) <= set(ie.eases)
+
+
+# Tests for accuracy.
+def test_accuracy_scaled():
+    """Given data that needs scaling, the error of the approximate math
+    should be a fraction of the range of the data.
+    """
+    a = np.linspace(-200, 300, 100_001)
+    expected = ie.ease_in_out_sin(a)
+    result = ie.ease_in_out_sin(a, accuracy=1 / 512)
+    assert np.abs(result - expected).max() <= 500 * approx.ERRORS['in_out_sin']
+
+
+def test_accuracy_too_small():
+    """Given an accuracy the approximate math can't meet, the ease should
+    return the exact result.
+    """
+    a = np.linspace(-2, 3, 10_001)
+    expected = ie.ease_in_circ(a)
+    assert (ie.ease_in_circ(a, accuracy=1e-6) == expected).all()
+
+
+@pt.mark.parametrize('dtype', (np.float32, np.uint8, np.int64))
+def test_accuracy_other_types(dtype):
+    """Given data that isn't float64, the approximate math should only
+    be used for data eased in float64.
+    """
+    a = np.arange(0, 250, 5).astype(dtype)
+    expected = ie.ease_out_elastic(a)
+    result = ie.ease_out_elastic(a, accuracy=1 / 512)
+    assert result.dtype == dtype
+    assert np.allclose(result, expected, rtol=0, atol=1)
+
+
+# Tests for get_approx_dtype.
+def test_get_approx_dtype():
+    """Given an ease, a type, and an accuracy, :func:`get_approx_dtype`
+    should return the type to perform the ease in, or `None` if it
+    should be performed exactly.
+    """
+    f64 = np.dtype(np.float64)
+    assert approx.get_approx_dtype(ie.ease_in_sin, f64, 1e-3) == np.float32
+    assert approx.get_approx_dtype(ie.ease_in_sin, f64, 1e-9) is None
+    assert approx.get_approx_dtype(ie.ease_in_sin, f64, None) is None
+    assert approx.get_approx_dtype(ie.ease_in_quad, f64, 1e-3) is None
+    f32 = np.dtype(np.float32)
+    assert approx.get_approx_dtype(ie.ease_in_sin, f32, 1e-3) is None
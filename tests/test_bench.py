@@ -0,0 +1,161 @@
+"""
+test_bench
+~~~~~~~~~~
+
+Unit tests for the imgeaser.bench module.
+"""
+import json
+
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.bench as b
+
+
+# Tests for make_data.
+@pt.mark.parametrize('dtype', b.DTYPES)
+def test_make_data(dtype):
+    """Given a size and a type, :func:`make_data` should return an
+    array of that size and type.
+    """
+    a = b.make_data(100, dtype)
+    assert a.size == 100
+    assert a.dtype == dtype
+
+
+def test_make_data_normalized_strided():
+    """Given normalized and strided, :func:`make_data` should return a
+    view that isn't contiguous of data within zero to one.
+    """
+    a = b.make_data(100, 'float32', normalized=True, strided=True)
+    assert a.size == 100
+    assert not a.flags.c_contiguous
+    assert a.min() >= 0 and a.max() <= 1
+
+
+# Tests for get_cases.
+def test_get_cases():
+    """Given eases, sizes, types and backends, :func:`get_cases` should
+    return every combination, skipping normalized integer data.
+    """
+    cases = b.get_cases(['in_quad'], (10,), ('float32', 'uint8'))
+    assert len(cases) == 6
+    assert not any(c['normalized'] and c['dtype'] == 'uint8' for c in cases)
+
+
+# Tests for time_ease.
+def test_time_ease():
+    """Given an ease and an array, :func:`time_ease` should return the
+    time, throughput and peak memory of the ease.
+    """
+    result = b.time_ease(ie.ease_in_quad, b.make_data(1000, 'float64'))
+    assert result['seconds'] > 0
+    assert result['mpx_s'] > 0
+    assert result['peak_bytes'] >= 0
+
+
+# Tests for run.
+def test_run():
+    """Given eases, sizes and types, :func:`run` should return a result
+    for every case.
+    """
+    results = b.run(['in_quad', 'out_bounce'], (10,), ('float32',), repeat=1)
+    assert len(results) == 8
+    assert {r['ease'] for r in results} == {'in_quad', 'out_bounce'}
+
+
+# Tests for run_scalar.
+def test_run_scalar():
+    """Given eases, :func:`run_scalar` should return the time of each
+    call of the scalar ease and of the array ease.
+    """
+    results = b.run_scalar(['in_quad', 'out_elastic'], calls=10, repeat=1)
+    assert len(results) == 4
+    assert [r['backend'] for r in results] == ['math', 'numpy'] * 2
+    assert all(r['seconds'] > 0 for r in results)
+    assert 'ns/call' in b.format_result(results[0])
+
+
+# Tests for run_unique.
+def test_run_unique():
+    """Given eases and a number of distinct values, :func:`run_unique`
+    should return the time of easing each value and of easing through
+    the distinct values.
+    """
+    results = b.run_unique(['out_bounce'], [1000], ['float32'], 4, repeat=1)
+    assert [r['backend'] for r in results] == ['numpy', 'unique']
+    assert all(r['size'] == 1000 and r['seconds'] > 0 for r in results)
+
+
+def test_make_data_distinct():
+    """Given a number of distinct values, :func:`make_data` should pick
+    the values of the array from that many values.
+    """
+    a = b.make_data(1000, 'float32', distinct=5)
+    assert a.dtype == np.float32 and a.size == 1000
+    assert len(np.unique(a)) == 5
+
+
+# Tests for compare.
+def test_compare():
+    """Given the results of two runs, :func:`compare` should return the
+    cases that lost more than the threshold of their throughput.
+    """
+    case = {k: 0 for k in b.KEYS}
+    previous = [dict(case, size=1, mpx_s=100.0), dict(case, mpx_s=100.0)]
+    results = [dict(case, size=1, mpx_s=95.0), dict(case, mpx_s=50.0)]
+    regressions = b.compare(results, previous, .1)
+    assert len(regressions) == 1
+    assert regressions[0]['previous_mpx_s'] == 100.0
+    assert regressions[0]['loss'] == .5
+
+
+# Tests for main.
+def test_main(tmp_path, capsys):
+    """Given eases and an output path, :func:`main` should print the
+    results and save them as JSON. Given the path to previous results,
+    it should return one if there are regressions.
+    """
+    path = tmp_path / 'bench.json'
+    argv = ['in_quad', '-s', '10', '-d', 'float32', '-b', 'numpy', '-r', '1']
+    assert b.main([*argv, '-o', str(path)]) == 0
+    assert 'in_quad' in capsys.readouterr().out
+    results = json.loads(path.read_text())
+    assert len(results) == 4
+
+    for result in results:
+        result['mpx_s'] = np.inf
+    path.write_text(json.dumps(results))
+    assert b.main([*argv, '-c', str(path)]) == 1
+    assert 'REGRESSION' in capsys.readouterr().out
+
+
+def test_main_scalar(capsys):
+    """Given `--scalar`, :func:`main` should time the eases on single
+    values.
+    """
+    assert b.main(['in_out_back', '--scalar', '-r', '1']) == 0
+    out = capsys.readouterr().out
+    assert out.count('ns/call') == 2
+
+
+def test_main_unique(capsys):
+    """Given `--unique`, :func:`main` should time the eases with and
+    without easing through the distinct values.
+    """
+    assert b.main(['in_sin', '--unique', '16', '-s', '100', '-r', '1']) == 0
+    out = capsys.readouterr().out
+    assert out.count(' unique ') == 2
+    assert out.count(' numpy ') == 2
+
+
+# Tests for time_import.
+def test_time_import():
+    """:func:`time_import` should return the time it takes to import
+    :mod:`imgeaser` in a new interpreter.
+    """
+    result = b.time_import(1)
+    assert result['ease'] == 'import'
+    assert result['seconds'] > 0
+    assert 'ms' in b.format_result(result)
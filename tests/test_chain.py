@@ -0,0 +1,108 @@
+"""
+test_chain
+~~~~~~~~~~
+
+Unit tests for the imgeaser.chain module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.lut as lut
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` that needs scaling."""
+    rng = np.random.default_rng(11)
+    yield rng.random((2, 20, 30)) * 4 - 1
+
+
+# Tests for compose.
+def test_compose(a):
+    """Given eases, :func:`compose` should return an ease that performs
+    each of them in turn, scaling the data only once.
+    """
+    ease = ie.compose(ie.ease_in_quad, ie.ease_out_sin)
+    lo, hi = a.min(), a.max()
+    expected = ie.ease_in_quad(a)
+    expected = ie.ease_out_sin(expected, value_range=(lo, hi))
+    result = ease(a)
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_compose_names(a):
+    """Given the names of eases in `imgeaser.eases`, :func:`compose`
+    should chain those eases.
+    """
+    ease = ie.compose('in_quad', 'out_sin')
+    assert ease.__name__ == 'compose(in_quad, out_sin)'
+    expected = ie.compose(ie.ease_in_quad, ie.ease_out_sin)(a)
+    assert (ease(a) == expected).all()
+
+
+def test_compose_cached():
+    """When called again with the same eases, :func:`compose` should
+    return the same ease.
+    """
+    ease = ie.compose(ie.ease_in_cubic, ie.ease_out_circ)
+    assert ie.compose(ie.ease_in_cubic, ie.ease_out_circ) is ease
+
+
+def test_compose_does_not_change_input(a):
+    """A composed ease should not change the array passed to it, and
+    should write into the `out` array if one is given.
+    """
+    ease = ie.compose(ie.ease_in_out_sin, ie.ease_out_bounce)
+    original = a.copy()
+    out = np.empty_like(a)
+    result = ease(a, out=out)
+    assert result is out
+    assert (a == original).all()
+
+
+def test_compose_integer(a):
+    """Given 8-bit data, a composed ease should ease the data through
+    a single lookup table for the whole chain.
+    """
+    b = (a * 50 + 60).astype(np.uint8)
+    ease = ie.compose(ie.ease_in_quad, ie.ease_out_sin)
+    lut.build_lut.cache_clear()
+    result = ease(b)
+    assert lut.build_lut.cache_info().currsize == 1
+    expected = ease(b.astype(float))
+    expected = np.clip(np.rint(expected), 0, 255).astype(np.uint8)
+    assert result.dtype == np.uint8
+    assert (result == expected).all()
+
+
+def test_compose_nested(a):
+    """Given a composed ease, :func:`compose` should chain it like any
+    other ease.
+    """
+    inner = ie.compose('in_quad', 'out_sin')
+    ease = ie.compose(inner, 'in_out_cubic')
+    expected = ie.compose('in_quad', 'out_sin', 'in_out_cubic')(a)
+    assert (ease(a) == expected).all()
+
+
+def test_compose_numba(a):
+    """Given the compiled backend, a composed ease should return the
+    same result as the :mod:`numpy` backend.
+    """
+    pt.importorskip('numba')
+    ease = ie.compose('in_out_sin', 'in_out_elastic')
+    expected = ease(a)
+    result = ease(a, backend='numba')
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_compose_unknown():
+    """Given the name of an ease that isn't in `imgeaser.eases` or no
+    eases, :func:`compose` should raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        ie.compose('spam')
+    with pt.raises(ValueError):
+        ie.compose()
@@ -0,0 +1,210 @@
+"""
+test_families
+~~~~~~~~~~~~~
+
+Unit tests for the imgeaser.families module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.families as f
+import imgeaser.jit as jit
+import imgeaser.lut as lut
+import imgeaser.meta as meta
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` that needs scaling."""
+    yield np.linspace(-2.0, 3.0, 1001)
+
+
+# Tests for the defaults.
+@pt.mark.parametrize('factory,params,name', (
+    (f.in_back, (), 'in_back'),
+    (f.in_out_back, (), 'in_out_back'),
+    (f.in_elastic, (), 'in_elastic'),
+    (f.out_elastic, (), 'out_elastic'),
+    (f.in_out_elastic, (), 'in_out_elastic'),
+    (f.in_pow, (2,), 'in_quad'),
+    (f.in_pow, (3,), 'in_cubic'),
+    (f.in_pow, (5,), 'in_quint'),
+    (f.out_pow, (2,), 'out_quad'),
+    (f.out_pow, (3,), 'out_cubic'),
+    (f.out_pow, (5,), 'out_quint'),
+    (f.in_out_pow, (2,), 'in_out_quad'),
+    (f.in_out_pow, (3,), 'in_out_cubic'),
+    (f.in_out_pow, (5,), 'in_out_quint'),
+))
+def test_matches_fixed_ease(factory, params, name, a):
+    """Given the constants of a fixed ease, each factory should build
+    an ease that returns the same result as the fixed ease.
+    """
+    ease = factory(*params)
+    expected = ie.eases[name](a)
+    assert np.allclose(ease(a), expected, rtol=0, atol=1e-12)
+
+
+# Tests for the constants.
+def test_in_back_overshoot():
+    """Given an overshoot, :func:`in_back` should back up that far, and
+    not at all if it is zero.
+    """
+    x = np.linspace(0, 1, 10_001)
+    y = f.in_back(3.0)(x, assume_normalized=True)
+    assert y.min() < ie.ease_in_back(x, assume_normalized=True).min()
+    cubic = f.in_back(0.0)(x, assume_normalized=True)
+    assert np.allclose(cubic, x ** 3, rtol=0, atol=1e-12)
+
+
+def test_elastic_amplitude():
+    """Given an amplitude, :func:`out_elastic` should bounce that high
+    and still end at zero and one.
+    """
+    x = np.linspace(0, 1, 10_001)
+    low = f.out_elastic(amplitude=1.0)(x, assume_normalized=True)
+    high = f.out_elastic(amplitude=2.0)(x, assume_normalized=True)
+    assert high.max() > low.max()
+    assert (high[0], high[-1]) == (0, 1)
+
+
+@pt.mark.parametrize('factory,params', (
+    (f.in_back, (-1,)),
+    (f.in_out_back, (-1,)),
+    (f.in_elastic, (0,)),
+    (f.out_elastic, (.3, .5)),
+    (f.in_out_elastic, (-1,)),
+    (f.in_pow, (0,)),
+    (f.out_pow, (-2,)),
+    (f.in_out_pow, (float('nan'),)),
+))
+def test_invalid(factory, params):
+    """Given constants that don't make an ease, each factory should
+    raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        factory(*params)
+
+
+# Tests for caching.
+def test_cached():
+    """Given the same constants, a factory should return the same ease
+    and reuse its lookup table.
+    """
+    ease = f.in_back(2.5)
+    assert f.in_back(2.5) is ease
+    assert ease.__name__ == 'ease_in_back(overshoot=2.5)'
+
+    a = np.arange(256, dtype=np.uint8)
+    ease(a)
+    hits = lut.build_lut.cache_info().hits
+    f.in_back(2.5)(a)
+    assert lut.build_lut.cache_info().hits == hits + 1
+
+
+@pt.mark.parametrize('factory,args,kwargs', (
+    (f.in_back, (2.0,), {}),
+    (f.in_back, (), {'overshoot': 2.0}),
+    (f.in_back, (2,), {}),
+    (f.in_elastic, (), {}),
+    (f.in_elastic, (.3,), {'amplitude': 1.0}),
+    (f.in_elastic, (), {'amplitude': 1.0, 'period': .3}),
+    (f.in_pow, (), {'n': 2}),
+))
+def test_cached_normalized(factory, args, kwargs):
+    """Given the same constants passed by position, by keyword, or left
+    as their defaults, a factory should return the same ease.
+    """
+    expected = {
+        f.in_back: f.in_back(2.0),
+        f.in_elastic: f.in_elastic(.3, 1.0),
+        f.in_pow: f.in_pow(2),
+    }[factory]
+    assert factory(*args, **kwargs) is expected
+
+
+def test_kernel_cached():
+    """Given the same constants, the compiled kernel of the ease should
+    be reused.
+    """
+    pt.importorskip('numba')
+    ease = f.in_pow(4)
+    kernel = jit.get_kernel(ease.__wrapped__)
+    assert kernel is not None
+    assert jit.get_kernel(f.in_pow(4).__wrapped__) is kernel
+
+
+@pt.mark.parametrize('ease', (
+    f.in_back(2.0),
+    f.in_out_elastic(.5, 1.5),
+    f.in_out_pow(2.5),
+))
+def test_numba(ease, a):
+    """Given the compiled backend, each ease should return the same
+    result as the :mod:`numpy` backend.
+    """
+    pt.importorskip('numba')
+    expected = ease(a, backend='numpy')
+    result = ease(a, backend='numba')
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_compose(a):
+    """Built eases should chain with :func:`imgeaser.compose`."""
+    ease = ie.compose(f.in_pow(3), 'out_sin')
+    assert ease.__name__ == 'compose(in_pow(n=3), out_sin)'
+    expected = ie.ease_out_sin(f.in_pow(3)(a), value_range=(-2.0, 3.0))
+    assert np.allclose(ease(a), expected, rtol=0, atol=1e-12)
+
+
+# Tests for metadata.
+@pt.mark.parametrize('ease', (
+    f.in_back(2.0),
+    f.in_out_back(0.5),
+    f.in_pow(1.5),
+    f.out_pow(4),
+    f.in_out_pow(3.5),
+    f.in_elastic(),
+    f.in_elastic(.2, 2.0),
+    f.out_elastic(.5),
+    f.out_elastic(.3, 1.5),
+    f.in_out_elastic(),
+    f.in_out_elastic(.3, 1.2),
+))
+def test_info(ease):
+    """The description of a built ease should match how it behaves over
+    data within zero to one.
+    """
+    x = np.linspace(0, 1, 100_001)
+    info = ease.info
+    y = ease(x, assume_normalized=True)
+    assert meta.get_info(ease) is info
+    assert info.bounds[0] <= y.min() and y.max() <= info.bounds[1]
+    assert np.isclose(y.min(), info.bounds[0], atol=1e-5)
+    assert np.isclose(y.max(), info.bounds[1], atol=1e-5)
+    assert info.monotonic == (np.diff(y) >= 0).all()
+    assert np.allclose((y[0], y[-1]), info.fixed, rtol=0, atol=1e-12)
+
+
+@pt.mark.parametrize('name', ('in_elastic', 'out_elastic', 'in_out_elastic'))
+def test_info_elastic_default(name):
+    """Given the default constants, the description of a built elastic
+    ease should match the fixed ease within rounding.
+    """
+    info = getattr(f, name)().info
+    expected = meta.INFO[name]
+    assert np.allclose(info.bounds, expected.bounds, rtol=0, atol=2e-6)
+    assert info._replace(bounds=expected.bounds) == expected
+
+
+@pt.mark.parametrize('ease', (f.in_out_elastic(.3), f.in_out_elastic(.3, 1.2)))
+def test_info_elastic_symmetry(ease):
+    """The description of a built elastic ease in and out should only
+    be odd if the ease is.
+    """
+    x = np.linspace(0, 1, 1001)
+    y = ease(x, assume_normalized=True)
+    odd = np.allclose(y[::-1], 1 - y, rtol=0, atol=1e-12)
+    assert (ease.info.symmetry == meta.ODD) == odd
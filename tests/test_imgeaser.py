@@ -5,6 +5,7 @@ test_imgeaser
 import numpy as np
 import pytest as pt
 
+from imgeaser import eases
 from imgeaser import imgeaser as ie
 
 
@@ -37,6 +38,56 @@ def e():
     ], dtype=float)
 
 
+# Tests for all eases.
+@pt.mark.parametrize('name', eases)
+def test_ease_does_not_change_input(name, a):
+    """Given a read-only array of image data, every ease should
+    return the eased data without changing the original array.
+    """
+    expected = a.copy()
+    a.flags.writeable = False
+    result = eases[name](a)
+    assert result is not a
+    assert (a == expected).all()
+
+
+@pt.mark.parametrize('name', eases)
+def test_ease_out(name, a):
+    """Given an array of image data and an output array, every ease
+    should write the eased data into the output array and return it.
+    """
+    expected = eases[name](a)
+    out = np.zeros_like(a)
+    result = eases[name](a, out=out)
+    assert result is out
+    assert (out == expected).all()
+
+
+@pt.mark.parametrize('dtype', (np.float16, np.float32))
+@pt.mark.parametrize('name', eases)
+def test_ease_keeps_float_type(name, dtype, a):
+    """Given an array of float image data, every ease should return the
+    eased data in the same type.
+    """
+    b = (a * 3 - 1).astype(dtype)
+    result = eases[name](b)
+    assert result.dtype == dtype
+    expected = eases[name](b.astype(float))
+    assert np.allclose(result, expected, rtol=0, atol=.05)
+
+
+@pt.mark.parametrize('name', eases)
+def test_ease_compute_dtype(name, a):
+    """Given float16 data and a compute type of float32, every ease
+    should return the data eased in float32 then stored as float16.
+    """
+    b = (a * 3 - 1).astype(np.float16)
+    result = eases[name](b, compute_dtype=np.float32)
+    assert result.dtype == np.float16
+    expected = eases[name](b.astype(np.float32)).astype(np.float16)
+    assert (result == expected).all()
+
+
 # Tests for ease in functions.
 def test_ease_in_back(a):
     """Given an array of image data, :func:`ease_in_back` should run
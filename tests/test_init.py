@@ -0,0 +1,65 @@
+"""
+test_init
+~~~~~~~~~
+
+Unit tests for the initialization of the imgeaser module.
+"""
+import subprocess
+import sys
+
+import imgeaser as ie
+from imgeaser import imgeaser
+from imgeaser.utility import get_prefixed_functions
+
+
+# Tests for the registry.
+def test_ease_names():
+    """The static table of the names of the eases should list every
+    ease in :mod:`imgeaser.imgeaser`.
+    """
+    expected = get_prefixed_functions('ease_', imgeaser)
+    assert ie.EASE_NAMES == tuple(expected)
+    assert ie.eases == expected
+
+
+def test_lazy_import():
+    """Importing :mod:`imgeaser` should not import the modules that are
+    only needed when their features are used.
+    """
+    code = (
+        'import sys, imgeaser; '
+        'print(*sorted(m for m in sys.modules if m in ('
+        '"imgeaser.chain", "imgeaser.jit", "imgeaser.ondisk", '
+        '"imgeaser.bench", "imgeaser.stream", "imgeaser.aio", '
+        '"imgeaser.scalar", "imgeaser.tween", "imgeaser.unique", '
+        '"imgeaser.interp", "imgeaser.approx", "imgeaser.lut", '
+        '"asyncio", "concurrent.futures", "multiprocessing", "numba")))'
+    )
+    proc = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True
+    )
+    assert proc.stdout.strip() == ''
+
+
+def test_lazy_attributes():
+    """The public API loaded on first use should be available as
+    attributes of :mod:`imgeaser`.
+    """
+    from imgeaser import scalar
+    from imgeaser.aio import AsyncEaser, ease_async
+    from imgeaser.chain import compose
+    from imgeaser.ondisk import ease_file
+    from imgeaser.stream import ease_stream
+    from imgeaser.tween import TweenStore
+    assert ie.AsyncEaser is AsyncEaser
+    assert ie.ease_async is ease_async
+    assert ie.compose is compose
+    assert ie.ease_file is ease_file
+    assert ie.ease_stream is ease_stream
+    assert ie.scalar is scalar
+    assert ie.TweenStore is TweenStore
+    assert 'eases' in dir(ie)
+    assert 'scalar' in dir(ie)
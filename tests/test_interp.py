@@ -0,0 +1,181 @@
+"""
+test_interp
+~~~~~~~~~~~
+
+Unit tests for the imgeaser.interp module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+from imgeaser import interp
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` that needs scaling."""
+    rng = np.random.default_rng(17)
+    yield rng.random((200, 300)) * 600 - 100
+
+
+# Tests for build_table.
+def test_build_table():
+    """Given an easing function, a size, and a type, :func:`build_table`
+    should return a read-only table of the samples of the ease and the
+    differences between them.
+    """
+    fn = ie.ease_in_quad.__wrapped__
+    table = interp.build_table(fn, 4, np.dtype(np.float32))
+    assert table.dtype == np.float32
+    assert not table.flags.writeable
+    assert (table[0] == [0, 1 / 16, 1 / 4, 9 / 16, 1]).all()
+    assert (table[1] == [1 / 16, 3 / 16, 5 / 16, 7 / 16, 0]).all()
+
+
+def test_build_table_cached():
+    """When called again with the same arguments, :func:`build_table`
+    should return the cached table.
+    """
+    fn = ie.ease_out_bounce.__wrapped__
+    table = interp.build_table(fn, 4096, np.dtype(np.float64))
+    assert interp.build_table(fn, 4096, np.dtype(np.float64)) is table
+
+
+# Tests for interpolate.
+def test_interpolate():
+    """Given a table and data, :func:`interpolate` should interpolate
+    linearly between the samples on either side of each value, and
+    clamp values outside of zero to one to the ends of the table.
+    """
+    table = interp.build_table(ie.ease_in_quad.__wrapped__, 4, np.dtype(float))
+    a = np.array([0, .125, .25, .6, 1, -1, 2, np.nan])
+    result = interp.interpolate(table, a)
+    expected = [0, 1 / 32, 1 / 16, .25 + .4 * 5 / 16, 1, 0, 1, np.nan]
+    assert np.allclose(result, expected, rtol=0, atol=1e-15, equal_nan=True)
+
+
+def test_interpolate_out():
+    """Given an array for the result, :func:`interpolate` should write
+    into it, even if it's the data.
+    """
+    table = interp.build_table(ie.ease_in_sin.__wrapped__, 64, np.dtype(float))
+    a = np.linspace(0, 1, 101)
+    expected = interp.interpolate(table, a)
+    assert interp.interpolate(table, a, a) is a
+    assert (a == expected).all()
+
+
+# Tests for the errors.
+@pt.mark.parametrize('name', ie.eases)
+def test_errors(name):
+    """The errors in :data:`ERRORS` should be the measured errors of
+    the ease, rounded up.
+    """
+    error = interp.measure_error(ie.eases[name], 4096)
+    listed = interp.ERRORS[name][0]
+    assert error <= listed <= max(error * 1.1, 1e-12)
+
+
+@pt.mark.parametrize('name', ('out_bounce', 'mid_bump_linear', 'in_elastic'))
+def test_errors_discontinuous(name):
+    """Given an ease with corners or jumps, easing through a table
+    shouldn't be worse than its error, including next to the corners,
+    jumps, and ends.
+    """
+    fn = ie.eases[name]
+    a = np.array([0, 1, .25, .5, .75, 1 / 2.75, 2 / 2.75, 2.5 / 2.75])
+    a = np.concatenate([a, np.nextafter(a, -1), np.nextafter(a, 2)])
+    a = np.clip(a, 0, 1)
+    for size, listed in zip(interp.SIZES, interp.ERRORS[name]):
+        result = fn(a, assume_normalized=True, lut_size=size)
+        error = np.abs(result - fn(a, assume_normalized=True)).max()
+        assert error <= listed
+
+
+def test_get_error():
+    """Given an ease and a size, :func:`get_error` should return the
+    listed error, or measure it if it isn't listed.
+    """
+    assert interp.get_error(ie.ease_out_bounce, 16384) == 7.5e-5
+    measured = interp.get_error(ie.ease_in_quad, 1024)
+    assert measured == interp.measure_error(ie.ease_in_quad, 1024)
+    assert 0 < measured < interp.ERRORS['in_quad'][0] * 32
+
+
+# Tests for lut_size.
+@pt.mark.parametrize('name', ie.eases)
+@pt.mark.parametrize('dtype', ('float64', 'float32'))
+def test_lut_size(name, dtype, a):
+    """Given float data and a table size, an ease should return the
+    result of interpolating in the table, in the type of the data,
+    within the error of the ease and the rounding of the type.
+    """
+    b = a.astype(dtype)
+    fn = ie.eases[name]
+    result = fn(b, lut_size=4096)
+    expected = fn(b.astype(float))
+    assert result.dtype == b.dtype
+    rounding = 1e-12 if dtype == 'float64' else 1e-6
+    error = np.abs(result - expected).max() / (a.max() - a.min())
+    assert error <= interp.ERRORS[name][0] + rounding
+
+
+def test_lut_size_float16(a):
+    """Given float16 data, an ease should interpolate in a float32 table
+    and return the result in float16.
+    """
+    b = a.astype(np.float16)
+    result = ie.ease_in_out_sin(b, lut_size=4096)
+    expected = ie.ease_in_out_sin(b.astype(np.float32), lut_size=4096)
+    assert result.dtype == np.float16
+    assert np.allclose(result, expected, rtol=2e-3, atol=.5)
+
+
+def test_lut_size_normalized():
+    """Given data within zero to one, the result should be the result
+    of :func:`interpolate`.
+    """
+    a = np.linspace(0, 1, 1001, dtype=np.float32)
+    fn = ie.ease_in_out_elastic
+    table = interp.build_table(fn.__wrapped__, 16384, np.dtype(np.float32))
+    expected = interp.interpolate(table, a)
+    assert (fn(a, lut_size=16384) == expected).all()
+
+
+def test_lut_size_options(a):
+    """Given other options of the ease, the table should be used with
+    them.
+    """
+    out = np.empty_like(a)
+    kwargs = {'lut_size': 4096, 'clip': True}
+    expected = ie.ease_in_out_back(a, **kwargs)
+    assert (ie.ease_in_out_back(a, out=out, workers=3, **kwargs) == out).all()
+    assert (out == expected).all()
+    result = ie.ease_in_out_back(a, compute_dtype=np.float32, **kwargs)
+    assert np.allclose(result, expected, rtol=0, atol=1e-3)
+    assert result.min() >= a.min() and result.max() <= a.max()
+
+
+def test_lut_size_numba(a):
+    """Given the compiled backend, the table should be used instead of
+    the compiled kernel.
+    """
+    pt.importorskip('numba')
+    expected = ie.ease_out_bounce(a, lut_size=64)
+    result = ie.ease_out_bounce(a, lut_size=64, backend='numba')
+    assert (result == expected).all()
+
+
+def test_lut_size_integer():
+    """Given integer data, the table size should be ignored."""
+    a = np.arange(256, dtype=np.uint8)
+    assert (ie.ease_in_sin(a, lut_size=4) == ie.ease_in_sin(a)).all()
+
+
+def test_lut_size_invalid(a):
+    """Given a table size less than one, an ease should raise a
+    :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        ie.ease_in_sin(a, lut_size=0)
@@ -0,0 +1,120 @@
+"""
+test_jit
+~~~~~~~~
+
+Unit tests for the imgeaser.jit module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.jit as jit
+from imgeaser import scalar
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` that needs scaling."""
+    yield np.linspace(-2.0, 3.0, 1001)
+
+
+@pt.fixture
+def no_numba(mocker):
+    """Make the compiled backend unavailable."""
+    mocker.patch.object(jit, 'numba', None)
+
+
+# Tests for the kernels.
+@pt.mark.parametrize('name', ie.eases)
+def test_kernel(name):
+    """Given a value between zero and one inclusive, each kernel should
+    return the same value as the :mod:`numpy` implementation of the
+    ease.
+    """
+    ease = ie.eases[name]
+    kernel = jit.KERNELS[ease.__name__]
+    x = np.linspace(0.0, 1.0, 101)
+    expected = ease(x)
+    result = np.array([kernel(n) for n in x])
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_kernels_scalar():
+    """The kernels should be the eases for single values."""
+    assert jit.KERNELS == {f'ease_{k}': v for k, v in scalar.eases.items()}
+
+
+# Tests for ease_jit.
+@pt.mark.parametrize('name', ie.eases)
+def test_ease_jit(name, a):
+    """Given an ease and an array of data, the compiled backend should
+    return the same result as the :mod:`numpy` backend.
+    """
+    pt.importorskip('numba')
+    ease = ie.eases[name]
+    expected = ease(a)
+    result = ease(a, backend='numba')
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_ease_jit_strided(a):
+    """Given a view that isn't contiguous and an output that isn't
+    contiguous, the compiled backend should return the same result as
+    the :mod:`numpy` backend.
+    """
+    pt.importorskip('numba')
+    src = np.tile(a, (4, 1))[:, ::3]
+    out = np.zeros((4, src.shape[1] * 2))[:, ::2]
+    expected = ie.ease_in_out_elastic(src)
+    result = ie.ease_in_out_elastic(src, out=out, backend='numba')
+    assert result is out
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_ease_jit_unknown():
+    """Given a function without a compiled kernel, :func:`ease_jit`
+    should return `None`.
+    """
+    def ease_in_back(a):
+        return a
+
+    a = np.zeros(3)
+    assert jit.ease_jit(ease_in_back, a, a, 0.0, 1.0, False) is None
+
+
+def test_ease_jit_fallback(a, no_numba):
+    """If :mod:`numba` isn't installed, the eases should fall back to
+    the :mod:`numpy` backend.
+    """
+    assert not jit.available()
+    expected = ie.ease_out_bounce(a, backend='numpy')
+    result = ie.ease_out_bounce(a, backend='numba')
+    assert (result == expected).all()
+
+
+@pt.mark.parametrize('dtype', (np.float16, np.float32))
+def test_ease_jit_dtype(a, dtype):
+    """Given data in a smaller float type, the compiled backend should
+    return the same result in the same type as the :mod:`numpy`
+    backend, using the :mod:`numpy` backend for types the kernels
+    don't accept.
+    """
+    pt.importorskip('numba')
+    b = a.astype(dtype)
+    expected = ie.ease_in_out_sin(b)
+    result = ie.ease_in_out_sin(b, backend='numba')
+    assert result.dtype == dtype
+    assert np.allclose(result, expected, rtol=0, atol=1e-3)
+
+
+def test_ease_jit_clip(a):
+    """Given clip, the compiled backend should return the same result
+    as the :mod:`numpy` backend.
+    """
+    pt.importorskip('numba')
+    expected = ie.ease_in_out_elastic(a, clip=True, backend='numpy')
+    result = ie.ease_in_out_elastic(a, clip=True, backend='numba')
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+    assert result.min() == -2.0
+    assert result.max() == 3.0
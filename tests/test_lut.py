@@ -0,0 +1,223 @@
+"""
+test_lut
+~~~~~~~~
+
+Unit tests for the imgeaser.lut module.
+"""
+import warnings
+
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.lut as lut
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` of 8-bit image data."""
+    yield np.array([
+        [
+            [0, 64, 128, 191, 255, ],
+            [64, 128, 191, 255, 191, ],
+            [128, 191, 255, 191, 128, ],
+            [191, 255, 191, 128, 64, ],
+            [255, 191, 128, 64, 0, ],
+        ],
+    ], dtype=np.uint8)
+
+
+# Tests for build_lut.
+def test_build_lut():
+    """Given an easing function, an integer type, and the range of the
+    data, :func:`build_lut` should return a read-only table of the
+    eased value for every value of the type.
+    """
+    fn = ie.ease_in_quad.__wrapped__
+    table = lut.build_lut(fn, np.dtype(np.uint8), 0, 255)
+    assert table.dtype == np.uint8
+    assert table.shape == (256,)
+    assert not table.flags.writeable
+    assert table[0] == 0
+    assert table[255] == 255
+    assert table[128] == round(128 ** 2 / 255)
+
+
+def test_build_lut_cached():
+    """When called again with the same arguments, :func:`build_lut`
+    should return the cached table.
+    """
+    fn = ie.ease_in_cubic.__wrapped__
+    table = lut.build_lut(fn, np.dtype(np.uint16), 10, 60000)
+    assert lut.build_lut(fn, np.dtype(np.uint16), 10, 60000) is table
+
+
+def test_build_lut_signed():
+    """Given a signed integer type, :func:`build_lut` should order the
+    table by the unsigned view of the values.
+    """
+    fn = ie.ease_in_quad.__wrapped__
+    table = lut.build_lut(fn, np.dtype(np.int8), -128, 127)
+    assert table[0] == round(128 ** 2 / 255 - 128)
+    assert table[127] == 127
+    assert table[128] == -128
+    assert table[255] == round(127 ** 2 / 255 - 128)
+
+
+def test_build_lut_out_of_domain():
+    """Given an ease that isn't defined for values outside the range of
+    the data, :func:`build_lut` should build the table without warning.
+    """
+    fn = ie.ease_in_circ.__wrapped__
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        table = lut.build_lut(fn, np.dtype(np.int16), -1000, 1000)
+    assert table[0] == -732
+    assert table[2 ** 16 - 1000] == -1000
+
+
+def test_build_lut_clip():
+    """Given clip, :func:`build_lut` should clamp the eased values to
+    the range of the data.
+    """
+    fn = ie.ease_in_back.__wrapped__
+    table = lut.build_lut(fn, np.dtype(np.uint8), 0, 255)
+    assert table.min() == 0
+    clipped = lut.build_lut(fn, np.dtype(np.uint8), 10, 20, True)
+    assert clipped[:21].min() >= 10
+    assert clipped[:21].max() <= 20
+    assert clipped[20] == 20
+
+
+@pt.mark.parametrize('name', ('in_quad', 'out_elastic', 'in_out_back'))
+@pt.mark.parametrize('dtype,lo,hi', (
+    (np.uint8, 0, 255),
+    (np.int8, -20, 100),
+    (np.uint16, 300, 41000),
+    (np.int16, -7000, -2000),
+))
+def test_build_lut_covered(name, dtype, lo, hi):
+    """Given covered, :func:`build_lut` should only fill the entries
+    within the range, and they should match the full table.
+    """
+    fn = ie.eases[name].__wrapped__
+    dtype = np.dtype(dtype)
+    udtype = np.dtype(f'u{dtype.itemsize}')
+    table = lut.build_lut(fn, dtype, lo, hi, covered=True)
+    full = lut.build_lut(fn, dtype, lo, hi)
+    values = np.arange(lo, hi + 1).astype(dtype).view(udtype)
+    assert not table.flags.writeable
+    assert (table[values] == full[values]).all()
+
+
+def test_build_lut_covered_span():
+    """Given covered ranges of the same size, :func:`build_lut` should
+    only ease the offsets within a range of that size once.
+    """
+    fn = ie.ease_out_bounce.__wrapped__
+    dtype = np.dtype(np.uint16)
+    lut.build_lut(fn, dtype, 1000, 5000, covered=True)
+    misses = lut.ease_span.cache_info().misses
+    table = lut.build_lut(fn, dtype, 3000, 7000, covered=True)
+    assert lut.ease_span.cache_info().misses == misses
+    full = lut.build_lut(fn, dtype, 3000, 7000)
+    assert (table[3000:7001] == full[3000:7001]).all()
+
+
+def test_ease_int16_out_of_domain():
+    """Given 16-bit data, an ease that isn't defined outside of the
+    range of the data should ease the data without warning.
+    """
+    a = np.array([-1000, 0, 1000], dtype=np.int16)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = ie.ease_in_circ(a)
+    assert (result == np.array([-1000, -732, 1000])).all()
+
+
+# Tests for ease_lut.
+@pt.mark.parametrize('name', ie.eases)
+def test_ease_lut(name, a):
+    """Given an ease and an array of 8-bit image data, :func:`ease_lut`
+    should return the data eased in the same type as the original.
+    The result should match easing the data as floats then rounding
+    and truncating the result.
+    """
+    ease = ie.eases[name]
+    result = lut.ease_lut(ease.__wrapped__, a)
+    expected = ease(a.astype(float))
+    expected = np.clip(np.rint(expected), 0, 255).astype(np.uint8)
+    assert result.dtype == np.uint8
+    assert (result == expected).all()
+
+
+def test_ease_uint8(a):
+    """Given an array of 8-bit image data, an ease should return the
+    data eased in the original type.
+    """
+    result = ie.ease_in_out_sin(a)
+    assert result.dtype == np.uint8
+    assert (result == np.array([
+        [
+            [0, 38, 128, 217, 255, ],
+            [38, 128, 217, 255, 217, ],
+            [128, 217, 255, 217, 128, ],
+            [217, 255, 217, 128, 38, ],
+            [255, 217, 128, 38, 0, ],
+        ],
+    ], dtype=np.uint8)).all()
+
+
+def test_ease_int32():
+    """Given an array of integer data in a type too large for a lookup
+    table, an ease should return the data eased in the original type.
+    """
+    a = np.array([0, 100, 200, 300, 400], dtype=np.int32)
+    result = ie.ease_in_quad(a)
+    assert result.dtype == np.int32
+    assert (result == np.array([0, 25, 100, 225, 400])).all()
+
+
+def test_ease_lut_out(a):
+    """Given an output array, :func:`ease_lut` should write the eased
+    data into the output array and return it.
+    """
+    fn = ie.ease_in_quad.__wrapped__
+    expected = lut.ease_lut(fn, a)
+    out = np.zeros_like(a)
+    result = lut.ease_lut(fn, a, out=out)
+    assert result is out
+    assert (out == expected).all()
+
+
+def test_ease_lut_float_range(a):
+    """Given a range of whole floats, :func:`ease_lut` should use the
+    same table as for the range as integers.
+    """
+    fn = ie.ease_in_sin.__wrapped__
+    expected = lut.ease_lut(fn, a, value_range=(10, 200))
+    hits = lut.build_lut.cache_info().hits
+    result = lut.ease_lut(fn, a, value_range=(np.float32(10.0), 200.0))
+    assert lut.build_lut.cache_info().hits == hits + 1
+    assert (result == expected).all()
+
+
+def test_ease_lut_fractional_range(a):
+    """Given a range with fractional ends, :func:`ease_lut` should raise
+    a :class:`ValueError`.
+    """
+    fn = ie.ease_in_quad.__wrapped__
+    with pt.raises(ValueError):
+        lut.ease_lut(fn, a, value_range=(0.5, 200))
+
+
+def test_ease_fractional_range(a):
+    """Given 8-bit data and a range with fractional ends, an ease should
+    ease the data from that range rather than a truncated one.
+    """
+    result = ie.ease_in_quad(a, value_range=(0.5, 200))
+    expected = ie.ease_in_quad(a.astype(float), value_range=(0.5, 200))
+    expected = np.clip(np.rint(expected), 0, 255).astype(np.uint8)
+    assert result.dtype == np.uint8
+    assert (result == expected).all()
@@ -0,0 +1,124 @@
+"""
+test_meta
+~~~~~~~~~
+
+Unit tests for the imgeaser.meta module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.meta as meta
+from imgeaser.utility import will_scale
+
+
+# Fixtures.
+@pt.fixture
+def x():
+    """Samples of the range zero to one."""
+    yield np.linspace(0, 1, 100_001)
+
+
+# Tests for INFO.
+def test_info_covers_eases():
+    """There should be a description for every ease."""
+    assert set(meta.INFO) == set(ie.eases)
+
+
+@pt.mark.parametrize('name', ie.eases)
+def test_info(name, x):
+    """The description of every ease should match how the ease behaves
+    over data within zero to one.
+    """
+    ease = ie.eases[name]
+    info = ease.info
+    y = ease(x, assume_normalized=True)
+    mirrored = ease(1 - x, assume_normalized=True)
+    assert info is meta.INFO[name]
+    assert info.bounds[0] <= y.min() and y.max() <= info.bounds[1]
+    assert np.isclose(y.min(), info.bounds[0], atol=1e-5)
+    assert np.isclose(y.max(), info.bounds[1], atol=1e-5)
+    assert info.monotonic == (np.diff(y) >= 0).all()
+    assert np.allclose((y[0], y[-1]), info.fixed, rtol=0, atol=1e-12)
+    assert (info.symmetry == meta.ODD) == np.allclose(mirrored, 1 - y)
+    assert (info.symmetry == meta.EVEN) == np.allclose(mirrored, y)
+
+
+def test_range_preserving():
+    """:attr:`EaseInfo.range_preserving` should be true if the ease
+    never returns values outside of zero to one.
+    """
+    assert ie.ease_in_quad.info.range_preserving
+    assert ie.ease_in_out_cos.info.range_preserving
+    assert not ie.ease_in_back.info.range_preserving
+    assert not ie.ease_out_elastic.info.range_preserving
+
+
+# Tests for get_info.
+def test_get_info():
+    """Given an ease, decorated or not, :func:`get_info` should return
+    its description. Given any other function, it should return `None`.
+    """
+    def ease_in_quad(a):
+        return a
+
+    assert meta.get_info(ie.ease_in_quad) is meta.INFO['in_quad']
+    assert meta.get_info(ie.ease_in_quad.__wrapped__) is meta.INFO['in_quad']
+    assert meta.get_info(ease_in_quad) is None
+    assert ie.compose('in_quad', 'out_sin').info is None
+
+
+# Tests for the fast paths.
+@pt.mark.parametrize('name', ie.eases)
+def test_ease_constant(name):
+    """Given data with only one value outside of zero to one, every
+    ease should return the value of the ease at zero offset by that
+    value.
+    """
+    a = np.full((3, 4), 7.0)
+    expected = ie.eases[name].__wrapped__(np.zeros((3, 4))) + 7.0
+    assert (ie.eases[name](a) == expected).all()
+
+
+@pt.mark.parametrize('name', ie.eases)
+@pt.mark.parametrize('value', (0.0, 1.0))
+def test_ease_constant_fixed(name, value):
+    """Given data that is all zero or all one, every ease should fill
+    the result with its value there without easing the data.
+    """
+    calls = []
+    fn = ie.eases[name].__wrapped__
+
+    def spam(a):
+        calls.append(a)
+        return fn(a)
+
+    spam.info = ie.eases[name].info
+    a = np.full((3, 4), value, dtype=np.float32)
+    expected = fn(a.astype(float))
+    result = will_scale(spam)(a)
+    assert calls == []
+    assert result.dtype == np.float32
+    assert np.allclose(result, expected, rtol=0, atol=1e-7)
+
+
+def test_ease_constant_value_range():
+    """Given a range with only one value, the data should be eased,
+    since it may not be the range of the data.
+    """
+    a = np.array([.1, .5, .9])
+    expected = ie.ease_in_quad(a)
+    assert (ie.ease_in_quad(a, value_range=(0, 0)) == expected).all()
+    assert (ie.ease_in_quad(a + 6, value_range=(6, 6)) == expected + 6).all()
+
+
+def test_ease_wide_integer_skips_clip(mocker):
+    """Given wide integer data and an ease that preserves the range,
+    the result should not be clipped.
+    """
+    a = np.arange(0, 5000, 7, dtype=np.int64)
+    spy = mocker.spy(np, 'clip')
+    ie.ease_in_out_sin(a)
+    assert spy.call_count == 0
+    ie.ease_in_out_back(a)
+    assert spy.call_count == 1
@@ -0,0 +1,124 @@
+"""
+test_ondisk
+~~~~~~~~~~~
+
+Unit tests for the imgeaser.ondisk module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.ondisk as od
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample volume of image data that needs scaling."""
+    rng = np.random.default_rng(8)
+    yield (rng.random((6, 20, 30)) * 10 - 3).astype(np.float32)
+
+
+# Tests for iter_chunks.
+def test_iter_chunks():
+    """Given an array and a size in bytes, :func:`iter_chunks` should
+    split the array into slabs along the first axis that are no
+    larger than the size.
+    """
+    a = np.zeros((10, 4), dtype=np.uint8)
+    assert list(od.iter_chunks(a, 12)) == [
+        slice(0, 3),
+        slice(3, 6),
+        slice(6, 9),
+        slice(9, 10),
+    ]
+
+
+# Tests for scan_range.
+def test_scan_range(a):
+    """Given an array, :func:`scan_range` should return the minimum
+    and maximum values of the array.
+    """
+    assert od.scan_range(a, 256) == (a.min(), a.max())
+
+
+# Tests for ease_file.
+def test_ease_file_npy(a, tmp_path):
+    """Given the path to a `.npy` file, the path to an output file, and
+    an ease, :func:`ease_file` should write the eased data to the
+    output file. The result should match easing the data in memory.
+    """
+    src = tmp_path / 'src.npy'
+    dst = tmp_path / 'dst.npy'
+    np.save(src, a)
+    od.ease_file(src, dst, ie.ease_in_out_elastic, chunk_bytes=1000)
+    result = np.load(dst)
+    assert result.dtype == a.dtype
+    assert (result == ie.ease_in_out_elastic(a)).all()
+
+
+def test_ease_file_raw(a, tmp_path):
+    """Given the path to a raw file with its type and shape, the path
+    to an output file, and the name of an ease, :func:`ease_file`
+    should write the eased data to the output file.
+    """
+    src = tmp_path / 'src.raw'
+    dst = tmp_path / 'dst.raw'
+    a.tofile(src)
+    od.ease_file(
+        src,
+        dst,
+        'out_circ',
+        dtype=a.dtype,
+        shape=a.shape,
+        chunk_bytes=1000
+    )
+    result = np.fromfile(dst, dtype=a.dtype).reshape(a.shape)
+    assert (result == ie.ease_out_circ(a)).all()
+
+
+def test_ease_file_memmap(a, tmp_path):
+    """Given a :class:`numpy.memmap` of integer data and an output
+    array, :func:`ease_file` should write the eased data to the output
+    array in the type of the original data.
+    """
+    src = tmp_path / 'src.raw'
+    (a * 20 + 100).astype(np.uint8).tofile(src)
+    mm = np.memmap(src, dtype=np.uint8, mode='r', shape=a.shape)
+    out = np.zeros(a.shape, dtype=np.uint8)
+    result = od.ease_file(mm, out, ie.ease_out_bounce, chunk_bytes=100)
+    assert result is out
+    assert (out == ie.ease_out_bounce(np.array(mm))).all()
+
+
+def test_ease_file_same_file(a, tmp_path):
+    """Given the same path for the source and the output,
+    :func:`ease_file` should ease the file in place.
+    """
+    src = tmp_path / 'src.npy'
+    np.save(src, a)
+    od.ease_file(src, tmp_path / '.' / 'src.npy', 'in_quad', chunk_bytes=1000)
+    result = np.load(src)
+    assert (result == ie.ease_in_quad(a)).all()
+
+
+def test_ease_file_same_file_integer(a, tmp_path):
+    """Given the same path for a raw file of integer data and the
+    output, :func:`ease_file` should ease the file in place.
+    """
+    src = tmp_path / 'src.raw'
+    b = (a * 20 + 100).astype(np.uint8)
+    b.tofile(src)
+    od.ease_file(src, src, 'out_bounce', dtype=np.uint8, chunk_bytes=100)
+    result = np.fromfile(src, dtype=np.uint8)
+    assert (result == ie.ease_out_bounce(b.reshape(-1))).all()
+
+
+def test_ease_file_raw_without_dtype(tmp_path):
+    """Given the path to a raw file without a type, :func:`ease_file`
+    should raise a :class:`ValueError`.
+    """
+    src = tmp_path / 'src.raw'
+    src.write_bytes(b'\x00' * 8)
+    with pt.raises(ValueError):
+        od.ease_file(src, tmp_path / 'dst.raw', ie.ease_in_quad)
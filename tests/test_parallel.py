@@ -0,0 +1,232 @@
+"""
+test_parallel
+~~~~~~~~~~~~~
+
+Unit tests for the imgeaser.parallel module.
+"""
+import threading
+
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.parallel as par
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` that needs scaling."""
+    rng = np.random.default_rng(7)
+    yield rng.random((3, 40, 50)) * 4 - 1
+
+
+@pt.fixture
+def small_split(mocker):
+    """Allow small arrays to be split across threads."""
+    mocker.patch.object(par, 'MIN_SPLIT', 16)
+
+
+# Tests for set_workers.
+def test_set_workers(mocker):
+    """Given a number of threads, :func:`set_workers` should make it
+    the default number of threads for the eases.
+    """
+    mocker.patch.object(par, '_workers', 1)
+    par.set_workers(3)
+    assert par.get_workers() == 3
+
+
+def test_set_workers_invalid():
+    """Given a number of threads less than one, :func:`set_workers`
+    should raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        par.set_workers(0)
+
+
+# Tests for split.
+def test_split():
+    """Given a length and a number of parts, :func:`split` should
+    return slices that cover the length in nearly equal parts.
+    """
+    assert par.split(10, 3) == [slice(0, 3), slice(3, 6), slice(6, 10)]
+
+
+def test_split_more_parts_than_length():
+    """Given more parts than the length, :func:`split` should return
+    one slice for each index.
+    """
+    assert par.split(2, 4) == [slice(0, 1), slice(1, 2)]
+
+
+# Tests for easing with workers.
+@pt.mark.parametrize('name', ie.eases)
+def test_ease_workers(name, a, small_split):
+    """Given a number of workers, every ease should return a result
+    identical to easing the data in one thread.
+    """
+    ease = ie.eases[name]
+    expected = ease(a, workers=1)
+    result = ease(a, workers=4)
+    assert (result == expected).all()
+
+
+def test_ease_workers_strided(a, small_split):
+    """Given a view that isn't contiguous, an ease with workers should
+    return a result identical to easing the data in one thread.
+    """
+    view = a[:, ::2, 1::3]
+    expected = ie.ease_out_circ(view, workers=1)
+    result = ie.ease_out_circ(view, workers=3)
+    assert (result == expected).all()
+
+
+def test_ease_workers_integer(small_split):
+    """Given integer data and a number of workers, an ease should
+    return a result identical to easing the data in one thread.
+    """
+    a = np.arange(4000, dtype=np.uint16).reshape(40, 100)
+    expected = ie.ease_in_out_quint(a, workers=1)
+    result = ie.ease_in_out_quint(a, workers=4)
+    assert result.dtype == np.uint16
+    assert (result == expected).all()
+
+
+def test_ease_default_workers(a, small_split, mocker):
+    """If the number of workers isn't given, an ease should use the
+    default set by :func:`set_workers`.
+    """
+    mocker.patch.object(par, '_workers', 2)
+    spy = mocker.spy(ie.utility, 'map_slabs')
+    ie.ease_in_sin(a)
+    assert spy.call_args.args[3] == 2
+
+
+@pt.mark.parametrize('name', ie.eases)
+def test_ease_global_workers(name, a, small_split, mocker):
+    """With the default number of workers set globally, every ease
+    should return a result identical to easing the data in one thread,
+    including eases that call other eases.
+    """
+    ease = ie.eases[name]
+    expected = ease(a, workers=1)
+    mocker.patch.object(par, '_workers', 4)
+    result = ease(a)
+    assert (result == expected).all()
+
+
+def test_map_slabs_nested(small_split):
+    """When called from a thread of the pool, :func:`map_slabs` should
+    run the function in that thread rather than waiting on the pool.
+    """
+    a = np.arange(64, dtype=float)
+    out = np.empty_like(a)
+
+    def inner(src, dst):
+        np.copyto(dst, src)
+
+    def outer(src, dst):
+        par.map_slabs(inner, src, dst, 4)
+
+    par.map_slabs(outer, a, out, 4)
+    assert (out == a).all()
+
+
+def test_map_slabs_concurrent(small_split, mocker):
+    """When threads ask for more workers than the pool has while
+    others are using it, every ease should still finish.
+    """
+    mocker.patch.object(par, '_executor', None)
+    mocker.patch.object(par, '_executor_size', 0)
+    a = np.linspace(0, 1, 2 ** 12)
+    expected = ie.ease_in_quad(a, workers=1)
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def run(workers):
+        barrier.wait()
+        try:
+            for _ in range(20):
+                assert (ie.ease_in_quad(a, workers=workers) == expected).all()
+        except Exception as ex:
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run, args=(k,)) for k in range(2, 10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+# Fixtures for ProcessEaser.
+@pt.fixture(scope='module')
+def pool():
+    """A pool of processes for easing."""
+    with par.ProcessEaser(2) as pool:
+        yield pool
+
+
+# Tests for ProcessEaser.
+def test_process_easer_ease(a, pool):
+    """Given the name of an ease and an array, :meth:`ProcessEaser.ease`
+    should return a result identical to easing the data in one process.
+    """
+    result = pool.ease('in_out_elastic', a)
+    assert (result == ie.ease_in_out_elastic(a)).all()
+
+
+def test_process_easer_ease_function(a, pool):
+    """Given an ease from the registry and an array,
+    :meth:`ProcessEaser.ease` should return a result identical to
+    easing the data in one process.
+    """
+    a = (a * 50 + 60).astype(np.uint8)
+    result = pool.ease(ie.ease_out_circ, a)
+    assert result.dtype == np.uint8
+    assert (result == ie.ease_out_circ(a)).all()
+
+
+def test_process_easer_ease_unknown(a, pool):
+    """Given an ease that isn't in the registry,
+    :meth:`ProcessEaser.ease` should raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        pool.ease(lambda a: a, a)
+
+
+def test_process_easer_map(a, pool):
+    """Given an ease and a sequence of frames, :meth:`ProcessEaser.map`
+    should ease each frame separately.
+    """
+    frames = list(a)
+    result = pool.map('out_bounce', frames)
+    for frame, eased in zip(frames, result):
+        assert (eased == ie.ease_out_bounce(frame)).all()
+
+
+def test_process_easer_empty(a, pool):
+    """Given arrays created by :meth:`ProcessEaser.empty`,
+    :meth:`ProcessEaser.ease` should ease the data in place in shared
+    memory.
+    """
+    src = pool.empty(a.shape, a.dtype)
+    src[...] = a
+    out = pool.empty(a.shape, a.dtype)
+    result = pool.ease('in_quad', src, out=out)
+    assert result is out
+    assert (out == ie.ease_in_quad(a)).all()
+
+
+def test_process_easer_empty_after_close():
+    """Arrays created by :meth:`ProcessEaser.empty` should still be
+    usable after the pool is closed.
+    """
+    pool = par.ProcessEaser(1)
+    a = pool.empty((10,))
+    a[...] = 3
+    pool.close()
+    assert (a == 3).all()
+    a[0] = 1
+    assert a.sum() == 28
@@ -0,0 +1,89 @@
+"""
+test_poly
+~~~~~~~~~
+
+Unit tests for the imgeaser.poly module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.jit as jit
+import imgeaser.poly as poly
+
+
+# Fixtures.
+@pt.fixture
+def x():
+    """Samples of the range zero to one."""
+    yield np.linspace(0, 1, 10_001)
+
+
+@pt.fixture
+def small_blocks(mocker):
+    """Evaluate a few values at a time."""
+    mocker.patch.object(poly, 'BLOCK', 7)
+
+
+# Tests for evaluate.
+@pt.mark.parametrize('coeffs', (
+    (2.0, -3.0, .5, 1.0),
+    (1.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    (-1.0, 0.0, 0.0, 1.0),
+    (.5, 0.0, 2.0, 0.0, 0.0),
+    (3.0, 1.0),
+    (1.0, 0.0, 0.0),
+))
+def test_evaluate(coeffs, x, small_blocks):
+    """Given values and a polynomial, :func:`evaluate` should replace
+    the values with the value of the polynomial, a block at a time.
+    """
+    p = poly.Polynomial(coeffs, -2.0, 1.5)
+    expected = np.polyval(coeffs, -2.0 * x + 1.5)
+    a = x.copy()
+    result = poly.evaluate(a, p)
+    assert result is a
+    assert np.allclose(result, expected, rtol=1e-14, atol=1e-14)
+
+
+def test_evaluate_strided(x):
+    """Given a view that isn't contiguous, :func:`evaluate` should
+    evaluate the polynomial for the values in the view.
+    """
+    coeffs = (2.0, -3.0, .5, 1.0)
+    a = x.copy()
+    view = a[::3]
+    poly.evaluate(view, poly.Polynomial(coeffs))
+    assert np.allclose(a[::3], np.polyval(coeffs, x[::3]))
+    assert (a[1::3] == x[1::3]).all()
+
+
+@pt.mark.parametrize('n', range(10))
+def test_evaluate_power(n, x):
+    """Given a single power, :func:`evaluate` should raise the values
+    to that power.
+    """
+    a = x.astype(np.float32)
+    poly.evaluate(a, poly.Polynomial((1.0, *[0.0] * n)))
+    assert a.dtype == np.float32
+    assert np.allclose(a, x ** n, rtol=1e-6, atol=1e-7)
+
+
+# Tests for POLYNOMIALS.
+@pt.mark.parametrize('name', poly.POLYNOMIALS)
+def test_polynomials(name, x):
+    """The pieces of each polynomial ease should match the math of the
+    ease.
+    """
+    kernel = jit.KERNELS[f'ease_{name}']
+    expected = np.array([kernel(n) for n in x])
+    result = poly.ease_poly(x.copy(), poly.POLYNOMIALS[name])
+    assert np.allclose(result, expected, rtol=0, atol=1e-14)
+
+
+@pt.mark.parametrize('name', poly.POLYNOMIALS)
+def test_polynomial_eases(name, x, small_blocks):
+    """Each polynomial ease should be evaluated by :func:`ease_poly`."""
+    a = x * 200 - 50
+    expected = poly.ease_poly(x.copy(), poly.POLYNOMIALS[name]) * 200 - 50
+    assert np.allclose(ie.eases[name](a), expected, rtol=0, atol=1e-11)
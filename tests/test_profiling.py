@@ -0,0 +1,135 @@
+"""
+test_profiling
+~~~~~~~~~~~~~~
+
+Unit tests for the imgeaser.profiling module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+import imgeaser.parallel as par
+import imgeaser.profiling as prof
+
+
+# Fixtures.
+@pt.fixture
+def a():
+    """A sample :class:`numpy.ndarray` that needs scaling."""
+    rng = np.random.default_rng(5)
+    yield rng.random((4, 50)) * 4 - 1
+
+
+@pt.fixture
+def records():
+    """Register a hook that keeps the records it is given."""
+    records = []
+    ie.add_hook(records.append)
+    yield records
+    ie.remove_hook(records.append)
+
+
+# Tests for add_hook.
+def test_add_hook(a, records):
+    """Given a registered hook, every call to an ease should pass the
+    hook a record of the call.
+    """
+    ie.ease_in_out_quad(a)
+    assert len(records) == 1
+    record = records[0]
+    assert record.ease == 'ease_in_out_quad'
+    assert record.shape == a.shape
+    assert record.dtype == a.dtype.str
+    assert record.nbytes == a.nbytes * 2
+    assert record.scaled
+    for stage in ('scan', 'scale', 'masks', 'branches', 'ease', 'unscale'):
+        assert stage in record.stages
+    assert record.seconds == sum(record.stages.values())
+
+
+def test_add_hook_lut(records):
+    """Given a registered hook and 8-bit data, the record of the call
+    should have the time spent in the lookup table.
+    """
+    ie.ease_in_sin(np.arange(256, dtype=np.uint8))
+    assert 'lut' in records[0].stages
+
+
+def test_add_hook_unique(records):
+    """Given a registered hook and data eased through its distinct
+    values, the record of the call should have the time spent in the
+    lookup, and the eases of the distinct values shouldn't be recorded
+    separately.
+    """
+    ie.ease_out_bounce(np.tile([.2, .5, .9], 100), unique=True)
+    assert len(records) == 1
+    assert 'unique' in records[0].stages
+
+
+def test_add_hook_value_range(a, records):
+    """Given a registered hook and the range of the data, the record of
+    the call shouldn't have any time spent scanning the data.
+    """
+    ie.ease_in_sin(a, assume_normalized=True)
+    assert not records[0].scaled
+    assert records[0].stages['scan'] < records[0].seconds
+
+
+def test_add_hook_nested(records, mocker):
+    """Given a registered hook, eases called by other eases or split
+    across threads should not be recorded separately.
+    """
+    mocker.patch.object(par, 'MIN_SPLIT', 16)
+    b = np.arange(1000, dtype=np.int64)
+    ie.ease_in_out_sin(b, workers=3)
+    ie.ease_mid_bump_sin(np.linspace(0, 1, 100), workers=3)
+    assert [r.ease for r in records] == [
+        'ease_in_out_sin',
+        'ease_mid_bump_sin',
+    ]
+    assert 'split' in records[0].stages
+
+
+def test_remove_hook(a):
+    """Given a removed hook, the eases should stop calling the hook."""
+    records = []
+    ie.add_hook(records.append)
+    ie.remove_hook(records.append)
+    ie.ease_in_quad(a)
+    assert records == []
+    assert not prof.hooks
+
+
+def test_hook_after_error(records):
+    """If an ease raises an exception, later calls should still be
+    recorded.
+    """
+    with pt.raises(ValueError):
+        ie.ease_in_quad(np.zeros(3), compute_dtype=np.int8)
+    with pt.raises(TypeError):
+        ie.ease_in_quad(np.zeros(3), spam=1)
+    ie.ease_in_quad(np.zeros(3))
+    assert records[-1].ease == 'ease_in_quad'
+
+
+# Tests for Profile.
+def test_profile(a):
+    """When used as a context manager, :class:`Profile` should gather
+    statistics for each ease called in the context.
+    """
+    with ie.Profile() as p:
+        ie.ease_in_quad(a)
+        ie.ease_in_quad(a, value_range=(0, 2))
+        ie.ease_out_bounce(a)
+    ie.ease_in_quad(a)
+    assert len(p.records) == 3
+    stats = p.stats
+    assert stats['ease_in_quad']['calls'] == 2
+    assert stats['ease_in_quad']['nbytes'] == a.nbytes * 4
+    assert stats['ease_in_quad']['scaled'] == 2
+    assert stats['ease_out_bounce']['calls'] == 1
+    stages = stats['ease_out_bounce']['stages']
+    assert stats['ease_out_bounce']['seconds'] == pt.approx(
+        sum(stages.values())
+    )
+    assert not prof.hooks
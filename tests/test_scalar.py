@@ -0,0 +1,60 @@
+"""
+test_scalar
+~~~~~~~~~~~
+
+Unit tests for the imgeaser.scalar module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+from imgeaser import scalar
+
+
+# Fixtures.
+@pt.fixture(scope='module')
+def x():
+    """Dense samples of the range zero to one, with samples packed
+    toward the ends of the pieces of the eases.
+    """
+    d = np.geomspace(1e-18, 1e-2, 2_001)
+    ends = (0, .25, .5, .75, 1, 1 / 2.75, 2 / 2.75, 2.5 / 2.75)
+    x = np.concatenate([
+        np.linspace(0, 1, 100_001),
+        np.random.default_rng(13).random(100_000),
+        *[e + s * d for e in ends for s in (-1, 1)],
+    ])
+    yield x[(x >= 0) & (x <= 1)]
+
+
+# Tests for eases.
+def test_eases():
+    """Every ease in `imgeaser.eases` should have a scalar version by
+    the same name.
+    """
+    assert list(scalar.eases) == list(ie.eases)
+    for name, fn in scalar.eases.items():
+        assert fn is getattr(scalar, f'ease_{name}')
+
+
+@pt.mark.parametrize('name', ie.eases)
+def test_ease(name, x):
+    """Given values from zero to one, each scalar ease should return
+    the same result as the array ease.
+    """
+    expected = ie.eases[name](x, assume_normalized=True)
+    result = np.array([scalar.eases[name](t) for t in x.tolist()])
+    if name in scalar.POWER_OF_TWO:
+        assert np.abs(result - expected).max() <= 2 ** -51
+    else:
+        assert (result == expected).all()
+
+
+@pt.mark.parametrize('name', ie.eases)
+def test_ease_array_on_float(name):
+    """Given a single :class:`float`, each array ease should return the
+    same result as the scalar ease.
+    """
+    for t in (0.0, .1, .3, .5, .77, 1.0):
+        expected = scalar.eases[name](t)
+        assert ie.eases[name](t) == pt.approx(expected, rel=0, abs=1e-15)
@@ -0,0 +1,139 @@
+"""
+test_stream
+~~~~~~~~~~~
+
+Unit tests for the imgeaser.stream module.
+"""
+import threading
+
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+from imgeaser.stream import ease_stream
+from imgeaser.utility import will_scale
+
+
+# Fixtures.
+@pt.fixture
+def frames():
+    """A sample list of frames."""
+    rng = np.random.default_rng(5)
+    yield [rng.random((4, 6)) * 10 - 2 for _ in range(5)]
+
+
+# Tests for ease_stream.
+@pt.mark.parametrize('prefetch', (False, True))
+def test_ease_stream(frames, prefetch):
+    """Given frames and an ease, :func:`ease_stream` should yield each
+    frame eased from the range of the first frame.
+    """
+    lo, hi = frames[0].min(), frames[0].max()
+    stream = ease_stream(frames, ie.ease_in_quad, prefetch=prefetch)
+    results = [frame.copy() for frame in stream]
+    assert len(results) == len(frames)
+    for frame, result in zip(frames, results):
+        expected = ie.ease_in_quad(frame, value_range=(lo, hi))
+        assert (result == expected).all()
+
+
+def test_ease_stream_ring(frames):
+    """Given a number of buffers, :func:`ease_stream` should reuse that
+    many arrays for the eased frames.
+    """
+    ids = [id(frame) for frame in ease_stream(frames, 'out_sin', 3)]
+    assert len(set(ids)) == 3
+    assert ids == ids[:3] + ids[:2]
+
+
+def test_ease_stream_shape_change(frames):
+    """Given frames that change shape, :func:`ease_stream` should ease
+    each frame into an array of its shape.
+    """
+    frames[2] = frames[2][:2]
+    shapes = [frame.shape for frame in ease_stream(frames, 'in_sin')]
+    assert shapes == [(4, 6), (4, 6), (2, 6), (4, 6), (4, 6)]
+
+
+@pt.mark.parametrize('prefetch', (False, True))
+def test_ease_stream_shape_change_ring(prefetch):
+    """Given frames that change shape, :func:`ease_stream` should start
+    a new ring, so it never eases into the frame it last yielded.
+    """
+    shapes = [(2, 2), (3, 3), (3, 3), (3, 3), (3, 3)]
+    frames = [np.full(shape, i / 100) for i, shape in enumerate(shapes)]
+    stream = ease_stream(frames, 'in_quad', prefetch=prefetch)
+    results = []
+    for i, frame in enumerate(stream):
+        assert all(frame is not r for r in results[-1:])
+        assert (frame == (i / 100) ** 2).all()
+        results.append(frame)
+    assert results[1] is results[3] and results[2] is results[4]
+    assert results[1] is not results[2]
+
+
+def test_ease_stream_value_range(frames):
+    """Given a range, :func:`ease_stream` should scale every frame from
+    it. Given rescan, it should scale each frame from its own range.
+    """
+    stream = ease_stream(frames, 'in_quad', value_range=(-5, 10))
+    result = next(stream)
+    assert (result == ie.ease_in_quad(frames[0], value_range=(-5, 10))).all()
+
+    stream = ease_stream(frames, 'in_quad', buffers=1, rescan=True)
+    for frame, result in zip(frames, stream):
+        assert (result == ie.ease_in_quad(frame)).all()
+
+
+def test_ease_stream_kwargs(frames):
+    """Given keyword arguments, :func:`ease_stream` should pass them to
+    the ease.
+    """
+    stream = ease_stream(frames, 'in_back', clip=True)
+    for frame, result in zip(frames, stream):
+        assert result.min() >= frames[0].min()
+
+
+def test_ease_stream_lazy():
+    """Given an iterator of frames, :func:`ease_stream` should only read
+    the frames as they are needed, a frame ahead with prefetch.
+    """
+    read = []
+
+    def source():
+        for i in range(10):
+            read.append(i)
+            yield np.arange(6.0) + i
+
+    stream = ease_stream(source(), 'in_quad', prefetch=True)
+    next(stream)
+    next(stream)
+    stream.close()
+    assert read == [0, 1, 2]
+
+
+def test_ease_stream_prefetch_thread(frames):
+    """Given prefetch, :func:`ease_stream` should ease the frames in
+    another thread.
+    """
+    names = []
+
+    @will_scale
+    def spam(a):
+        names.append(threading.current_thread().name)
+        return a
+
+    list(ease_stream(frames, spam, prefetch=True))
+    assert all(name.startswith('imgeaser-stream') for name in names)
+
+
+def test_ease_stream_invalid(frames):
+    """Given an unknown ease or too few buffers, :func:`ease_stream`
+    should raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        ease_stream(frames, 'spam')
+    with pt.raises(ValueError):
+        ease_stream(frames, 'in_quad', buffers=0)
+    with pt.raises(ValueError):
+        ease_stream(frames, 'in_quad', buffers=1, prefetch=True)
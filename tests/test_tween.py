@@ -0,0 +1,164 @@
+"""
+test_tween
+~~~~~~~~~~
+
+Unit tests for the imgeaser.tween module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+from imgeaser import families
+from imgeaser.tween import TweenStore
+
+
+# The start, end, duration and ease of the tweens in the store
+# fixture, by their IDs.
+TWEENS = {
+    0: (0, 100, 1, 'in_quad'),
+    1: (10, 100, 2, 'in_quad'),
+    2: (20, 100, 4, 'in_quad'),
+    3: (5, -5, 2, 'out_bounce'),
+    4: (6, -6, 1, 'out_bounce'),
+    5: (1, 2, 3, 'in_out_sin'),
+}
+
+
+# Fixtures.
+@pt.fixture
+def store():
+    """A store of tweens with several eases that begin at zero and
+    finish at different times.
+    """
+    store = TweenStore(capacity=8)
+    store.add_many([0, 10, 20], 100, 0, [1, 2, 4], 'in_quad')
+    store.add_many([5, 6], [-5, -6], 0, [2, 1], ie.ease_out_bounce)
+    store.add(1, 2, 0, 3, 'in_out_sin')
+    yield store
+
+
+# Utility functions.
+def expected_values(store, now):
+    """Ease each tween in the store separately."""
+    values = []
+    for i in store.ids:
+        start, end, duration, name = TWEENS[i]
+        t = np.array([min(now / duration, 1.0)])
+        eased = ie.eases[name](t, assume_normalized=True)[0]
+        values.append(start + (end - start) * eased)
+    return np.array(values)
+
+
+# Tests for add.
+def test_add(store):
+    """Given the fields of tweens, :meth:`TweenStore.add` and
+    :meth:`TweenStore.add_many` should add them to the store with new
+    IDs.
+    """
+    assert len(store) == 6
+    assert list(store.ids) == [0, 1, 2, 3, 4, 5]
+    assert store.add(0, 1, 0, 1, 'out_quad') == 6
+    assert list(store.add_many(0, [1, 2], 0, 1, 'out_quad')) == [7, 8]
+
+
+def test_add_invalid_duration():
+    """Given a duration that isn't greater than zero,
+    :meth:`TweenStore.add` should raise a :class:`ValueError`.
+    """
+    store = TweenStore()
+    with pt.raises(ValueError):
+        store.add(0, 1, 0, 0, 'in_quad')
+    assert len(store) == 0
+
+
+def test_add_invalid_ease():
+    """Given a name that isn't in `imgeaser.eases`,
+    :meth:`TweenStore.add` should raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        TweenStore().add(0, 1, 0, 1, 'spam')
+
+
+def test_add_grows():
+    """Given more tweens than the store has room for,
+    :meth:`TweenStore.add_many` should grow the store and keep the
+    tweens already in it.
+    """
+    store = TweenStore(capacity=2)
+    store.add(0, 1, 0, 1, 'in_quad')
+    store.add_many(np.arange(5), 10, 0, 1, 'out_quad')
+    assert store.capacity >= 6
+    values = store.tick(.5)
+    assert values[0] == .25
+    assert (values[1:] == np.arange(5) + (10 - np.arange(5)) * .75).all()
+
+
+# Tests for tick.
+@pt.mark.parametrize('now', (0.0, .3, .5, 1.5, 2.5))
+def test_tick(store, now):
+    """Given a time, :meth:`TweenStore.tick` should return the values
+    of the tweens at that time, in the order of their IDs.
+    """
+    values = store.tick(now)
+    assert np.allclose(values, expected_values(store, now), rtol=0, atol=1e-12)
+    assert len(values) == len(store)
+
+
+def test_tick_before_begin():
+    """Given a time before a tween begins, :meth:`TweenStore.tick`
+    should hold it at its start.
+    """
+    store = TweenStore()
+    store.add(3, 9, 10, 1, 'in_out_back')
+    assert store.tick(5)[0] == 3
+
+
+def test_tick_one_ease():
+    """Given tweens that share an ease, :meth:`TweenStore.tick` should
+    ease them all with one call.
+    """
+    store = TweenStore()
+    store.add_many(0, np.arange(1, 6), 0, np.arange(1, 6), families.in_pow(3))
+    values = store.tick(1)
+    expected = np.arange(1, 6) * (1 / np.arange(1, 6)) ** 3
+    assert np.allclose(values, expected, rtol=0, atol=1e-12)
+
+
+# Tests for finishing tweens.
+def test_finished(store):
+    """Tweens that reach their end on a tick should be at their end
+    and marked as done, then removed on the next tick.
+    """
+    values = store.tick(1)
+    assert list(store.done) == [True, False, False, False, True, False]
+    assert values[0] == 100 and values[4] == -6
+
+    store.tick(1.5)
+    assert list(store.ids) == [1, 2, 3, 5]
+    assert np.allclose(store.values, expected_values(store, 1.5), atol=1e-12)
+
+    store.tick(10)
+    store.tick(10)
+    assert len(store) == 0
+    assert len(store.tick(11)) == 0
+
+
+def test_finished_in_place(store):
+    """Removing finished tweens shouldn't reallocate the store."""
+    names = ('_fields', '_values', '_ids', '_codes', '_done')
+    arrays = [getattr(store, name) for name in names]
+    for now in (.5, 1, 1.5, 2, 3, 4, 5):
+        store.tick(now)
+    assert len(store) == 0
+    assert all(getattr(store, n) is a for n, a in zip(names, arrays))
+
+
+def test_cancel(store):
+    """Given IDs, :meth:`TweenStore.cancel` should remove those tweens
+    on the next tick.
+    """
+    store.tick(.5)
+    store.cancel([1, 5])
+    store.tick(.6)
+    assert list(store.ids) == [0, 2, 3, 4]
+    assert np.allclose(store.values, expected_values(store, .6), atol=1e-12)
@@ -0,0 +1,199 @@
+"""
+test_unique
+~~~~~~~~~~~
+
+Unit tests for the imgeaser.unique module.
+"""
+import numpy as np
+import pytest as pt
+
+import imgeaser as ie
+from imgeaser import families, unique
+
+
+# Fixtures.
+@pt.fixture
+def levels():
+    """A function that makes a sample :class:`numpy.ndarray` with a few
+    distinct values, and a few rare values that a sample of it misses.
+    """
+    def make(dtype, size=2 ** 16, distinct=200, rare=50):
+        rng = np.random.default_rng(5)
+        values = (rng.random(distinct) * 600 - 100).astype(dtype)
+        a = values[rng.integers(distinct, size=size)]
+        where = rng.choice(np.arange(1, size, 2), rare, replace=False)
+        a[where] = (rng.random(rare) * 500).astype(dtype)
+        return a.reshape(-1, 256)
+
+    yield make
+
+
+@pt.fixture
+def spy(mocker):
+    """A spy on the easing of data through its distinct values."""
+    yield mocker.spy(unique, 'ease_unique')
+
+
+# Tests for build_hash.
+@pt.mark.parametrize('dtype', ('u2', 'u4', 'u8'))
+@pt.mark.parametrize('count', (1, 2, 100, 4096))
+def test_build_hash(dtype, count):
+    """Given distinct keys, :func:`build_hash` should return a hash
+    that finds the index of each key.
+    """
+    rng = np.random.default_rng(count)
+    info = np.iinfo(dtype)
+    keys = np.unique(rng.integers(info.max, size=count, dtype=dtype))
+    h = unique.build_hash(keys)
+    bucket = keys * h.mult[0] >> h.shift[0]
+    slots = keys * h.mult[1] >> h.shift[1] ^ h.disp[bucket]
+    assert (h.keys[h.table[slots]] == keys).all()
+
+
+# Tests for find_keys.
+def test_find_keys(levels):
+    """Given data, :func:`find_keys` should return the bits of the
+    distinct values in a sample of it, sorted.
+    """
+    a = levels('float32', rare=0)
+    keys = unique.find_keys(a)
+    assert keys.dtype == np.uint32
+    assert (np.diff(keys) > 0).all()
+    assert (np.sort(keys.view(np.float32)) == np.unique(a)).all()
+
+
+def test_find_keys_limit(levels):
+    """Given a limit lower than the number of distinct values in the
+    sample, :func:`find_keys` should return `None`.
+    """
+    assert unique.find_keys(levels('float64', rare=0), limit=100) is None
+
+
+# Tests for ease_unique.
+@pt.mark.parametrize('name', ie.eases)
+@pt.mark.parametrize('dtype', ('float64', 'float32', 'float16', 'int32'))
+def test_ease_unique(name, dtype, levels):
+    """Given data with few distinct values and `unique=True`, an ease
+    should return the same result as easing each value.
+    """
+    a = levels(dtype)
+    fn = ie.eases[name]
+    expected = fn(a, unique=False)
+    result = fn(a, unique=True)
+    assert result.dtype == expected.dtype
+    assert np.array_equal(result, expected, equal_nan=True)
+
+
+def test_ease_unique_misses(levels, mocker):
+    """Given data with values that aren't in the sample, those values
+    should be eased directly.
+    """
+    a = levels('float64')
+    sampled = a.reshape(-1)[::2]
+    mocker.patch.object(unique, 'SAMPLE_SIZE', sampled.size)
+    assert not np.isin(a, sampled).all()
+    result = ie.ease_out_bounce(a, unique=True)
+    assert (result == ie.ease_out_bounce(a, unique=False)).all()
+
+
+def test_ease_unique_out(levels):
+    """Given an array for the result, the result should be written into
+    it.
+    """
+    a = levels('float32')
+    out = np.empty_like(a)
+    assert ie.ease_in_out_elastic(a, out=out, unique=True) is out
+    assert (out == ie.ease_in_out_elastic(a, unique=False)).all()
+
+
+def test_ease_unique_options(levels):
+    """Given other options of the ease, the result should be the same
+    as easing each value with them.
+    """
+    a = levels('float64')
+    kwargs = {'value_range': (-200, 600), 'clip': True}
+    expected = ie.ease_in_out_back(a, unique=False, **kwargs)
+    assert (ie.ease_in_out_back(a, unique=True, **kwargs) == expected).all()
+
+
+def test_ease_unique_workers(levels, spy):
+    """Given more than one worker, the lookup should be split across
+    threads and return the same result.
+    """
+    a = levels('float64', size=2 ** 20)
+    result = ie.ease_out_elastic(a, unique=True, workers=4)
+    assert spy.call_count == 1
+    assert (result == ie.ease_out_elastic(a, unique=False, workers=1)).all()
+
+
+def test_ease_unique_strided(levels, spy):
+    """Given a view that isn't contiguous, the data should be eased
+    without the lookup.
+    """
+    a = levels('float64')[:, ::2]
+    result = ie.ease_in_sin(a, unique=True)
+    assert spy.call_count == 0
+    assert (result == ie.ease_in_sin(a, unique=False)).all()
+
+
+def test_ease_unique_uint8(spy):
+    """Given 8-bit data, the data should be eased through its lookup
+    table instead.
+    """
+    ie.ease_in_sin(np.arange(256, dtype=np.uint8), unique=True)
+    assert spy.call_count == 0
+
+
+# Tests for the heuristic.
+def test_auto(levels, spy, mocker):
+    """Given large data with few distinct values and a costly ease,
+    the data should be eased through its distinct values.
+    """
+    mocker.patch.object(unique, 'MIN_SIZE', 2 ** 16)
+    a = levels('float64', rare=0)
+    ie.ease_out_bounce(a)
+    assert spy.call_count == 1
+
+
+def test_auto_cheap_ease(levels, spy, mocker):
+    """Given an ease that costs less than the lookup, the data should
+    be eased directly.
+    """
+    mocker.patch.object(unique, 'MIN_SIZE', 2 ** 16)
+    ie.ease_in_quad(levels('float64'))
+    ie.ease_in_sin(levels('float32'))
+    ie.ease_out_bounce(levels('float32'), unique=False)
+    families.in_pow(3)(levels('float64'))
+    assert spy.call_count == 0
+
+
+def test_auto_small(levels, spy):
+    """Given data smaller than :data:`MIN_SIZE`, the data should be
+    eased directly.
+    """
+    ie.ease_out_bounce(levels('float64'))
+    assert spy.call_count == 0
+
+
+def test_auto_many_values(spy, mocker):
+    """Given data with many distinct values, the data should be eased
+    directly.
+    """
+    mocker.patch.object(unique, 'MIN_SIZE', 2 ** 16)
+    a = np.random.default_rng(3).random(2 ** 17)
+    ie.ease_out_bounce(a)
+    assert spy.call_count == 0
+
+
+def test_get_key_limit():
+    """Given an ease and data, :func:`get_key_limit` should return more
+    values for larger data and costlier eases, up to :data:`MAX_KEYS`.
+    """
+    small = np.empty(unique.MIN_SIZE, dtype=np.float32)
+    large = np.broadcast_to(0.0, unique.MIN_SIZE * 64)
+    back = unique.get_key_limit(ie.ease_in_out_back, small)
+    elastic = unique.get_key_limit(ie.ease_in_out_elastic, small)
+    assert 0 < back < elastic
+    assert unique.get_key_limit(ie.ease_out_bounce, large) == unique.MAX_KEYS
+    assert unique.get_key_limit(ie.ease_in_quad, large) == 0
+    assert unique.get_key_limit(ie.ease_in_out_back, small[:-1]) == 0
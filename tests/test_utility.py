@@ -4,9 +4,12 @@ test_utility
 
 Unit tests for the imgeaser.utility module.
 """
+import warnings
+
 import numpy as np
 import pytest as pt
 
+import imgeaser as ie
 import imgeaser.utility as u
 
 
@@ -24,6 +27,160 @@ def test_get_prefixed_functions():
     }
 
 
+# Tests for set_backend.
+def test_set_backend(mocker):
+    """When given the name of a backend, :func:`set_backend` should
+    make it the default backend.
+    """
+    mocker.patch.object(u, '_backend', 'numpy')
+    u.set_backend('numba')
+    assert u.get_backend() == 'numba'
+
+
+def test_set_backend_invalid():
+    """When given the name of an unknown backend, :func:`set_backend`
+    should raise a :class:`ValueError`.
+    """
+    with pt.raises(ValueError):
+        u.set_backend('spam')
+
+
+# Tests for minmax.
+def test_minmax():
+    """When given an array, :func:`minmax` should return the minimum
+    and maximum values in the array.
+    """
+    a = np.arange(-5, 5, dtype=float)
+    assert u.minmax(a) == (-5.0, 4.0)
+
+
+def test_minmax_blocks():
+    """When given an array larger than a scan block, :func:`minmax`
+    should return the minimum and maximum values in the array.
+    """
+    a = np.zeros(u.SCAN_BLOCK * 3 + 7, dtype=np.float32)
+    a[u.SCAN_BLOCK + 5] = -2.0
+    a[-1] = 3.0
+    assert u.minmax(a) == (-2.0, 3.0)
+
+
+def test_minmax_strided():
+    """When given a view that isn't contiguous, :func:`minmax` should
+    return the minimum and maximum values in the view.
+    """
+    a = np.zeros((512, 512), dtype=float)
+    a[10, 10] = -1.0
+    a[11, 12] = 5.0
+    a[20, 21] = 7.0
+    assert u.minmax(a[:, ::2]) == (-1.0, 5.0)
+
+
+# Tests for piecewise.
+def test_piecewise():
+    """When given an array and pieces, :func:`piecewise` should run
+    each branch on the values that match its condition and leave the
+    values that match no condition unchanged.
+    """
+    def double(a):
+        a *= 2
+
+    def negate(a):
+        np.negative(a, out=a)
+
+    a = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+    result = u.piecewise(a, [
+        (lambda a: a < .5, double),
+        (lambda a: (a >= .5) & (a < 1), negate),
+    ])
+    assert result is a
+    assert (result == np.array([0.0, 0.5, -0.5, -0.75, 1.0])).all()
+
+
+def test_piecewise_masks_before_branches():
+    """When given an array and pieces, :func:`piecewise` should build
+    every mask before running any branch, so values changed by one
+    branch aren't changed again by a later branch.
+    """
+    def add(a):
+        a += 0.5
+
+    a = np.array([0.0, 0.25, 0.5, 0.75, ])
+    result = u.piecewise(a, [
+        (lambda a: a < .5, add),
+        (lambda a: a >= .5, add),
+    ])
+    assert (result == np.array([0.5, 0.75, 1.0, 1.25])).all()
+
+
+def test_piecewise_skips_empty_pieces():
+    """Given pieces that hold no values, :func:`piecewise` should not
+    run their branches. Given a piece that holds every value, it should
+    run its branch on the data directly.
+    """
+    calls = []
+
+    def branch(name, value):
+        def fn(a):
+            calls.append(name)
+            a[...] = value
+        return fn
+
+    pieces = [
+        (lambda a: a < .5, branch('low', 1.0)),
+        (lambda a: a >= .5, branch('high', 2.0)),
+    ]
+    a = np.array([.6, .7, .8])
+    assert (u.piecewise(a, pieces) == 2.0).all()
+    assert calls == ['high']
+
+    a = np.array([.1, .7, .8])
+    assert (u.piecewise(a, pieces) == np.array([1.0, 2.0, 2.0])).all()
+    assert calls == ['high', 'low', 'high']
+
+
+def test_piecewise_blocks(mocker):
+    """Given contiguous data larger than :data:`PIECE_BLOCK`,
+    :func:`piecewise` should run the branches on copies of one block
+    at a time, reusing the same buffers for every block.
+    """
+    mocker.patch.object(u, 'PIECE_BLOCK', 4)
+    seen = []
+
+    def double(a):
+        seen.append(a.base if a.base is not None else a)
+        a *= 2
+
+    def negate(a):
+        np.negative(a, out=a)
+
+    a = np.array([.1, .6, .3, .9] * 3)[:11].reshape(1, 11)
+    expected = np.where(a < .5, a * 2, -a)
+    result = u.piecewise(a, [
+        (lambda a: a < .5, double),
+        (lambda a: a >= .5, negate),
+    ])
+    assert result is a
+    assert (result == expected).all()
+    assert all(b.size == 4 for b in seen)
+    assert len({id(b) for b in seen}) == 1
+
+
+def test_piecewise_strided():
+    """Given data that isn't contiguous, :func:`piecewise` should
+    evaluate it in one piece.
+    """
+    a = np.linspace(0, 1, 20).reshape(4, 5)
+    view = a[:, ::2]
+    expected = np.where(view < .5, view * 2, -view)
+    result = u.piecewise(view, [
+        (lambda a: a < .5, lambda a: np.multiply(a, 2, out=a)),
+        (lambda a: a >= .5, lambda a: np.negative(a, out=a)),
+    ])
+    assert result is view
+    assert (a[:, ::2] == expected).all()
+    assert (a[:, 1::2] == np.linspace(0, 1, 20).reshape(4, 5)[:, 1::2]).all()
+
+
 # fixtures for will_scale.
 @pt.fixture
 def decorated():
@@ -79,3 +236,252 @@ def test_will_scale_no_scale(decorated):
             [0.1250, 0.2500, 0.3750, ],
         ],
     ], dtype=float)).all()
+
+
+def test_will_scale_does_not_change_input(decorated):
+    """When decorating a function, :func:`will_scale` should not
+    change the array passed to the decorated function.
+    """
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0], dtype=float)
+    a.flags.writeable = False
+    result = decorated(a)
+    assert (a == np.array([2.0, 2.5, 3.0, 3.5, 4.0])).all()
+    assert (result == np.array([2.00, 2.25, 2.50, 2.75, 3.00])).all()
+
+
+def test_will_scale_out(decorated):
+    """When decorating a function, :func:`will_scale` should write the
+    result into the array passed as `out` and return it.
+    """
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0], dtype=float)
+    out = np.zeros_like(a)
+    result = decorated(a, out=out)
+    assert result is out
+    assert (out == np.array([2.00, 2.25, 2.50, 2.75, 3.00])).all()
+    assert (a == np.array([2.0, 2.5, 3.0, 3.5, 4.0])).all()
+
+
+def test_will_scale_out_in_place(decorated):
+    """When decorating a function, :func:`will_scale` should allow the
+    input array to be passed as `out` to ease the data in place.
+    """
+    a = np.array([0.25, 0.50, 0.75, ], dtype=float)
+    result = decorated(a, out=a)
+    assert result is a
+    assert (a == np.array([0.125, 0.250, 0.375])).all()
+
+
+def test_will_scale_value_range(decorated):
+    """When decorating a function, :func:`will_scale` should scale the
+    data from the range given by `value_range` rather than the range
+    of the data.
+    """
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0], dtype=float)
+    result = decorated(a, value_range=(0.0, 4.0))
+    assert (result == np.array([1.00, 1.25, 1.50, 1.75, 2.00])).all()
+
+
+def test_will_scale_assume_normalized():
+    """When decorating a function, :func:`will_scale` should not scan
+    or scale the data if `assume_normalized` is true.
+    """
+    @u.will_scale
+    def spam(a):
+        return a + 1
+
+    a = np.array([2.0, 2.5, 3.0, ], dtype=float)
+    result = spam(a, assume_normalized=True)
+    assert (result == np.array([3.0, 3.5, 4.0])).all()
+
+
+def test_will_scale_keeps_float_type():
+    """When decorating a function, :func:`will_scale` should perform
+    the function in the type of float data and return it in that type.
+    """
+    seen = []
+
+    @u.will_scale
+    def spam(a):
+        seen.append(a.dtype)
+        return a * 0.5
+
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0], dtype=np.float32)
+    result = spam(a, value_range=(np.float64(0), 4.0))
+    assert seen == [np.float32]
+    assert result.dtype == np.float32
+
+
+def test_will_scale_compute_dtype(mocker):
+    """When decorating a function, :func:`will_scale` should perform
+    the function in `compute_dtype` in blocks and return the result in
+    the type of the data.
+    """
+    mocker.patch.object(u, 'COMPUTE_BLOCK', 2)
+    seen = []
+
+    @u.will_scale
+    def spam(a):
+        seen.append((a.dtype, a.size))
+        return a * 0.5
+
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0], dtype=np.float16)
+    result = spam(a, compute_dtype=np.float32)
+    assert seen == [(np.float32, 2), (np.float32, 2), (np.float32, 1)]
+    assert result.dtype == np.float16
+    assert (result == np.array([2.00, 2.25, 2.50, 2.75, 3.00])).all()
+
+
+def test_will_scale_compute_dtype_integer():
+    """When decorating a function, :func:`will_scale` should ease wide
+    integer data in `compute_dtype`.
+    """
+    seen = []
+
+    @u.will_scale
+    def spam(a):
+        seen.append(a.dtype)
+        return a * 0.5
+
+    a = np.array([2, 4, 6], dtype=np.int64)
+    result = spam(a, compute_dtype=np.float32)
+    assert seen == [np.float32]
+    assert result.dtype == np.int64
+    assert (result == np.array([2, 3, 4])).all()
+
+
+@pt.mark.parametrize('dtype,span', (
+    (np.int8, 100),
+    (np.int16, 30000),
+    (np.int32, 2 * 10 ** 9),
+    (np.int64, 9 * 10 ** 18),
+))
+def test_will_scale_integer_wide_range(dtype, span):
+    """When decorating a function, :func:`will_scale` should ease
+    integer data whose range doesn't fit in its own type without
+    overflowing or warning.
+    """
+    a = np.array([-span, 0, span], dtype=dtype)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = ie.ease_in_quad(a)
+    expected = np.array([-span, -span / 2, span])
+    assert result.dtype == dtype
+    assert np.allclose(result, expected, rtol=1e-12, atol=1)
+
+
+def test_will_scale_compute_dtype_invalid(decorated):
+    """When decorating a function, :func:`will_scale` should raise a
+    :class:`ValueError` if `compute_dtype` isn't a float type.
+    """
+    with pt.raises(ValueError):
+        decorated(np.zeros(3), compute_dtype=np.int32)
+
+
+def test_will_scale_clip():
+    """When decorating a function, :func:`will_scale` should clamp the
+    eased values to the range of the data if `clip` is true.
+    """
+    @u.will_scale
+    def spam(a):
+        return a * 3 - 1
+
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0], dtype=float)
+    assert (spam(a) == np.array([0.0, 1.5, 3.0, 4.5, 6.0])).all()
+    result = spam(a, clip=True)
+    assert (result == np.array([2.0, 2.0, 3.0, 4.0, 4.0])).all()
+
+
+def test_will_scale_clip_range_preserving(mocker):
+    """When decorating an ease that never leaves the range of the data,
+    :func:`will_scale` should skip the clamp.
+    """
+    clip = mocker.spy(u.np, 'clip')
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0], dtype=float)
+    expected = ie.ease_in_quad(a)
+    result = ie.ease_in_quad(a, clip=True)
+    assert (result == expected).all()
+    clip.assert_not_called()
+
+
+@pt.mark.parametrize('dtype', (np.float32, np.uint8, np.int64))
+def test_will_scale_clip_types(dtype):
+    """When decorating an ease that overshoots, :func:`will_scale`
+    should clamp the result for every type of data.
+    """
+    a = np.arange(0, 200, 10, dtype=dtype)
+    result = ie.ease_in_out_back(a, clip=True)
+    assert result.dtype == dtype
+    assert result.min() == 0
+    assert result.max() == 190
+
+
+def test_will_scale_roi(decorated):
+    """When decorating a function, :func:`will_scale` should ease only
+    the region selected by `roi`, scaled from the range of the whole
+    array, and copy the rest of the data.
+    """
+    a = np.array([
+        [2.0, 2.5, 3.0],
+        [3.5, 4.0, 3.0],
+    ])
+    result = decorated(a, roi=np.s_[:, 1:])
+    assert (result == np.array([
+        [2.0, 2.25, 2.5],
+        [3.5, 3.00, 2.5],
+    ])).all()
+
+
+def test_will_scale_roi_axis(decorated):
+    """When decorating a function, :func:`will_scale` should ease only
+    the indices given by `roi` along `axis`.
+    """
+    a = np.array([
+        [[2.0, 3.0, 4.0], [4.0, 3.0, 2.0]],
+    ])
+    result = decorated(a, roi=[0, 2], axis=-1)
+    assert (result == np.array([
+        [[2.0, 3.0, 3.0], [3.0, 3.0, 2.0]],
+    ])).all()
+
+
+def test_will_scale_roi_in_place(decorated):
+    """When decorating a function, :func:`will_scale` should ease the
+    region selected by `roi` in place when the data is passed as `out`.
+    """
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0])
+    result = decorated(a, out=a, roi=np.s_[3:])
+    assert result is a
+    assert (a == np.array([2.0, 2.5, 3.0, 2.75, 3.0])).all()
+
+
+def test_will_scale_where(decorated):
+    """When decorating a function, :func:`will_scale` should ease only
+    the values selected by `where`, leaving the rest of `out` as it
+    was.
+    """
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0])
+    out = np.zeros_like(a)
+    result = decorated(a, out=out, where=a > 3)
+    assert result is out
+    assert (out == np.array([0.0, 0.0, 0.0, 2.75, 3.0])).all()
+
+
+def test_will_scale_where_value_range(decorated):
+    """When decorating a function, :func:`will_scale` should scale the
+    values selected by `where` from `value_range` if it's given.
+    """
+    a = np.array([2.0, 2.5, 3.0, 3.5, 4.0])
+    result = decorated(a, where=a > 3, value_range=(3.5, 4.0))
+    assert (result == np.array([2.0, 2.5, 3.0, 3.5, 3.75])).all()
+
+
+def test_will_scale_axis_invalid(decorated):
+    """When decorating a function, :func:`will_scale` should raise a
+    :class:`ValueError` if `axis` is given without `roi` or is out of
+    bounds.
+    """
+    a = np.zeros((2, 3))
+    with pt.raises(ValueError):
+        decorated(a, axis=1)
+    with pt.raises(ValueError):
+        decorated(a, roi=0, axis=2)